@@ -1,13 +1,47 @@
+from importlib import import_module
+
 from .vector import Vector
 from .point import Point
 from .plane import Plane
 from .line import Line
-from .plot import Plot
+from .matrix import Matrix
+
+# classes that need numpy or matplotlib are imported on first access
+LAZY_CLASSES = {
+    'Plot': '.plot',
+    'VectorArray': '.array',
+    'VectorN': '.vectorn',
+    'PointIndex': '.index',
+    'Transform': '.transform',
+    'Mesh': '.mesh',
+    'ConvexHull': '.mesh',
+}
 
+# pylint: disable=undefined-all-variable
 __all__ = [
     'Vector',
     'Plane',
     'Point',
     'Line',
-    'Plot'
+    'Matrix',
+    'Plot',
+    'VectorArray',
+    'VectorN',
+    'PointIndex',
+    'Transform',
+    'Mesh',
+    'ConvexHull'
 ]
+# pylint: enable=undefined-all-variable
+
+
+def __getattr__(name: str):
+    if name not in LAZY_CLASSES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(LAZY_CLASSES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
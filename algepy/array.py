@@ -0,0 +1,359 @@
+import numpy as np
+
+from .vector import Vector
+
+
+def as_coordinates(points) -> np.ndarray:
+    """
+        Get the coordinates of a batch of points or vectors as a N×3 array.
+
+        Params:
+            points: VectorArray, N×3 array-like, or list of Point or Vector instances.
+
+        Returns:
+            A N×3 float array, a view of the input when possible.
+
+        Raises:
+            ValueError if the coordinates are not a N×3 array.
+    """
+    if isinstance(points, VectorArray):
+        return points.data
+    if isinstance(points, (list, tuple)) and points and hasattr(points[0], 'axes'):
+        points = [(point.x, point.y, point.z) for point in points]
+    data = np.asarray(points, dtype=float)
+    if data.ndim == 1 and data.shape[0] == 3:
+        data = data[None, :]
+    if data.ndim != 2 or data.shape[1] != 3:
+        raise ValueError('Coordinates must be a N×3 array')
+    return data
+
+
+def as_coefficients(planes) -> np.ndarray:
+    """
+        Get the a, b, c and d coefficients of a batch of planes as a N×4 array.
+
+        Params:
+            planes: N×4 array-like or list of Plane instances.
+
+        Returns:
+            A N×4 float array.
+
+        Raises:
+            ValueError if the coefficients are not a N×4 array.
+    """
+    if isinstance(planes, (list, tuple)) and planes and hasattr(planes[0], 'normal'):
+        planes = [(plane.a, plane.b, plane.c, plane.d) for plane in planes]
+    data = np.asarray(planes, dtype=float)
+    if data.ndim != 2 or data.shape[1] != 4:
+        raise ValueError('Coefficients must be a N×4 array')
+    return data
+
+
+def as_lines(**kwargs) -> tuple:
+    """
+        Get the points and direction vectors of a batch of lines.
+
+        Params:
+            lines (list): list of Line instances.
+            points: N×3 points on the lines, used when no lines are given.
+            vectors: N×3 direction vectors of the lines, used when no lines are given.
+
+        Returns:
+            A tuple with two N×3 float arrays: points and direction vectors.
+
+        Raises:
+            ValueError if no lines given or the sizes are not equal.
+    """
+    lines = kwargs.get('lines', None)
+    if lines is not None:
+        points = [line.point for line in lines]
+        vectors = [line.vector for line in lines]
+    else:
+        points, vectors = kwargs.get('points', None), kwargs.get('vectors', None)
+        if points is None or vectors is None:
+            raise ValueError('No lines given')
+    points, vectors = as_coordinates(points), as_coordinates(vectors)
+    if points.shape != vectors.shape:
+        raise ValueError('Sizes must be equal')
+    return points, vectors
+
+
+class VectorArray:
+    """
+        Batch of 3d vectors stored as a N×3 numpy array.
+        Every operation is applied to the whole batch at once.
+        Supported operators:
+            +: add two batches or a batch and a vector
+            -: subtract two batches or a batch and a vector
+            *: scalar multiplication or dot product
+            /: scalar division
+    """
+
+    def __init__(self, data=None):
+        """
+            Initialize a vector array.
+
+            Params:
+                data: N×3 array-like with the x, y and z coordinates.
+
+            Returns:
+                A vector array class instance.
+
+            Raises:
+                ValueError if data is not a N×3 array.
+        """
+        if data is None:
+            data = np.empty((0, 3))
+        data = np.asarray(data, dtype=float)
+        if data.ndim != 2 or data.shape[1] != 3:
+            raise ValueError('Data must be a N×3 array')
+        self.data = data
+
+    @classmethod
+    def from_vectors(cls, vectors: list) -> 'VectorArray':
+        """
+            Create a vector array from a list of vectors.
+
+            Params:
+                vectors (list): list of Vector instances.
+
+            Returns:
+                A vector array class instance.
+
+            Raises:
+                TypeError if an item is not a Vector.
+        """
+        data = np.empty((len(vectors), 3))
+        for i, vector in enumerate(vectors):
+            if not isinstance(vector, Vector):
+                raise TypeError('items must be Vector')
+            data[i] = (vector.get('x'), vector.get('y'), vector.get('z'))
+        return cls(data)
+
+    def to_vectors(self) -> list:
+        """
+            Convert the vector array to a list of vectors.
+
+            Params:
+                None
+
+            Returns:
+                A list of Vector instances.
+
+            Raises:
+                None
+        """
+        return [Vector.from_xyz(x, y, z) for x, y, z in self.data.tolist()]
+
+    @property
+    def x(self) -> np.ndarray:
+        """x coordinates of the batch."""
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """y coordinates of the batch."""
+        return self.data[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        """z coordinates of the batch."""
+        return self.data[:, 2]
+
+    def magnitude(self) -> np.ndarray:
+        """
+            Calculate the magnitude of every vector.
+
+            Params:
+                None
+
+            Returns:
+                Magnitudes of the vectors as an array of floats.
+
+            Raises:
+                None
+        """
+        return np.sqrt(np.einsum('ij,ij->i', self.data, self.data))
+
+    def isnull(self) -> np.ndarray:
+        """
+            Check which vectors are null.
+
+            Params:
+                None
+
+            Returns:
+                An array of booleans, True where the vector is null.
+
+            Raises:
+                None
+        """
+        return ~self.data.any(axis=1)
+
+    def angle(self, other, degrees: bool = False, decimals: int = 2) -> np.ndarray:
+        """
+            Calculate the angle between the vectors.
+
+            Params:
+                other (VectorArray or Vector): other vectors to calculate the angle.
+                degrees (bool): if True, return the result in degrees.
+                decimals (int): number of decimals to round the result.
+
+            Returns:
+                Angles between the vectors as radians or degrees.
+
+            Raises:
+                ValueError if any vector is null or the sizes are not equal.
+        """
+        other = self._coerce(other)
+        if self.isnull().any() or other.isnull().any():
+            raise ValueError('Cannot calculate angle with null vector')
+        cosine = (self * other) / (self.magnitude() * other.magnitude())
+        radians = np.arccos(np.clip(cosine, -1, 1))
+        return np.degrees(radians).round(decimals) if degrees else radians
+
+    def projection(self, other) -> ['self->other', 'other->self']:
+        """
+            Calculate the projection of the vectors on the other vectors.
+
+            Params:
+                other (VectorArray or Vector): other vectors to calculate the projection.
+
+            Returns:
+                A tuple with the projection:
+                    - self->other: projection of the vectors on the other vectors.
+                    - other->self: projection of the other vectors on the vectors.
+
+            Raises:
+                ValueError if any vector is null or the sizes are not equal.
+        """
+        other = self._coerce(other)
+        if self.isnull().any() or other.isnull().any():
+            raise ValueError('Cannot calculate proyection with null vector')
+        scale = (self * other) / np.einsum('ij,ij->i', other.data, other.data)
+        projection = VectorArray(other.data * scale[:, None])
+        return projection, self - projection
+
+    def cross(self, other) -> 'VectorArray':
+        """
+            Calculate the cross product with the other vectors.
+
+            Params:
+                other (VectorArray or Vector): other vectors to calculate the cross product.
+
+            Returns:
+                A vector array with the cross products.
+
+            Raises:
+                ValueError if any vector is null or the sizes are not equal.
+        """
+        other = self._coerce(other)
+        if self.isnull().any() or other.isnull().any():
+            raise ValueError('Cannot calculate cross product with null vector')
+        return VectorArray(np.cross(self.data, other.data))
+
+    def triple(self, other, third) -> np.ndarray:
+        """
+            Calculate the triple product of the vectors.
+
+            Params:
+                other (VectorArray or Vector): other vectors to calculate the triple product.
+                third (VectorArray or Vector): third vectors to calculate the triple product.
+
+            Returns:
+                Triple products of the vectors as an array of floats.
+
+            Raises:
+                ValueError if any vector is null or the sizes are not equal.
+        """
+        other, third = self._coerce(other), self._coerce(third)
+        if self.isnull().any():
+            raise ValueError(
+                'Cannot calculate triple product with null vector')
+        return self * other.cross(third)
+
+    def _coerce(self, other) -> 'VectorArray':
+        """
+            Convert the other operand to a vector array matching this batch.
+
+            Params:
+                other (VectorArray or Vector): operand to convert.
+
+            Returns:
+                A vector array.
+
+            Raises:
+                TypeError if other is not a VectorArray or a Vector.
+                ValueError if the sizes are not equal.
+        """
+        if isinstance(other, Vector):
+            coords = (other.get('x'), other.get('y'), other.get('z'))
+            return VectorArray(np.broadcast_to(np.array(coords, dtype=float), self.data.shape))
+        if not isinstance(other, VectorArray):
+            raise TypeError('other must be a VectorArray or a Vector')
+        if len(other) != len(self):
+            raise ValueError('Sizes must be equal')
+        return other
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index):
+        """
+            Get a vector or a slice of the batch.
+
+            Params:
+                index: integer, slice or mask.
+
+            Returns:
+                A Vector for integer indexes, a VectorArray otherwise.
+
+            Raises:
+                IndexError if the index is out of range.
+        """
+        if isinstance(index, (int, np.integer)):
+            x, y, z = self.data[index].tolist()
+            return Vector.from_xyz(x, y, z)
+        return VectorArray(self.data[index])
+
+    def __iter__(self):
+        return iter(self.to_vectors())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+        return np.array_equal(self.data, other.data)
+
+    def __str__(self) -> str:
+        return str(self.data)
+
+    def __repr__(self) -> str:
+        return f'VectorArray({len(self)} vectors)'
+
+    def __add__(self, other) -> 'VectorArray':
+        return VectorArray(self.data + self._coerce(other).data)
+
+    def __sub__(self, other) -> 'VectorArray':
+        return VectorArray(self.data - self._coerce(other).data)
+
+    def __mul__(self, other):
+        """
+            Multiply the vectors by a scalar or other vectors.
+
+            Params:
+                other: scalar, array of scalars or vectors to multiply.
+
+            Returns:
+                A vector array for scalars, an array with the dot products for vectors.
+
+            Raises:
+                ValueError if the sizes are not equal.
+        """
+        if isinstance(other, (Vector, VectorArray)):
+            return np.einsum('ij,ij->i', self.data, self._coerce(other).data)
+        other = np.asarray(other, dtype=float)
+        return VectorArray(self.data * (other[:, None] if other.ndim else other))
+
+    def __truediv__(self, scalar) -> 'VectorArray':
+        scalar = np.asarray(scalar, dtype=float)
+        return VectorArray(self.data / (scalar[:, None] if scalar.ndim else scalar))
@@ -0,0 +1,150 @@
+import math
+from contextlib import contextmanager
+from fractions import Fraction
+from operator import truediv
+
+
+class Backend:  # pylint: disable=too-few-public-methods
+    """
+        Numeric backend used by Vector, Point and Plane.
+        It decides how coordinates are stored, how they are divided and how
+        square roots are taken.
+    """
+
+    def __init__(self, name: str, convert, divide, sqrt, exact: bool = False):
+        """
+            Initialize a backend.
+
+            Params:
+                name (str): name of the backend.
+                convert: function converting a coordinate to the backend type,
+                    None keeps the values as given.
+                divide: function dividing two values.
+                sqrt: function taking the square root of a value.
+                exact (bool): whether the backend computes without rounding errors.
+
+            Returns:
+                A backend class instance.
+
+            Raises:
+                None
+        """
+        self.name = name
+        self.convert = convert
+        self.divide = divide
+        self.sqrt = sqrt
+        self.exact = exact
+
+    def __repr__(self) -> str:
+        return f'Backend({self.name!r})'
+
+
+def to_fraction(value) -> Fraction:
+    """
+        Convert a value to a fraction. Strings keep their decimal value,
+        so Fraction('0.1') is exactly 1/10.
+    """
+    return value if isinstance(value, Fraction) else Fraction(value)
+
+
+def to_integer(value):
+    """
+        Check that a value is an integer, fractions from inexact divisions are kept.
+    """
+    if isinstance(value, (int, Fraction)):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise ValueError(f'Integer backend only accepts integers, got {value!r}')
+
+
+def exact_divide(a, b):
+    """
+        Divide two integers or fractions without rounding.
+    """
+    if isinstance(a, int) and isinstance(b, int):
+        return a // b if a % b == 0 else Fraction(a, b)
+    return to_fraction(a) / to_fraction(b)
+
+
+def exact_sqrt(value):
+    """
+        Square root of an integer or fraction, exact when the value is a perfect square.
+    """
+    value = Fraction(value)
+    numerator, denominator = math.isqrt(value.numerator), math.isqrt(value.denominator)
+    if numerator ** 2 == value.numerator and denominator ** 2 == value.denominator:
+        root = Fraction(numerator, denominator)
+        return root.numerator if root.denominator == 1 else root
+    return math.sqrt(value)
+
+
+BACKENDS = {
+    'native': Backend('native', None, truediv, math.sqrt),
+    'float': Backend('float', float, truediv, math.sqrt),
+    'fraction': Backend('fraction', to_fraction, exact_divide, exact_sqrt, exact=True),
+    'integer': Backend('integer', to_integer, exact_divide, exact_sqrt, exact=True),
+}
+current = BACKENDS['native']
+
+
+def get_backend() -> Backend:
+    """
+        Get the backend in use.
+
+        Params:
+            None
+
+        Returns:
+            The current backend.
+
+        Raises:
+            None
+    """
+    return current
+
+
+def set_backend(name: str) -> Backend:
+    """
+        Choose the backend for the geometry created from now on.
+            native: keeps the values as given, ints stay ints. Default
+            float: converts every coordinate to float.
+            fraction: converts every coordinate to fractions.Fraction, exact.
+            integer: integer coordinates only, divisions that are not exact
+                give fractions.
+
+        Params:
+            name (str): name of the backend.
+
+        Returns:
+            The previous backend.
+
+        Raises:
+            ValueError if the backend is unknown.
+    """
+    global current  # pylint: disable=global-statement
+    if name not in BACKENDS:
+        raise ValueError(f'Backend must be one of {tuple(BACKENDS)}')
+    previous, current = current, BACKENDS[name]
+    return previous
+
+
+@contextmanager
+def use_backend(name: str):
+    """
+        Use a backend inside a with block, restoring the previous one after it.
+
+        Params:
+            name (str): name of the backend.
+
+        Returns:
+            A context manager yielding the backend.
+
+        Raises:
+            ValueError if the backend is unknown.
+    """
+    previous = set_backend(name)
+    try:
+        yield current
+    finally:
+        set_backend(previous.name)
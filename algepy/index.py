@@ -0,0 +1,831 @@
+import numpy as np
+
+from .array import as_coordinates
+
+# the keys of every cell of a grid must fit in a signed 64 bits integer
+MAX_CELLS = 2 ** 62
+# bulk queries are grouped by blocks of cells holding about this many queries,
+# blocks are at most MAX_GROUP_WIDTH cells wide, or a single cell for sparse queries
+GROUP_QUERIES = 16
+MAX_GROUP_WIDTH = 8
+# query to point distances computed at once by bulk queries
+DISTANCE_BLOCK = 2 ** 20
+# states of the candidates of unique_points, and the rounds settling them at once
+UNDECIDED, KEPT, DROPPED = 0, 1, 2
+GREEDY_ROUNDS = 8
+
+
+def as_position(point) -> np.ndarray:
+    """
+        Get the coordinates of a single point as an array.
+
+        Params:
+            point: Point, Vector or sequence with x, y and z.
+
+        Returns:
+            A float array with 3 coordinates.
+
+        Raises:
+            ValueError if the point does not have 3 coordinates.
+    """
+    if hasattr(point, 'axes'):
+        return np.array([point.x, point.y, point.z], dtype=float)
+    position = np.asarray(point, dtype=float)
+    if position.shape != (3,):
+        raise ValueError('Point must have 3 coordinates')
+    return position
+
+
+def cell_keys(cells: np.ndarray, shape: np.ndarray) -> np.ndarray:
+    """
+        Flatten N×3 integer cell coordinates into one integer key per cell.
+
+        Params:
+            cells (ndarray): N×3 integer cell coordinates, between 0 and shape - 1.
+            shape (ndarray): number of cells on each axis.
+
+        Returns:
+            An array with a int64 key for every cell.
+
+        Raises:
+            ValueError if the grid has too many cells to be keyed.
+    """
+    if np.prod(shape.astype(float)) >= MAX_CELLS:
+        raise ValueError('Grid has too many cells, use a bigger cell size')
+    return (cells[:, 0] * shape[1] + cells[:, 1]) * shape[2] + cells[:, 2]
+
+
+def key_cells(keys: np.ndarray, shape: np.ndarray) -> np.ndarray:
+    """
+        Unflatten integer keys back into N×3 integer cell coordinates.
+
+        Params:
+            keys (ndarray): keys returned by cell_keys.
+            shape (ndarray): number of cells on each axis.
+
+        Returns:
+            A N×3 int64 array with the coordinates of every cell.
+
+        Raises:
+            None
+    """
+    return np.column_stack([keys // (shape[1] * shape[2]), keys // shape[2] % shape[1],
+                            keys % shape[2]])
+
+
+def gather(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+        Concatenate the integer ranges [start, end) into a single array.
+
+        Params:
+            starts (ndarray): first value of every range.
+            ends (ndarray): end, excluded, of every range.
+
+        Returns:
+            A int64 array with all the values of the ranges.
+
+        Raises:
+            None
+    """
+    lengths = ends - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total)
+
+
+class PointIndex:  # pylint: disable=too-many-instance-attributes
+    """
+        Uniform grid over a batch of points for nearest neighbour and radius queries.
+        Points are sorted by cell, so each query only measures the points of the
+        cells around it instead of the whole batch.
+    """
+
+    def __init__(self, points, cell_size: float = None, leaf_size: int = 8):
+        """
+            Build the index.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+                cell_size (float): size of the cells. Default is chosen to hold
+                    about leaf_size points per cell.
+                leaf_size (int): average number of points per cell. Default is 8
+
+            Returns:
+                A point index class instance.
+
+            Raises:
+                ValueError if there are no points or cell_size is not positive.
+        """
+        coordinates = as_coordinates(points)
+        if coordinates.shape[0] == 0:
+            raise ValueError('No points given')
+        self.lower = coordinates.min(axis=0)
+        extent = coordinates.max(axis=0) - self.lower
+        if cell_size is None:
+            cell_size = self._cell_size(extent, coordinates.shape[0], leaf_size)
+        if cell_size <= 0:
+            raise ValueError('cell_size must be positive')
+        self.cell_size = float(cell_size)
+        self.shape = np.floor(extent / self.cell_size).astype(np.int64) + 1
+        keys = cell_keys(self._cells(coordinates), self.shape)
+        self.order = np.argsort(keys, kind='stable')
+        self.points = coordinates[self.order]
+        self.keys, self.starts, counts = np.unique(
+            keys[self.order], return_index=True, return_counts=True)
+        self.ends = self.starts + counts
+
+    @staticmethod
+    def _cell_size(extent: np.ndarray, count: int, leaf_size: int) -> float:
+        """
+            Choose a cell size that holds about leaf_size points per cell.
+        """
+        spread = extent[extent > 0]
+        if spread.size == 0:
+            return 1.0
+        cells = max(count / leaf_size, 1)
+        return float((np.prod(spread) / cells) ** (1 / spread.size))
+
+    def _cells(self, coordinates: np.ndarray) -> np.ndarray:
+        """
+            Get the cell coordinates of points, clipped to the grid.
+        """
+        cells = np.floor((coordinates - self.lower) / self.cell_size).astype(np.int64)
+        return np.clip(cells, 0, self.shape - 1)
+
+    def _candidates(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """
+            Get the positions, in the sorted points, of the points in a box of cells.
+        """
+        lower = np.maximum(lower, 0)
+        upper = np.minimum(upper, self.shape - 1)
+        if (lower > upper).any():
+            return np.empty(0, dtype=np.int64)
+        if np.prod((upper - lower + 1).astype(float)) > self.keys.shape[0]:
+            # fewer occupied cells than in the box, test them instead of listing the box
+            cells = key_cells(self.keys, self.shape)
+            found = np.flatnonzero(((cells >= lower) & (cells <= upper)).all(axis=1))
+            return gather(self.starts[found], self.ends[found])
+        axes = [np.arange(lower[i], upper[i] + 1) for i in range(3)]
+        cells = np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, 3)
+        keys = cell_keys(cells, self.shape)
+        found = np.searchsorted(self.keys, keys)
+        valid = found < self.keys.shape[0]
+        found, keys = found[valid], keys[valid]
+        found = found[self.keys[found] == keys]
+        return gather(self.starts[found], self.ends[found])
+
+    def __len__(self) -> int:
+        return self.points.shape[0]
+
+    def within(self, point, radius: float) -> np.ndarray:
+        """
+            Find the points within a distance of a point.
+
+            Params:
+                point: Point, Vector or sequence with x, y and z.
+                radius (float): maximum distance.
+
+            Returns:
+                An array with the indexes of the points, sorted by distance.
+
+            Raises:
+                ValueError if radius is negative.
+        """
+        if radius < 0:
+            raise ValueError('radius must not be negative')
+        position = as_position(point)
+        lower = np.floor((position - radius - self.lower) / self.cell_size).astype(np.int64)
+        upper = np.floor((position + radius - self.lower) / self.cell_size).astype(np.int64)
+        candidates = self._candidates(lower, upper)
+        distances = np.linalg.norm(self.points[candidates] - position, axis=1)
+        inside = distances <= radius
+        candidates, distances = candidates[inside], distances[inside]
+        return self.order[candidates[np.argsort(distances, kind='stable')]]
+
+    def nearest(self, point, k: int = 1) -> tuple:
+        """
+            Find the k nearest points to a point.
+
+            Params:
+                point: Point, Vector or sequence with x, y and z.
+                k (int): number of neighbours. Default is 1
+
+            Returns:
+                A tuple with two arrays of length k, or the number of points when
+                it is lower: the distances and the indexes of the neighbours,
+                sorted by distance.
+
+            Raises:
+                ValueError if k is not positive.
+        """
+        if k <= 0:
+            raise ValueError('k must be positive')
+        k = min(k, len(self))
+        position = as_position(point)
+        center = np.floor((position - self.lower) / self.cell_size).astype(np.int64)
+        ring = 0
+        while True:
+            lower, upper = center - ring, center + ring
+            candidates = self._candidates(lower, upper)
+            covered = (lower <= 0).all() and (upper >= self.shape - 1).all()
+            if candidates.shape[0] >= k:
+                distances = np.linalg.norm(self.points[candidates] - position, axis=1)
+                closest = np.argpartition(distances, k - 1)[:k]
+                closest = closest[np.argsort(distances[closest], kind='stable')]
+                # points outside the box are at least this far from the point
+                box_lower = self.lower + lower * self.cell_size
+                box_upper = self.lower + (upper + 1) * self.cell_size
+                reach = min((position - box_lower).min(), (box_upper - position).min())
+                if covered or distances[closest[-1]] <= reach:
+                    return distances[closest], self.order[candidates[closest]]
+            ring = max(1, ring * 2)
+
+    def _groups(self, queries: np.ndarray):
+        """
+            Split queries into groups falling in the same block of cells.
+
+            Params:
+                queries (ndarray): N×3 coordinates of the queries.
+
+            Returns:
+                A generator of the first and last cell of every block, and the
+                indexes of the queries in it.
+
+            Raises:
+                None
+        """
+        cells = np.floor((queries - self.lower) / self.cell_size).astype(np.int64)
+        # blocks sized to hold GROUP_QUERIES queries if they were spread over the grid,
+        # queries too sparse to share a small block are only grouped by cell
+        spread = float(np.prod(self.shape.astype(float))) * GROUP_QUERIES / queries.shape[0]
+        width = max(1, round(spread ** (1 / 3)))
+        if width > MAX_GROUP_WIDTH:
+            width = 1
+        blocks, inverse = np.unique(cells // width, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(blocks.shape[0] + 1))
+        for i, block in enumerate(blocks):
+            yield block * width, block * width + width - 1, order[bounds[i]:bounds[i + 1]]
+
+    def _distances(self, queries: np.ndarray, candidates: np.ndarray):
+        """
+            Measure queries against candidates in slices that fit DISTANCE_BLOCK.
+
+            Params:
+                queries (ndarray): M×3 coordinates of the queries.
+                candidates (ndarray): positions of the candidates in the sorted points.
+
+            Returns:
+                A generator of the slice of every block of queries, and its
+                distances to the candidates.
+
+            Raises:
+                None
+        """
+        step = max(1, DISTANCE_BLOCK // max(candidates.shape[0], 1))
+        # one axis at a time, norm over a last axis of 3 is several times slower
+        # and adds up x, y and z in the same order
+        points = self.points[candidates].T
+        for start in range(0, queries.shape[0], step):
+            rows = slice(start, min(start + step, queries.shape[0]))
+            squared = np.zeros((rows.stop - start, points.shape[1]))
+            for axis in range(3):
+                offsets = queries[rows, axis, None] - points[axis]
+                squared += offsets * offsets
+            yield rows, np.sqrt(squared, out=squared)
+
+    def within_many(self, points, radius: float) -> list:
+        """
+            Find the points within a distance of many points.
+            Queries are grouped by blocks of cells, the points around each block
+            are gathered once and measured against all its queries at once.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+                radius (float): maximum distance.
+
+            Returns:
+                A list with an array of indexes, sorted by distance, for every point.
+
+            Raises:
+                ValueError if radius is negative.
+        """
+        if radius < 0:
+            raise ValueError('radius must not be negative')
+        queries = as_coordinates(points)
+        if queries.shape[0] == 0:
+            return []
+        found = [np.empty(0, dtype=np.int64)] * queries.shape[0]
+        reach = int(np.ceil(radius / self.cell_size))
+        for first, last, members in self._groups(queries):
+            if members.shape[0] == 1:
+                found[members[0]] = self.within(queries[members[0]], radius)
+                continue
+            candidates = self._candidates(first - reach, last + reach)
+            for rows, distances in self._distances(queries[members], candidates):
+                for query, columns in zip(members[rows].tolist(),
+                                          columns_within(distances, radius)):
+                    found[query] = self.order[candidates[columns]]
+        return found
+
+    def nearest_many(self, points, k: int = 1) -> tuple:
+        """
+            Find the k nearest points to many points.
+            Queries are grouped by blocks of cells, the points around each block
+            are gathered once and measured against all its queries at once; the
+            box grows for the queries whose neighbours could lie outside it.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+                k (int): number of neighbours. Default is 1
+
+            Returns:
+                A tuple with two N×k arrays: the distances and the indexes of
+                the neighbours of every point, sorted by distance.
+
+            Raises:
+                ValueError if k is not positive.
+        """
+        if k <= 0:
+            raise ValueError('k must be positive')
+        queries = as_coordinates(points)
+        k = min(k, len(self))
+        result = (np.empty((queries.shape[0], k)),
+                  np.empty((queries.shape[0], k), dtype=np.int64))
+        if queries.shape[0] == 0:
+            return result
+        for first, last, members in self._groups(queries):
+            if members.shape[0] == 1:
+                result[0][members[0]], result[1][members[0]] = self.nearest(queries[members[0]], k)
+                continue
+            ring = 0
+            while members.shape[0]:
+                lower, upper = first - ring, last + ring
+                candidates = self._candidates(lower, upper)
+                if candidates.shape[0] >= k:
+                    members = self._nearest_box(queries, members, candidates, (lower, upper),
+                                                result)
+                ring = max(1, ring * 2)
+        return result
+
+    def _reach(self, queries: np.ndarray, box: tuple) -> np.ndarray:
+        """
+            Measure how far the points outside a box of cells are at least from queries.
+
+            Params:
+                queries (ndarray): M×3 coordinates of the queries, inside the box.
+                box (tuple): first and last cell of the box.
+
+            Returns:
+                An array with the distance for every query, infinite when the
+                box covers the whole grid.
+
+            Raises:
+                None
+        """
+        lower, upper = box
+        if (lower <= 0).all() and (upper >= self.shape - 1).all():
+            return np.full(queries.shape[0], np.inf)
+        bounds = self.lower + np.array([lower, upper + 1]) * self.cell_size
+        return np.minimum((queries - bounds[0]).min(axis=1), (bounds[1] - queries).min(axis=1))
+
+    def _nearest_box(self, queries: np.ndarray, members: np.ndarray, candidates: np.ndarray,
+                     box: tuple, result: tuple) -> np.ndarray:
+        """
+            Find the k nearest candidates of queries, storing them in result
+            when no point outside the box of cells can be nearer.
+
+            Params:
+                queries (ndarray): N×3 coordinates of all the queries.
+                members (ndarray): indexes of the queries to answer.
+                candidates (ndarray): positions in the sorted points of the points in the box.
+                box (tuple): first and last cell of the box.
+                result (tuple): N×k distances and indexes to fill.
+
+            Returns:
+                An array with the indexes of the queries left to answer.
+
+            Raises:
+                None
+        """
+        reach = self._reach(queries[members], box)
+        left = []
+        for part, distances in self._distances(queries[members], candidates):
+            rows = members[part]
+            nearest, closest = smallest_columns(distances, result[0].shape[1])
+            done = nearest[:, -1] <= reach[part]
+            result[0][rows[done]] = nearest[done]
+            result[1][rows[done]] = self.order[candidates[closest[done]]]
+            left.append(rows[~done])
+        return np.concatenate(left)
+
+
+def columns_within(distances: np.ndarray, radius: float) -> list:
+    """
+        Find the columns of every row within a distance.
+
+        Params:
+            distances (ndarray): M×N distances.
+            radius (float): maximum distance.
+
+        Returns:
+            A list with an array of columns, sorted by distance, for every row.
+
+        Raises:
+            None
+    """
+    rows, columns = np.nonzero(distances <= radius)
+    # by row, then distance, then column like PointIndex.within
+    order = np.lexsort((columns, distances[rows, columns], rows))
+    splits = np.cumsum(np.bincount(rows, minlength=distances.shape[0]))[:-1]
+    return np.split(columns[order], splits)
+
+
+def smallest_columns(distances: np.ndarray, k: int) -> tuple:
+    """
+        Find the k smallest distances of every row.
+
+        Params:
+            distances (ndarray): M×N distances, with N at least k.
+            k (int): number of columns to keep.
+
+        Returns:
+            A tuple with two M×k arrays: the distances and their columns,
+            sorted by distance.
+
+        Raises:
+            None
+    """
+    closest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    nearest = np.take_along_axis(distances, closest, axis=1)
+    order = np.argsort(nearest, axis=1, kind='stable')
+    return np.take_along_axis(nearest, order, axis=1), np.take_along_axis(closest, order, axis=1)
+
+
+# cell offsets towards the neighbours that come later in key order, so every
+# pair of neighbouring cells is visited once. Cells are tolerance / √3 wide,
+# so points closer than the tolerance are at most 2 cells apart on each axis
+FORWARD_OFFSETS = np.array([offset for offset in np.ndindex(5, 5, 5)
+                            if (np.array(offset) - 2).tolist() > [0, 0, 0]]) - 2
+# offsets towards all the neighbours, to visit the pairs of a few cells
+NEIGHBOUR_OFFSETS = np.array([offset for offset in np.ndindex(5, 5, 5)
+                              if offset != (2, 2, 2)]) - 2
+
+
+def ranks(values: np.ndarray, occupied: np.ndarray) -> tuple:
+    """
+        Find the position of values in a sorted array of the occupied ones.
+
+        Params:
+            values (ndarray): integer values to look up.
+            occupied (ndarray): sorted unique integer values.
+
+        Returns:
+            A tuple with two arrays: the positions, and whether each value is occupied.
+
+        Raises:
+            None
+    """
+    found = np.minimum(np.searchsorted(occupied, values), occupied.shape[0] - 1)
+    return found, occupied[found] == values
+
+
+def shifted_ranks(occupied: np.ndarray) -> list:
+    """
+        Find where the occupied values of an axis land when moved by -2 to 2 cells.
+
+        Params:
+            occupied (ndarray): sorted unique integer cell coordinates of an axis.
+
+        Returns:
+            A list with the result of ranks for every shift, from -2 to 2.
+
+        Raises:
+            None
+    """
+    return [ranks(occupied + shift, occupied) for shift in range(-2, 3)]
+
+
+def neighbour_columns(position: np.ndarray, shifts: list, columns: np.ndarray,
+                      offset: tuple) -> tuple:
+    """
+        Find the occupied (x, y) columns of cells moved by an offset.
+
+        Params:
+            position (ndarray): N×3 ranks of the cell coordinates on each axis.
+            shifts (list): result of shifted_ranks for every axis.
+            columns (ndarray): sorted keys of the occupied (x, y) columns.
+            offset (tuple): x and y offsets, from -2 to 2.
+
+        Returns:
+            A tuple with two arrays: the cells whose moved column is occupied,
+            and the rank of that column.
+
+        Raises:
+            None
+    """
+    x, valid = (array[position[:, 0]] for array in shifts[0][offset[0] + 2])
+    y, occupied = (array[position[:, 1]] for array in shifts[1][offset[1] + 2])
+    rows = np.flatnonzero(valid & occupied)
+    column, found = ranks(x[rows] * shifts[1][0][0].shape[0] + y[rows], columns)
+    return rows[found], column[found]
+
+
+def occupied_cells(cells: np.ndarray) -> tuple:
+    """
+        Key the occupied cells by the ranks of their coordinates among the
+        occupied ones, so keys stay below N² however many cells a dense grid
+        over the points would have.
+
+        Params:
+            cells (ndarray): N×3 integer cell coordinates of the points.
+
+        Returns:
+            A tuple with the occupied cell of every point, and the grid: a tuple
+            with the sorted keys of the occupied cells, the ranks of their
+            coordinates, the sorted keys of the occupied (x, y) columns and the
+            shifted ranks of every axis.
+
+        Raises:
+            None
+    """
+    axes = [np.unique(cells[:, i], return_inverse=True) for i in range(3)]
+    position = np.column_stack([inverse.ravel() for _, inverse in axes])
+    width, height = axes[1][0].shape[0], axes[2][0].shape[0]
+    columns = np.unique(position[:, 0] * width + position[:, 1])
+    column = np.searchsorted(columns, position[:, 0] * width + position[:, 1])
+    keys, first, cell = np.unique(column * height + position[:, 2], return_index=True,
+                                  return_inverse=True)
+    shifts = [shifted_ranks(values) for values, _ in axes]
+    return cell.ravel(), (keys, position[first], columns, shifts)
+
+
+def offset_cells(grid: tuple, offsets: np.ndarray):
+    """
+        Find the pairs of occupied cells at given offsets.
+
+        Params:
+            grid (tuple): grid of the cells returned by occupied_cells.
+            offsets (ndarray): M×3 offsets, sorted by x and y.
+
+        Returns:
+            A generator of two arrays for every offset: the indexes of the cells
+            and of their neighbours at that offset.
+
+        Raises:
+            None
+    """
+    keys, position, _, shifts = grid
+    levels = [(shifted[position[:, 2]], occupied[position[:, 2]])
+              for shifted, occupied in shifts[2]]
+    previous = rows = column = None
+    # offsets come in (x, y) groups, the columns of a group are looked up once
+    for offset in offsets.tolist():
+        if offset[:2] != previous:
+            previous = offset[:2]
+            rows, column = neighbour_columns(position, shifts, grid[2], previous)
+        level, occupied = levels[offset[2] + 2]
+        found = occupied[rows]
+        candidates = rows[found]
+        neighbours = column[found] * shifts[2][0][0].shape[0] + level[candidates]
+        # cells are in (x, y, z) order, so the lookups get sorted queries
+        found = np.minimum(np.searchsorted(keys, neighbours), keys.shape[0] - 1)
+        found[keys[found] != neighbours] = -1
+        yield candidates[found >= 0], found[found >= 0]
+
+
+def neighbour_cells(grid: tuple, subset: np.ndarray = None):
+    """
+        Find the pairs of occupied cells up to 2 cells apart on each axis.
+
+        Params:
+            grid (tuple): grid of the cells returned by occupied_cells.
+            subset (ndarray): whether each cell is looked from, towards all its
+                neighbours. Default is None, every cell towards the forward ones
+
+        Returns:
+            A generator of two arrays for every offset: the indexes of the cells
+            and of their neighbours at that offset.
+
+        Raises:
+            None
+    """
+    if subset is None:
+        yield from offset_cells(grid, FORWARD_OFFSETS)
+        return
+    origin = np.flatnonzero(subset)
+    for cells, others in offset_cells(grid[:1] + (grid[1][origin],) + grid[2:],
+                                      NEIGHBOUR_OFFSETS):
+        yield origin[cells], others
+
+
+def close_points(coordinates: np.ndarray, first: np.ndarray, second: np.ndarray,
+                 tolerance: float) -> np.ndarray:
+    """
+        Check which pairs of points are not farther apart than a tolerance.
+
+        Params:
+            coordinates (ndarray): N×3 coordinates of the points.
+            first (ndarray): indexes of the first point of every pair.
+            second (ndarray): indexes of the second point of every pair.
+            tolerance (float): maximum distance.
+
+        Returns:
+            An array with whether each pair is close.
+
+        Raises:
+            None
+    """
+    offsets = coordinates[first] - coordinates[second]
+    return np.einsum('ij,ij->i', offsets, offsets) <= tolerance ** 2
+
+
+def rejected_members(coordinates: np.ndarray, grid: tuple, cells: tuple, keepers: np.ndarray,
+                     tolerance: float) -> np.ndarray:
+    """
+        Find the untried points of the waiting cells closer than a tolerance
+        to the kept point of a neighbouring cell.
+
+        Params:
+            coordinates (ndarray): N×3 coordinates of the points.
+            grid (tuple): grid of the cells returned by occupied_cells.
+            cells (tuple): the points sorted by cell, the position of the point
+                every cell tries next and of the end of its points, and whether
+                each cell is waiting for a kept point.
+            keepers (ndarray): the point to check against in every cell, -1 for none.
+            tolerance (float): distance under which points are duplicates.
+
+        Returns:
+            An array with the positions of the rejected points in the sorted points.
+
+        Raises:
+            None
+    """
+    members, tried, ends, _ = cells
+    rejected = [np.empty(0, dtype=np.int64)]
+    for first, second in neighbour_cells(grid, cells[3]):
+        # the untried points of the cell, none when the neighbour has no keeper
+        counts = np.where(keepers[second] >= 0, ends[first] - tried[first], 0)
+        owner = np.repeat(np.arange(first.shape[0]), counts)
+        position = tried[first][owner] + np.arange(owner.shape[0]) - \
+            np.repeat(np.cumsum(counts) - counts, counts)
+        rejected.append(position[close_points(coordinates, members[position],
+                                              keepers[second][owner], tolerance)])
+    return np.concatenate(rejected)
+
+
+def close_candidates(coordinates: np.ndarray, grid: tuple, candidate: np.ndarray,
+                     tolerance: float) -> tuple:
+    """
+        Find the pairs of candidates of neighbouring cells closer than a tolerance.
+
+        Params:
+            coordinates (ndarray): N×3 coordinates of the points.
+            grid (tuple): grid of the cells returned by occupied_cells.
+            candidate (ndarray): the candidate point of every cell, -1 for none.
+            tolerance (float): distance under which points are duplicates.
+
+        Returns:
+            A tuple with two arrays: the cells of the earlier and of the later
+            candidate of every pair.
+
+        Raises:
+            None
+    """
+    waiting = candidate >= 0
+    # a few cells left look around themselves, and see their pairs twice
+    subset = None if waiting.all() else waiting
+    earlier, later = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+    for cells, others in neighbour_cells(grid, subset):
+        valid = waiting[cells] & waiting[others]
+        if subset is not None:
+            valid &= candidate[cells] < candidate[others]
+        cells, others = cells[valid], others[valid]
+        close = close_points(coordinates, candidate[cells], candidate[others], tolerance)
+        cells, others = cells[close], others[close]
+        first = candidate[cells] < candidate[others]
+        earlier.append(np.where(first, cells, others))
+        later.append(np.where(first, others, cells))
+    return np.concatenate(earlier), np.concatenate(later)
+
+
+def winning_candidates(coordinates: np.ndarray, grid: tuple, candidate: np.ndarray,
+                       tolerance: float) -> np.ndarray:
+    """
+        Resolve the candidates of neighbouring cells closer than a tolerance in
+        index order: a candidate is dropped only when a close earlier one is kept.
+
+        Params:
+            coordinates (ndarray): N×3 coordinates of the points.
+            grid (tuple): grid of the cells returned by occupied_cells.
+            candidate (ndarray): the candidate point of every cell, -1 for none.
+            tolerance (float): distance under which points are duplicates.
+
+        Returns:
+            An array with whether the candidate of each cell is kept.
+
+        Raises:
+            None
+    """
+    earlier, later = close_candidates(coordinates, grid, candidate, tolerance)
+    state = np.full(candidate.shape[0], UNDECIDED, dtype=np.int8)
+    # a candidate whose close earlier ones are all dropped is kept, and drops its
+    # close later ones; a few rounds settle most of them at once
+    for _ in range(GREEDY_ROUNDS):
+        blocked = np.zeros(candidate.shape[0], dtype=bool)
+        blocked[later] = True
+        state[(state == UNDECIDED) & ~blocked] = KEPT
+        state[later[state[earlier] == KEPT]] = DROPPED
+        pending = (state[later] == UNDECIDED) & (state[earlier] != DROPPED)
+        earlier, later = earlier[pending], later[pending]
+    # chains of close candidates are left, settle them in index order
+    state[state == UNDECIDED] = KEPT
+    settled = state.tolist()
+    order = np.argsort(candidate[later], kind='stable')
+    for first, second in zip(earlier[order].tolist(), later[order].tolist()):
+        if settled[first] == KEPT:
+            settled[second] = DROPPED
+    return (candidate >= 0) & (np.array(settled, dtype=np.int8) == KEPT)
+
+
+def kept_points(coordinates: np.ndarray, cells: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+        Keep at most one point per cell, the cells being tolerance / √3 wide.
+        Every cell tries its points in index order, skipping those close to a
+        point kept in a neighbouring cell, and the candidates of close cells
+        are resolved in index order, until every cell has a kept point or runs
+        out of points.
+
+        Params:
+            coordinates (ndarray): N×3 coordinates of the points.
+            cells (ndarray): N×3 integer cell coordinates of the points.
+            tolerance (float): distance under which points are duplicates.
+
+        Returns:
+            An array with the indexes of the kept points.
+
+        Raises:
+            None
+    """
+    cell, grid = occupied_cells(cells)
+    members = np.argsort(cell, kind='stable')
+    counts = np.bincount(cell)
+    ends = np.cumsum(counts)
+    tried = ends - counts
+    kept = np.full(counts.shape[0], -1)
+    rejected = np.zeros(members.shape[0] + 1, dtype=bool)
+    fresh = np.zeros(counts.shape[0], dtype=bool)
+    while True:
+        waiting = (kept < 0) & (tried < ends)
+        if fresh.any():
+            rejected[rejected_members(coordinates, grid, (members, tried, ends, waiting),
+                                      np.where(fresh, kept, -1), tolerance)] = True
+            # move every cell to its first point left, the last slot is a sentinel
+            left = np.where(rejected[:-1], members.shape[0], np.arange(members.shape[0]))
+            tried = np.append(np.minimum.accumulate(left[::-1])[::-1], members.shape[0])[tried]
+            waiting &= tried < ends
+        if not waiting.any():
+            return kept[kept >= 0]
+        candidate = np.where(waiting, members[np.minimum(tried, members.shape[0] - 1)], -1)
+        fresh = winning_candidates(coordinates, grid, candidate, tolerance)
+        kept[fresh] = candidate[fresh]
+        tried[waiting & ~fresh] += 1
+
+
+def unique_points(points, tolerance: float = 1e-9) -> np.ndarray:
+    """
+        Find the points left after merging duplicates closer than a tolerance.
+        Points are bucketed in cells of tolerance / √3, whose diagonal is the
+        tolerance, so a cell keeps at most one point. Close points are resolved
+        in index order, a point being dropped only for a close kept one: the
+        first points of the cells compete first, then the cells that lost theirs
+        try their next points. Kept points are more than the tolerance apart,
+        and every dropped point is within the tolerance of a kept one. Only the
+        occupied cells are keyed, so any extent and tolerance work, and it runs
+        in O(N log N) instead of comparing every pair.
+
+        Params:
+            points: N×3 array, VectorArray or list of points.
+            tolerance (float): distance under which points are duplicates.
+
+        Returns:
+            A sorted array with the indexes of the kept points.
+
+        Raises:
+            ValueError if tolerance is not positive, or too small to grid the
+            points in 64 bits integers.
+    """
+    if tolerance <= 0:
+        raise ValueError('tolerance must be positive')
+    coordinates = as_coordinates(points)
+    if coordinates.shape[0] == 0:
+        return np.empty(0, dtype=np.int64)
+    lower = coordinates.min(axis=0)
+    size = tolerance / np.sqrt(3)
+    if ((coordinates.max(axis=0) - lower) / size).max() >= MAX_CELLS:
+        raise ValueError('tolerance is too small for the extent of the points')
+    cells = np.floor((coordinates - lower) / size).astype(np.int64)
+    return np.sort(kept_points(coordinates, cells, tolerance))
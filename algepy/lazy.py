@@ -0,0 +1,47 @@
+from importlib import import_module
+
+
+class LazyModule:
+    """
+        Module proxy that imports the module on first attribute access.
+        Keeps heavy dependencies such as numpy or matplotlib out of the
+        import of algepy until some code actually uses them.
+    """
+
+    def __init__(self, name: str, package: str = None):
+        """
+            Initialize a lazy module.
+
+            Params:
+                name (str): name of the module, relative names need package.
+                package (str): package to resolve relative names from.
+
+            Returns:
+                A lazy module class instance.
+
+            Raises:
+                None
+        """
+        self.__dict__['_target'] = (name, package)
+
+    def __getattr__(self, attribute: str):
+        """
+            Import the module and get one of its attributes.
+            The namespace of the module is copied into the proxy, so later
+            accesses do not go through this method.
+
+            Params:
+                attribute (str): name of the attribute.
+
+            Returns:
+                The attribute of the module.
+
+            Raises:
+                AttributeError if the module does not have the attribute.
+        """
+        module = import_module(*self.__dict__['_target'])
+        self.__dict__.update(vars(module))
+        return getattr(module, attribute)
+
+    def __repr__(self) -> str:
+        return f'LazyModule({self.__dict__["_target"][0]!r})'
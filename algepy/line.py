@@ -1,5 +1,58 @@
+from . import backend
 from .point import Point
 from .vector import Vector
+from .lazy import LazyModule
+
+np = LazyModule('numpy')
+array = LazyModule('.array', __package__)
+
+# relative size under which a dot product between directions counts as 0
+PARALLEL_TOLERANCE = 1e-12
+
+
+def point_along(point: Point, vector: Vector, scalar: float) -> Point:
+    """
+        Move a point along a vector scaled by a scalar.
+
+        Params:
+            point (Point): point to move.
+            vector (Vector): direction to move along.
+            scalar (float): multiple of the vector to move by.
+
+        Returns:
+            The moved point.
+
+        Raises:
+            None
+    """
+    return Point.from_xyz(point.x + scalar * vector.x, point.y + scalar * vector.y,
+                          point.z + scalar * vector.z)
+
+
+def approach_parameters(a, b, c, d, e) -> tuple:
+    """
+        Solve the parameters of the closest points of many pairs of lines from
+        the dot products of their directions u, v and the vector w between them.
+
+        Params:
+            a (float): u·u.
+            b (ndarray): u·v for every pair.
+            c (ndarray): v·v for every pair.
+            d (ndarray): u·w for every pair.
+            e (ndarray): v·w for every pair.
+
+        Returns:
+            A tuple with two arrays: the parameters on the first and on the
+            second line of every pair, 0 on the first line for parallel lines.
+
+        Raises:
+            None
+    """
+    denominator = a * c - b * b
+    parallel = np.abs(denominator) <= PARALLEL_TOLERANCE * a * c
+    denominator[parallel] = 1
+    return (np.where(parallel, 0, (d * c - b * e) / denominator),
+            np.where(parallel, -e / c, (b * d - a * e) / denominator))
 
 
 class Line:
@@ -26,6 +79,205 @@ class Line:
         self.point = kwargs.get('point', Point(x=0, y=0, z=0))
         self.vector = kwargs.get('vector', Vector(x=0, y=0, z=0))
 
+    def _arrays(self) -> tuple:
+        """
+            Get the point and the direction vector of the line as float arrays.
+        """
+        return (np.array([self.point.x, self.point.y, self.point.z], dtype=float),
+                np.array([self.vector.x, self.vector.y, self.vector.z], dtype=float))
+
+    def at(self, lambdas, out: 'np.ndarray' = None) -> 'np.ndarray':
+        """
+            Evaluate point + λ·vector for many values of λ at once.
+
+            Params:
+                lambdas: a value or a sequence of values of the parameter.
+                out (ndarray): N×3 float array to store the points. Default is a new array.
+
+            Returns:
+                A N×3 array with a point of the line for every value.
+
+            Raises:
+                ValueError if out does not have one row per value.
+        """
+        lambdas = np.atleast_1d(np.asarray(lambdas, dtype=float))
+        point, vector = self._arrays()
+        if out is not None and out.shape != (lambdas.shape[0], 3):
+            raise ValueError('out must have one row per value')
+        out = np.multiply(lambdas[:, None], vector, out=out)
+        out += point
+        return out
+
+    def parameters(self, points) -> 'np.ndarray':
+        """
+            Find the value of λ of the orthogonal projection of many points on the line.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+
+            Returns:
+                An array with the parameter of every projection.
+
+            Raises:
+                ValueError if the direction vector is null.
+        """
+        point, vector = self._arrays()
+        squared = vector @ vector
+        if squared == 0:
+            raise ValueError('Cannot project on a line with null vector')
+        return (array.as_coordinates(points) - point) @ (vector / squared)
+
+    def project(self, points) -> 'np.ndarray':
+        """
+            Project many points orthogonally on the line.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+
+            Returns:
+                A N×3 array with the closest point of the line to every point.
+
+            Raises:
+                ValueError if the direction vector is null.
+        """
+        return self.at(self.parameters(points))
+
+    def distance_to(self, points) -> 'np.ndarray':
+        """
+            Calculate the distance from many points to the line.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+
+            Returns:
+                An array with the distance of every point.
+
+            Raises:
+                ValueError if the direction vector is null.
+        """
+        point, vector = self._arrays()
+        magnitude = np.sqrt(vector @ vector)
+        if magnitude == 0:
+            raise ValueError('Cannot calculate distance with null vector')
+        return np.linalg.norm(np.cross(array.as_coordinates(points) - point, vector),
+                              axis=1) / magnitude
+
+    def intersect_plane(self, plane) -> Point:
+        """
+            Find the intersection of the line with a plane.
+
+            Params:
+                plane (Plane): plane to intersect.
+
+            Returns:
+                The intersection point, None if the line is parallel to the plane.
+
+            Raises:
+                None
+        """
+        return plane.intersect_line(self)
+
+    def intersect_planes(self, planes) -> 'np.ndarray':
+        """
+            Find the intersections of the line with many planes at once.
+
+            Params:
+                planes: list of Plane instances or N×4 array with their a, b, c and d.
+
+            Returns:
+                A N×3 array with the intersection points, rows of planes
+                parallel to the line are NaN.
+
+            Raises:
+                ValueError if the coefficients are not a N×4 array.
+        """
+        coefficients = array.as_coefficients(planes)
+        normals, d = coefficients[:, :3], coefficients[:, 3]
+        point, vector = self._arrays()
+        denominator = normals @ vector
+        parallel = np.abs(denominator) <= (
+            PARALLEL_TOLERANCE * np.linalg.norm(normals, axis=1) * np.linalg.norm(vector))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lambdas = -(normals @ point + d) / denominator
+        lambdas[parallel] = np.nan
+        return point + lambdas[:, None] * vector
+
+    def closest_approach(self, other: 'Line') -> tuple:
+        """
+            Find the closest points between the line and another line.
+
+            Params:
+                other (Line): another line.
+
+            Returns:
+                A tuple with the closest point on this line and on the other line.
+                For parallel lines the point of this line is used.
+
+            Raises:
+                TypeError if other is not a Line
+                ValueError if a direction vector is null
+        """
+        if not isinstance(other, Line):
+            raise TypeError('other must be a Line')
+        u, v = self.vector, other.vector
+        if u.isnull() or v.isnull():
+            raise ValueError('Cannot calculate closest approach with null vector')
+        w = self.point.find_vector(other.point)
+        a, b, c = u.dot(u), u.dot(v), v.dot(v)
+        d, e = u.dot(w), v.dot(w)
+        denominator = a * c - b * b
+        divide = backend.current.divide
+        if abs(denominator) <= PARALLEL_TOLERANCE * a * c:
+            s, t = 0, divide(-e, c)
+        else:
+            s, t = divide(d * c - b * e, denominator), divide(b * d - a * e, denominator)
+        return point_along(self.point, u, s), point_along(other.point, v, t)
+
+    def closest_approaches(self, **kwargs) -> tuple:
+        """
+            Find the closest points between the line and many lines at once.
+
+            Params:
+                lines (list): list of Line instances.
+                points: N×3 points on the lines, used when no lines are given.
+                vectors: N×3 direction vectors of the lines, used when no lines are given.
+
+            Returns:
+                A tuple with two N×3 arrays: the closest points on this line and
+                on each of the other lines.
+
+            Raises:
+                ValueError if no lines given or the sizes are not equal.
+        """
+        points, vectors = array.as_lines(**kwargs)
+        p, u = self._arrays()
+        w = points - p
+        a, b, c = u @ u, vectors @ u, np.einsum('ij,ij->i', vectors, vectors)
+        d, e = w @ u, np.einsum('ij,ij->i', vectors, w)
+        s, t = approach_parameters(a, b, c, d, e)
+        return p + s[:, None] * u, points + t[:, None] * vectors
+
+    def intersect_line(self, other: 'Line', tolerance: float = 1e-9) -> Point:
+        """
+            Find the intersection of the line with another line.
+
+            Params:
+                other (Line): another line.
+                tolerance (float): maximum distance between the lines to intersect.
+
+            Returns:
+                The intersection point, None if the lines do not intersect.
+
+            Raises:
+                TypeError if other is not a Line
+                ValueError if a direction vector is null
+        """
+        p, q = self.closest_approach(other)
+        if p.find_vector(q).magnitude() > tolerance:
+            return None
+        midpoint = p.midpoint(q)
+        return Point.from_xyz(midpoint.x, midpoint.y, midpoint.z)
+
     def __repr__(self):
         return f'Line(point={self.point}, vector={self.vector})'
 
@@ -0,0 +1,429 @@
+from . import backend
+from .vector import Vector
+from .lazy import LazyModule
+
+np = LazyModule('numpy')
+
+# relative size of a determinant, against the product of the row norms,
+# under which a matrix counts as singular
+SINGULAR_TOLERANCE = 1e-12
+
+
+def singular(determinant, rows) -> bool:
+    """
+        Check if a determinant is negligible against the product of the norms
+        of the rows, the largest determinant they can have. Squares are compared
+        to skip the square roots.
+    """
+    bound = SINGULAR_TOLERANCE ** 2
+    for row in rows:
+        bound *= sum(value * value for value in row)
+    return determinant * determinant <= bound
+
+
+def cofactors3(rows: list) -> tuple:
+    """
+        Cross products of the rows of a 3×3 matrix: r1×r2, r2×r0 and r0×r1,
+        the columns of its adjugate.
+    """
+    (a, b, c), (d, e, f), (g, h, i) = rows
+    return ((e * i - f * h, f * g - d * i, d * h - e * g),
+            (h * c - i * b, i * a - g * c, g * b - h * a),
+            (b * f - c * e, c * d - a * f, a * e - b * d))
+
+
+def solve3(rows: tuple, values: list, divide) -> list:
+    """
+        Solve a 3×3 linear system with the adjugate of its matrix.
+
+        Params:
+            rows (tuple): rows of the matrix.
+            values (list): right hand side.
+            divide: division of the numeric backend.
+
+        Returns:
+            A list with the solution.
+
+        Raises:
+            ValueError if the matrix is singular.
+    """
+    cofactors = cofactors3(rows)
+    determinant = sum(x * y for x, y in zip(rows[0], cofactors[0]))
+    if singular(determinant, rows):
+        raise ValueError('Matrix is singular')
+    u, v, w = values
+    return [divide(u * p + v * q + w * r, determinant) for p, q, r in zip(*cofactors)]
+
+
+class Matrix:
+    """
+        Matrix of numbers stored as a tuple of rows.
+        Values go through the numeric backend, so exact backends give exact
+        determinants, inverses and solutions.
+        Supported operators:
+            +: add two matrices
+            -: subtract two matrices
+            *: scalar multiplication
+            @: product with a matrix or a vector
+            ==: check if two matrices are equal
+    """
+
+    __slots__ = ('rows',)
+
+    def __init__(self, rows):
+        """
+            Initialize a matrix with its rows.
+
+            Params:
+                rows: sequence of rows, each one a sequence of numbers.
+
+            Returns:
+                A matrix class instance.
+
+            Raises:
+                ValueError if there are no rows or they do not have the same length.
+        """
+        convert = backend.current.convert
+        rows = tuple(tuple(row) if convert is None else tuple(convert(value) for value in row)
+                     for row in rows)
+        if not rows or not rows[0]:
+            raise ValueError('Matrix must not be empty')
+        if any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError('Rows must have the same length')
+        self.rows = rows
+
+    @classmethod
+    def from_rows(cls, rows: tuple) -> 'Matrix':
+        """
+            Create a matrix from a tuple of row tuples, skipping the checks
+            and the backend conversion, for values that already went through it.
+
+            Params:
+                rows (tuple): tuple of rows of the same length, each one a tuple.
+
+            Returns:
+                A matrix class instance.
+
+            Raises:
+                None
+        """
+        matrix = cls.__new__(cls)
+        matrix.rows = rows
+        return matrix
+
+    @classmethod
+    def identity(cls, size: int) -> 'Matrix':
+        """
+            Create an identity matrix.
+
+            Params:
+                size (int): number of rows and columns.
+
+            Returns:
+                A matrix class instance.
+
+            Raises:
+                ValueError if size is not positive.
+        """
+        if size <= 0:
+            raise ValueError('size must be positive')
+        return cls([[int(i == j) for j in range(size)] for i in range(size)])
+
+    @classmethod
+    def from_vectors(cls, vectors: list, columns: bool = False) -> 'Matrix':
+        """
+            Create a matrix from vectors.
+
+            Params:
+                vectors (list): list of Vector instances of the same dimension.
+                columns (bool): if True, the vectors are the columns instead of the rows.
+
+            Returns:
+                A matrix class instance.
+
+            Raises:
+                ValueError if the dimensions are not equal.
+        """
+        if any(vector.dimension != vectors[0].dimension for vector in vectors):
+            raise ValueError('Dimensions must be equal')
+        rows = [(vector.x, vector.y, vector.z)[0: vector.dimension] for vector in vectors]
+        return cls(rows).transpose() if columns else cls(rows)
+
+    @property
+    def shape(self) -> tuple:
+        """number of rows and columns."""
+        return len(self.rows), len(self.rows[0])
+
+    @property
+    def square(self) -> bool:
+        """whether the matrix has as many rows as columns."""
+        return len(self.rows) == len(self.rows[0])
+
+    def transpose(self) -> 'Matrix':
+        """
+            Get the transposed matrix.
+
+            Params:
+                None
+
+            Returns:
+                A matrix with the rows and columns swapped.
+
+            Raises:
+                None
+        """
+        return Matrix(zip(*self.rows))
+
+    def lu(self) -> tuple:
+        """
+            Calculate the LU decomposition with partial pivoting, P·A = L·U.
+
+            Params:
+                None
+
+            Returns:
+                A tuple with the permutation, a list with the original row of
+                every row of P·A, the lower triangular matrix L with ones in the
+                diagonal and the upper triangular matrix U.
+
+            Raises:
+                ValueError if the matrix is not square or is singular.
+        """
+        permutation, lower, upper = self._lu()
+        return permutation, Matrix(lower), Matrix(upper)
+
+    def _lu(self) -> tuple:
+        """
+            Calculate the LU decomposition as lists of rows, see lu.
+        """
+        if not self.square:
+            raise ValueError('Matrix must be square')
+        size = len(self.rows)
+        divide = backend.current.divide
+        upper = [list(row) for row in self.rows]
+        lower = [[0] * size for _ in range(size)]
+        permutation = list(range(size))
+        bound = SINGULAR_TOLERANCE * max(abs(value) for row in self.rows for value in row)
+        for k in range(size):
+            column = [abs(row[k]) for row in upper[k:]]
+            pivot = k + column.index(max(column))
+            if abs(upper[pivot][k]) <= bound:
+                raise ValueError('Matrix is singular')
+            if pivot != k:
+                upper[k], upper[pivot] = upper[pivot], upper[k]
+                lower[k], lower[pivot] = lower[pivot], lower[k]
+                permutation[k], permutation[pivot] = permutation[pivot], permutation[k]
+            lower[k][k] = 1
+            for i in range(k + 1, size):
+                factor = divide(upper[i][k], upper[k][k])
+                lower[i][k] = factor
+                upper[i] = [a - factor * b for a, b in zip(upper[i], upper[k])]
+                upper[i][k] = 0
+        return permutation, lower, upper
+
+    def determinant(self):
+        """
+            Calculate the determinant of the matrix.
+
+            Params:
+                None
+
+            Returns:
+                The determinant as a number.
+
+            Raises:
+                ValueError if the matrix is not square.
+        """
+        if not self.square:
+            raise ValueError('Matrix must be square')
+        rows = self.rows
+        if len(rows) == 1:
+            return rows[0][0]
+        if len(rows) == 2:
+            return rows[0][0] * rows[1][1] - rows[0][1] * rows[1][0]
+        if len(rows) == 3:
+            cofactor = cofactors3(rows)[0]
+            return sum(a * b for a, b in zip(rows[0], cofactor))
+        try:
+            permutation, _, upper = self._lu()
+        except ValueError:
+            return 0
+        determinant = 1
+        for i in range(len(rows)):
+            determinant *= upper[i][i]
+        # every cycle of length n of the permutation is n - 1 swaps
+        seen, swaps = set(), 0
+        for start in range(len(rows)):
+            length = 0
+            while start not in seen:
+                seen.add(start)
+                start = permutation[start]
+                length += 1
+            swaps += max(length - 1, 0)
+        return -determinant if swaps % 2 else determinant
+
+    def solve(self, values):
+        """
+            Solve the linear system A·x = values.
+            3×3 systems use the adjugate, without decomposing the matrix.
+
+            Params:
+                values: Vector or sequence with the right hand side.
+
+            Returns:
+                The solution x, as a Vector if values is a Vector and as a list otherwise.
+
+            Raises:
+                ValueError if the matrix is not square or is singular,
+                    or the sizes are not equal.
+        """
+        if isinstance(values, Vector):
+            solution = self._solve(list((values.x, values.y, values.z)[0: values.dimension]))
+            return Vector.from_xyz(*solution, dimension=values.dimension)
+        return self._solve(list(values))
+
+    def _solve(self, values: list) -> list:
+        """
+            Solve the linear system A·x = values, see solve.
+        """
+        if not self.square:
+            raise ValueError('Matrix must be square')
+        if len(values) != len(self.rows):
+            raise ValueError('Sizes must be equal')
+        divide = backend.current.divide
+        if len(self.rows) == 3:
+            return solve3(self.rows, values, divide)
+        permutation, lower, upper = self._lu()
+        size = len(values)
+        solution = [values[i] for i in permutation]
+        for i in range(size):
+            solution[i] -= sum(lower[i][j] * solution[j] for j in range(i))
+        for i in reversed(range(size)):
+            total = solution[i] - sum(upper[i][j] * solution[j] for j in range(i + 1, size))
+            solution[i] = divide(total, upper[i][i])
+        return solution
+
+    def inverse(self) -> 'Matrix':
+        """
+            Calculate the inverse matrix.
+
+            Params:
+                None
+
+            Returns:
+                A matrix class instance.
+
+            Raises:
+                ValueError if the matrix is not square or is singular.
+        """
+        size = len(self.rows)
+        columns = [self._solve([int(i == j) for i in range(size)]) for j in range(size)]
+        return Matrix(columns).transpose()
+
+    def _product(self, other: 'Matrix') -> 'Matrix':
+        """
+            Multiply the matrix by another matrix.
+        """
+        if self.shape[1] != other.shape[0]:
+            raise ValueError('Columns must be equal to the rows of the other matrix')
+        columns = list(zip(*other.rows))
+        return Matrix([[sum(a * b for a, b in zip(row, column)) for column in columns]
+                       for row in self.rows])
+
+    def __matmul__(self, other):
+        """
+            Multiply the matrix by a matrix or a vector.
+
+            Params:
+                other: Matrix or Vector with as many coordinates as columns.
+
+            Returns:
+                A Matrix, or a Vector for a vector.
+
+            Raises:
+                ValueError if the sizes do not match or the result has more than 3 rows.
+                TypeError if other is not a Matrix or a Vector.
+        """
+        if isinstance(other, Matrix):
+            return self._product(other)
+        if not isinstance(other, Vector):
+            return NotImplemented
+        values = (other.x, other.y, other.z)[0: other.dimension]
+        if len(values) != self.shape[1]:
+            raise ValueError('Dimensions must be equal')
+        if self.shape[0] > 3:
+            raise ValueError('Vectors have at most 3 dimensions')
+        result = [sum(a * b for a, b in zip(row, values)) for row in self.rows]
+        return Vector.from_xyz(*result, dimension=len(result))
+
+    def __add__(self, other: 'Matrix') -> 'Matrix':
+        if self.shape != other.shape:
+            raise ValueError('Shapes must be equal')
+        return Matrix([[a + b for a, b in zip(*rows)] for rows in zip(self.rows, other.rows)])
+
+    def __sub__(self, other: 'Matrix') -> 'Matrix':
+        if self.shape != other.shape:
+            raise ValueError('Shapes must be equal')
+        return Matrix([[a - b for a, b in zip(*rows)] for rows in zip(self.rows, other.rows)])
+
+    def __mul__(self, scalar) -> 'Matrix':
+        if isinstance(scalar, (Matrix, Vector)):
+            return NotImplemented
+        return Matrix([[value * scalar for value in row] for row in self.rows])
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other: 'Matrix') -> bool:
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.rows == other.rows
+
+    __hash__ = None
+
+    def __getitem__(self, index):
+        row, column = index
+        return self.rows[row][column]
+
+    def __str__(self) -> str:
+        return '\n'.join('[' + ', '.join(str(value) for value in row) + ']' for row in self.rows)
+
+    def __repr__(self) -> str:
+        return f'Matrix({[list(row) for row in self.rows]})'
+
+
+def solve_batch(matrices, values) -> 'np.ndarray':
+    """
+        Solve many linear systems A·x = b at once.
+        3×3 systems are solved with their adjugates in a few vectorized
+        products instead of one decomposition per system.
+
+        Params:
+            matrices: N×K×K array-like with the matrix of every system.
+            values: N×K array-like with the right hand side of every system.
+
+        Returns:
+            A N×K array with the solutions, rows of singular systems are NaN.
+
+        Raises:
+            ValueError if the shapes do not match.
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if matrices.ndim != 3 or matrices.shape[1] != matrices.shape[2]:
+        raise ValueError('Matrices must be a N×K×K array')
+    if values.shape != matrices.shape[:2]:
+        raise ValueError('Values must be a N×K array')
+    bound = SINGULAR_TOLERANCE * np.prod(np.linalg.norm(matrices, axis=2), axis=1)
+    if matrices.shape[1] == 3:
+        rows = matrices[:, 0], matrices[:, 1], matrices[:, 2]
+        cofactors = (np.cross(rows[1], rows[2]), np.cross(rows[2], rows[0]),
+                     np.cross(rows[0], rows[1]))
+        determinants = np.einsum('ij,ij->i', rows[0], cofactors[0])
+        determinants[np.abs(determinants) <= bound] = np.nan
+        solutions = sum(values[:, i, None] * cofactors[i] for i in range(3))
+        return solutions / determinants[:, None]
+    regular = np.abs(np.linalg.det(matrices)) > bound
+    solutions = np.full(values.shape, np.nan)
+    if regular.any():
+        solutions[regular] = np.linalg.solve(matrices[regular], values[regular, :, None])[..., 0]
+    return solutions
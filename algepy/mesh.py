@@ -0,0 +1,537 @@
+import numpy as np
+
+from .array import as_coordinates
+from .plane import Plane
+from .point import Point
+from .vector import Vector
+
+# distances to a face under this fraction of the size of the coordinates
+# count as on the face, so rounding errors do not make flat faces bend
+HULL_TOLERANCE = 1e-12
+# distances computed at once when checking which points are inside a hull
+CONTAINS_BLOCK = 2 ** 22
+
+
+def as_faces(faces, count: int) -> np.ndarray:
+    """
+        Get the vertex indexes of a batch of triangles as a M×3 array.
+
+        Params:
+            faces: M×3 array-like of integer indexes.
+            count (int): number of vertices the indexes refer to.
+
+        Returns:
+            A M×3 int64 array.
+
+        Raises:
+            ValueError if the faces are not a M×3 array or an index is out of range.
+    """
+    data = np.asarray(faces, dtype=np.int64)
+    if data.size == 0:
+        data = data.reshape(0, 3)
+    if data.ndim != 2 or data.shape[1] != 3:
+        raise ValueError('Faces must be a M×3 array')
+    if data.size and (data.min() < 0 or data.max() >= count):
+        raise ValueError('Faces must index the vertices')
+    return data
+
+
+class Mesh:
+    """
+        Triangle mesh stored as a shared vertex buffer and faces indexing it.
+        Vertices are a N×3 float array and faces a M×3 integer array, the
+        corners of every face in counterclockwise order seen from outside,
+        so normals, areas and the volume are computed for all the faces at once.
+    """
+
+    def __init__(self, vertices, faces):
+        """
+            Initialize a mesh.
+
+            Params:
+                vertices: N×3 array, VectorArray or list of points.
+                faces: M×3 array-like with the indexes of the corners of each face.
+
+            Returns:
+                A mesh class instance.
+
+            Raises:
+                ValueError if the vertices are not a N×3 array, the faces are
+                not a M×3 array or an index is out of range.
+        """
+        self.vertices = as_coordinates(vertices)
+        self.faces = as_faces(faces, self.vertices.shape[0])
+
+    @classmethod
+    def from_triangles(cls, triangles) -> 'Mesh':
+        """
+            Create a mesh from the corners of every triangle, sharing equal corners.
+
+            Params:
+                triangles: M×3×3 array-like, or list of tuples of three points.
+
+            Returns:
+                A mesh class instance.
+
+            Raises:
+                ValueError if the triangles are not a M×3×3 array.
+        """
+        if isinstance(triangles, (list, tuple)) and triangles and hasattr(triangles[0][0], 'axes'):
+            triangles = [[(point.x, point.y, point.z) for point in corners]
+                         for corners in triangles]
+        corners = np.asarray(triangles, dtype=float)
+        if corners.size == 0:
+            return cls(np.empty((0, 3)), np.empty((0, 3), dtype=np.int64))
+        if corners.ndim != 3 or corners.shape[1:] != (3, 3):
+            raise ValueError('Triangles must be a M×3×3 array')
+        vertices, faces = np.unique(corners.reshape(-1, 3), axis=0, return_inverse=True)
+        return cls(vertices, faces.reshape(-1, 3))
+
+    def corners(self) -> tuple:
+        """
+            Get the coordinates of the corners of every face.
+
+            Params:
+                None
+
+            Returns:
+                A tuple with three M×3 float arrays: first, second and third corners.
+
+            Raises:
+                None
+        """
+        return tuple(self.vertices[self.faces[:, i]] for i in range(3))
+
+    def _cross(self) -> np.ndarray:
+        """
+            Cross products of the edges of every face, twice their area along the normal.
+        """
+        first, second, third = self.corners()
+        return np.cross(second - first, third - first)
+
+    def face_normals(self, unit: bool = True) -> np.ndarray:
+        """
+            Calculate the normal vector of every face.
+
+            Params:
+                unit (bool): scale the normals to length 1, otherwise their
+                    length is twice the area of the face. Default is True
+
+            Returns:
+                A M×3 float array, null for degenerate faces.
+
+            Raises:
+                None
+        """
+        normals = self._cross()
+        if not unit:
+            return normals
+        lengths = np.sqrt(np.einsum('ij,ij->i', normals, normals))
+        return np.divide(normals, lengths[:, None], out=np.zeros_like(normals),
+                         where=lengths[:, None] > 0)
+
+    def vertex_normals(self) -> np.ndarray:
+        """
+            Calculate the normal vector of every vertex, the unit sum of the
+            normals of its faces weighted by their areas.
+
+            Params:
+                None
+
+            Returns:
+                A N×3 float array, null for vertices without faces.
+
+            Raises:
+                None
+        """
+        normals = self._cross()
+        count = self.vertices.shape[0]
+        totals = np.zeros((count, 3))
+        for i in range(3):
+            for axis in range(3):
+                totals[:, axis] += np.bincount(self.faces[:, i], weights=normals[:, axis],
+                                               minlength=count)
+        lengths = np.sqrt(np.einsum('ij,ij->i', totals, totals))
+        return np.divide(totals, lengths[:, None], out=np.zeros_like(totals),
+                         where=lengths[:, None] > 0)
+
+    def areas(self) -> np.ndarray:
+        """
+            Calculate the area of every face.
+
+            Params:
+                None
+
+            Returns:
+                An array of floats.
+
+            Raises:
+                None
+        """
+        normals = self._cross()
+        return np.sqrt(np.einsum('ij,ij->i', normals, normals)) / 2
+
+    def area(self) -> float:
+        """
+            Calculate the surface area of the mesh.
+
+            Params:
+                None
+
+            Returns:
+                A float value of the area.
+
+            Raises:
+                None
+        """
+        return float(self.areas().sum())
+
+    def volume(self) -> float:
+        """
+            Calculate the volume enclosed by the mesh, the sum of the triple
+            products of the corners of every face divided by 6.
+            Only meaningful for closed meshes.
+
+            Params:
+                None
+
+            Returns:
+                A float value of the volume, negative if the faces point inwards.
+
+            Raises:
+                None
+        """
+        first, second, third = self.corners()
+        return float(np.einsum('ij,ij->', first, np.cross(second, third)) / 6)
+
+    def edges(self) -> np.ndarray:
+        """
+            Get the edges of the mesh, each one once.
+
+            Params:
+                None
+
+            Returns:
+                A E×2 int64 array with the indexes of the ends of every edge, the lower first.
+
+            Raises:
+                None
+        """
+        edges = np.sort(self.faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+        return np.unique(edges, axis=0)
+
+    @property
+    def closed(self) -> bool:
+        """whether every edge is shared by two faces crossing it in opposite directions."""
+        count = self.vertices.shape[0]
+        starts, ends = self.faces.ravel(), self.faces[:, [1, 2, 0]].ravel()
+        forward = np.sort(starts * count + ends)
+        backward = np.sort(ends * count + starts)
+        return bool(np.array_equal(forward, backward) and np.unique(forward).size == forward.size)
+
+    def face(self, index: int) -> tuple:
+        """
+            Get the corners of a face as points.
+
+            Params:
+                index (int): index of the face.
+
+            Returns:
+                A tuple of three Point instances.
+
+            Raises:
+                IndexError if the face does not exist.
+        """
+        return tuple(Point.from_xyz(*self.vertices[i].tolist()) for i in self.faces[index])
+
+    def normal(self, index: int) -> Vector:
+        """
+            Calculate the normal vector of a face, twice its area long.
+
+            Params:
+                index (int): index of the face.
+
+            Returns:
+                A Vector instance.
+
+            Raises:
+                IndexError if the face does not exist.
+                ValueError if the face is degenerate.
+        """
+        first, second, third = self.face(index)
+        return first.find_vector(second).cross(first.find_vector(third))
+
+    def flip(self) -> 'Mesh':
+        """
+            Get the mesh with the faces pointing the other way.
+
+            Params:
+                None
+
+            Returns:
+                A mesh class instance sharing the vertices.
+
+            Raises:
+                None
+        """
+        return Mesh(self.vertices, self.faces[:, ::-1])
+
+    def __len__(self) -> int:
+        return self.faces.shape[0]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(vertices={self.vertices.shape[0]}, faces={len(self)})'
+
+
+def initial_simplex(coordinates: np.ndarray, tolerance: float) -> list:
+    """
+        Find four far apart points spanning a tetrahedron.
+
+        Params:
+            coordinates (ndarray): N×3 points.
+            tolerance (float): distance under which points are on a line or plane.
+
+        Returns:
+            A list with the indexes of the four corners.
+
+        Raises:
+            ValueError if the points are all equal, collinear or coplanar.
+    """
+    extremes = np.concatenate([coordinates.argmin(axis=0), coordinates.argmax(axis=0)])
+    offsets = coordinates[extremes][:, None] - coordinates[extremes][None]
+    squared = np.einsum('ijk,ijk->ij', offsets, offsets)
+    first, second = divmod(int(squared.argmax()), squared.shape[1])
+    first, second = int(extremes[first]), int(extremes[second])
+    direction = coordinates[second] - coordinates[first]
+    length = np.linalg.norm(direction)
+    if length <= tolerance:
+        raise ValueError('Points must not be all equal')
+    offsets = coordinates - coordinates[first]
+    spans = np.cross(offsets, direction / length)
+    spans = np.einsum('ij,ij->i', spans, spans)
+    third = int(spans.argmax())
+    if spans[third] <= tolerance ** 2:
+        raise ValueError('Points must not be collinear')
+    normal = np.cross(direction, coordinates[third] - coordinates[first])
+    heights = np.abs(offsets @ (normal / np.linalg.norm(normal)))
+    fourth = int(heights.argmax())
+    if heights[fourth] <= tolerance:
+        raise ValueError('Points must not be coplanar')
+    return [first, second, third, fourth]
+
+
+class Quickhull:
+    """
+        State of the quickhull algorithm: the faces of the hull so far and
+        the points outside each one.
+        Every step takes the farthest point outside a face, removes the faces
+        it sees and closes the hole with faces from the horizon to the point;
+        only the points outside the removed faces are measured again, which
+        makes it run in O(N log N) on average.
+    """
+
+    def __init__(self, coordinates: np.ndarray, tolerance: float):
+        self.coordinates = coordinates
+        self.tolerance = tolerance
+        # corners, unit normal and offset along the normal of every face
+        self.faces = {}
+        self.outside = {}
+        self.edges = {}
+        self.pending = []
+        self.count = 0
+
+    def add_faces(self, corners: list, candidates: np.ndarray) -> None:
+        """
+            Add faces and hand out the candidate points to the ones they are outside of.
+        """
+        corners = np.array(corners, dtype=np.int64)
+        origins = self.coordinates[corners[:, 0]]
+        normals = np.cross(self.coordinates[corners[:, 1]] - origins,
+                           self.coordinates[corners[:, 2]] - origins)
+        normals /= np.sqrt(np.einsum('ij,ij->i', normals, normals))[:, None]
+        offsets = np.einsum('ij,ij->i', normals, origins)
+        ids = list(range(self.count, self.count + corners.shape[0]))
+        self.count += corners.shape[0]
+        for face, (start, middle, end), normal, offset in zip(
+                ids, corners.tolist(), normals, offsets.tolist()):
+            self.faces[face] = ((start, middle, end), normal, offset)
+            for edge in ((start, middle), (middle, end), (end, start)):
+                self.edges[edge] = face
+        if candidates.shape[0]:
+            self.assign(ids, normals, offsets, candidates)
+
+    def assign(self, ids: list, normals: np.ndarray, offsets: np.ndarray,
+               candidates: np.ndarray) -> None:
+        """
+            Hand out the candidate points to the new faces they are farthest outside of.
+        """
+        distances = self.coordinates[candidates] @ normals.T - offsets
+        nearest = distances.argmax(axis=1)
+        farthest = distances[np.arange(candidates.shape[0]), nearest]
+        outside = farthest > self.tolerance
+        candidates, nearest, farthest = candidates[outside], nearest[outside], farthest[outside]
+        order = np.argsort(nearest, kind='stable')
+        bounds = np.searchsorted(nearest[order], np.arange(len(ids) + 1))
+        for row, face in enumerate(ids):
+            members = order[bounds[row]:bounds[row + 1]]
+            if members.shape[0]:
+                points = candidates[members]
+                self.outside[face] = (points, int(points[farthest[members].argmax()]))
+                self.pending.append(face)
+
+    def remove_face(self, face: int) -> np.ndarray:
+        """
+            Remove a face, returning the points outside it.
+        """
+        (first, second, third), _, _ = self.faces.pop(face)
+        for edge in ((first, second), (second, third), (third, first)):
+            del self.edges[edge]
+        points, _ = self.outside.pop(face, (None, None))
+        return points
+
+    def horizon(self, face: int, eye: np.ndarray) -> tuple:
+        """
+            Find the faces seen from a point starting at one of them, and the
+            edges between them and the ones that are not seen.
+        """
+        visible, stack, horizon = {face}, [face], []
+        while stack:
+            (first, second, third), _, _ = self.faces[stack.pop()]
+            for start, end in ((first, second), (second, third), (third, first)):
+                neighbour = self.edges[(end, start)]
+                if neighbour in visible:
+                    continue
+                _, normal, offset = self.faces[neighbour]
+                if normal @ eye - offset > self.tolerance:
+                    visible.add(neighbour)
+                    stack.append(neighbour)
+                else:
+                    horizon.append((start, end))
+        return visible, horizon
+
+    def run(self, simplex: list) -> np.ndarray:
+        """
+            Build the hull from a tetrahedron of the points.
+        """
+        first, second, third, fourth = simplex
+        origin = self.coordinates[first]
+        normal = np.cross(self.coordinates[second] - origin, self.coordinates[third] - origin)
+        if normal @ (self.coordinates[fourth] - origin) > 0:
+            second, third = third, second
+        candidates = np.arange(self.coordinates.shape[0])
+        self.add_faces([(first, second, third), (first, fourth, second),
+                        (second, fourth, third), (third, fourth, first)], candidates)
+        while self.pending:
+            face = self.pending.pop()
+            if face not in self.outside:
+                continue
+            eye = self.outside[face][1]
+            visible, horizon = self.horizon(face, self.coordinates[eye])
+            points = [self.remove_face(item) for item in visible]
+            points = np.concatenate([item for item in points if item is not None])
+            self.add_faces([(start, end, eye) for start, end in horizon], points[points != eye])
+        return np.array([corners for corners, _, _ in self.faces.values()], dtype=np.int64)
+
+
+def quickhull(points, tolerance: float = None) -> np.ndarray:
+    """
+        Find the faces of the convex hull of points with the quickhull algorithm.
+
+        Params:
+            points: N×3 array, VectorArray or list of points.
+            tolerance (float): distance under which a point is on a face.
+                Default is HULL_TOLERANCE times the size of the coordinates
+
+        Returns:
+            A M×3 int64 array with the indexes of the corners of every face,
+            counterclockwise seen from outside.
+
+        Raises:
+            ValueError if there are less than 4 points or they are coplanar.
+    """
+    coordinates = as_coordinates(points)
+    if coordinates.shape[0] < 4:
+        raise ValueError('At least 4 points are needed to build a hull')
+    if tolerance is None:
+        tolerance = HULL_TOLERANCE * max(float(np.abs(coordinates).max(axis=0).sum()), 1.0)
+    hull = Quickhull(coordinates, tolerance)
+    return hull.run(initial_simplex(coordinates, tolerance))
+
+
+class ConvexHull(Mesh):
+    """
+        Convex hull of a set of points, a closed mesh of its boundary.
+        Only the points on the hull are kept as vertices, indices tells
+        which of the given points they are.
+    """
+
+    def __init__(self, points, tolerance: float = None):
+        """
+            Build the convex hull of points.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+                tolerance (float): distance under which a point is on a face.
+                    Default is HULL_TOLERANCE times the size of the coordinates
+
+            Returns:
+                A convex hull class instance.
+
+            Raises:
+                ValueError if there are less than 4 points or they are coplanar.
+        """
+        coordinates = as_coordinates(points)
+        faces = quickhull(coordinates, tolerance)
+        self.indices, faces = np.unique(faces, return_inverse=True)
+        super().__init__(coordinates[self.indices], faces.reshape(-1, 3))
+        normals = self.face_normals()
+        self.equations = np.column_stack(
+            [normals, -np.einsum('ij,ij->i', normals, self.vertices[self.faces[:, 0]])])
+        # the ball around the centroid of the vertices touching the nearest face
+        self.center = self.vertices.mean(axis=0)
+        self.inradius = float(-(self.equations[:, :3] @ self.center + self.equations[:, 3]).max())
+
+    def contains(self, points, tolerance: float = 1e-9) -> np.ndarray:
+        """
+            Check which points are inside the hull or on its boundary.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+                tolerance (float): distance outside the faces still counted as inside.
+
+            Returns:
+                An array of bools, one per point.
+
+            Raises:
+                ValueError if the points are not a N×3 array.
+        """
+        coordinates = as_coordinates(points)
+        # points in the inner ball are inside and points out of the bounding box
+        # are outside, only the rest is measured against every face
+        offsets = coordinates - self.center
+        inside = np.einsum('ij,ij->i', offsets, offsets) <= self.inradius ** 2
+        lower, upper = self.vertices.min(axis=0) - tolerance, self.vertices.max(axis=0) + tolerance
+        boxed = ((coordinates >= lower) & (coordinates <= upper)).all(axis=1)
+        unknown = np.flatnonzero(boxed & ~inside)
+        # measure the points in blocks so the distances to every face fit in memory
+        step = max(CONTAINS_BLOCK // len(self), 1)
+        for start in range(0, unknown.shape[0], step):
+            rows = unknown[start:start + step]
+            distances = coordinates[rows] @ self.equations[:, :3].T + self.equations[:, 3]
+            inside[rows] = (distances <= tolerance).all(axis=1)
+        return inside
+
+    def planes(self) -> list:
+        """
+            Get the planes of the faces, their normals pointing outwards.
+
+            Params:
+                None
+
+            Returns:
+                A list of Plane instances with unit normals.
+
+            Raises:
+                None
+        """
+        return [Plane.from_coefficients(*row) for row in self.equations.tolist()]
@@ -1,18 +1,104 @@
-from .vector import Vector
+import os
+from collections import OrderedDict
+from threading import Lock
+
+from . import backend
+from .vector import Vector, quantize
 from .point import Point
+from .line import Line, PARALLEL_TOLERANCE
+from .matrix import Matrix, solve_batch
+from .lazy import LazyModule
+
+np = LazyModule('numpy')
+array = LazyModule('.array', __package__)
+futures = LazyModule('concurrent.futures')
+
+# number of point-plane distances measured at a time while counting inliers
+RANSAC_BLOCK = 2 ** 22
+
+
+def count_inliers(coordinates: 'np.ndarray', planes: 'np.ndarray',
+                  threshold: float) -> 'np.ndarray':
+    """
+        Count the points within a distance of each of many planes.
 
+        Params:
+            coordinates (ndarray): N×3 array of points.
+            planes (ndarray): M×4 array of planes with unit normals.
+            threshold (float): maximum distance of an inlier.
 
-class Plane:
+        Returns:
+            An array with the number of inliers of every plane.
+
+        Raises:
+            None
+    """
+    counts = np.zeros(planes.shape[0], dtype=np.int64)
+    normals, offsets = planes[:, :3], planes[:, 3:]
+    step = max(1, RANSAC_BLOCK // max(planes.shape[0], 1))
+    for start in range(0, coordinates.shape[0], step):
+        # one row per plane, so the count runs along contiguous memory
+        distances = normals @ coordinates[start: start + step].T
+        distances += offsets
+        np.abs(distances, out=distances)
+        counts += np.count_nonzero(distances <= threshold, axis=1)
+    return counts
+
+
+def propose_planes(coordinates: 'np.ndarray', iterations: int, rng) -> 'np.ndarray':
+    """
+        Build the planes through triples of random points.
+
+        Params:
+            coordinates (ndarray): N×3 array of points.
+            iterations (int): number of triples to draw.
+            rng (Generator): numpy random generator.
+
+        Returns:
+            A M×4 array of planes with unit normals, degenerate triples are left out.
+
+        Raises:
+            None
+    """
+    samples = coordinates[rng.integers(0, coordinates.shape[0], (iterations, 3))]
+    normals = np.cross(samples[:, 1] - samples[:, 0], samples[:, 2] - samples[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = lengths > 0
+    normals = normals[valid] / lengths[valid, None]
+    offsets = -np.einsum('ij,ij->i', normals, samples[valid, 0])
+    return np.column_stack([normals, offsets])
+
+
+class Plane:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """
         Plane definition
+        Planes are immutable unless created with mutable=True, so their derived
+        values, like the unit normal or the intercepts, are computed once and cached.
+        Supported operators:
+            ==: check if two planes are the same, up to Plane.tolerance
     """
 
+    normal: Vector
+    point: Point
+    a: float
+    b: float
+    c: float
+    d: float
+    _mutable: bool
+    _cache: dict
+    tolerance = 1e-9
+    # most planes kept by Plane.intern, the least recently used ones are dropped
+    intern_size = 4096
+    _interned = OrderedDict()
+    _intern_lock = Lock()
+
     def __init__(self, **kwargs):
         """Initialize a plane with normal vector and a point on the plane.
 
             Params:
-                normal (Vector): normal vector of the plane
-                point (Point): point on the plane
+                normal (Vector): normal vector of the plane, copied
+                point (Point): point on the plane, copied
+                mutable (bool): allow changing a, b, c and d after creation. Default is False
 
             Returns:
                 A plane class instance.
@@ -22,12 +108,297 @@ class Plane:
         """
         if kwargs is None:
             raise ValueError('No arguments given.')
-        self.normal = kwargs.get('normal', Vector(x=0, y=0, z=0))
-        self.point = kwargs.get('point', Point(x=0, y=0, z=0))
-        self.a = self.normal.get('x')
-        self.b = self.normal.get('y')
-        self.c = self.normal.get('z')
-        self.d = self.find_d(self.point)
+        normal = kwargs.get('normal', Vector(x=0, y=0, z=0))
+        point = kwargs.get('point', Point(x=0, y=0, z=0))
+        # copies, so changing the given vector or point in place cannot change the plane
+        normal = Vector.from_xyz(normal.x, normal.y, normal.z, normal.dimension)
+        if isinstance(point, Point):
+            point = Point.from_xyz(point.x, point.y, point.z, point.dimension)
+        # written through __dict__, skipping the immutability check of __setattr__
+        self.__dict__.update(normal=normal, point=point,
+                             a=normal.x, b=normal.y, c=normal.z, _cache={},
+                             _mutable=kwargs.get('mutable', False))
+        self.__dict__['d'] = self.find_d(self.point)
+
+    @classmethod
+    def from_coefficients(cls, a, b, c, d, mutable: bool = False) -> 'Plane':
+        """
+            Create the plane ax + by + cz + d = 0.
+
+            Params:
+                a, b, c: coordinates of the normal vector.
+                d: independent term.
+                mutable (bool): allow changing a, b, c and d after creation. Default is False
+
+            Returns:
+                A plane class instance, its point is the closest one to the origin.
+
+            Raises:
+                None
+        """
+        convert = backend.current.convert
+        d = d if convert is None else convert(d)
+        normal = Vector.from_xyz(a, b, c)
+        squared = normal.squared_magnitude()
+        scale = backend.current.divide(-d, squared) if squared else 0
+        point = Point.from_xyz(normal.x * scale, normal.y * scale, normal.z * scale)
+        plane = cls(normal=normal, point=point, mutable=mutable)
+        # keep d as given, a null normal has no point to compute it from
+        plane.__dict__['d'] = d
+        return plane
+
+    @classmethod
+    def intern(cls, **kwargs) -> 'Plane':
+        """
+            Get a shared immutable plane equal to the one built from the arguments.
+            Planes equal up to Plane.tolerance, even from different normals and
+            points, give the same instance while it stays among the last
+            Plane.intern_size planes used.
+
+            Params:
+                normal (Vector): normal vector of the plane
+                point (Point): point on the plane
+
+            Returns:
+                A plane class instance.
+
+            Raises:
+                ValueError if mutable is True
+        """
+        if kwargs.get('mutable', False):
+            raise ValueError('Mutable planes cannot be interned')
+        plane = cls(**kwargs)
+        key = plane.key()
+        with cls._intern_lock:
+            interned = cls._interned.get(key)
+            if interned is not None:
+                cls._interned.move_to_end(key)
+                return interned
+            cls._interned[key] = plane
+            if len(cls._interned) > cls.intern_size:
+                cls._interned.popitem(last=False)
+        return plane
+
+    @classmethod
+    def clear_interned(cls) -> None:
+        """
+            Drop every plane kept by Plane.intern.
+
+            Params:
+                None
+
+            Returns:
+                None
+
+            Raises:
+                None
+        """
+        with cls._intern_lock:
+            cls._interned.clear()
+
+    def __setattr__(self, name: str, value) -> None:
+        if not self._mutable:
+            raise AttributeError('Plane is immutable, create it with mutable=True to change it')
+        self.__dict__[name] = value
+        self._cache.clear()
+
+    def __delattr__(self, name: str) -> None:
+        if not self._mutable:
+            raise AttributeError('Plane is immutable, create it with mutable=True to change it')
+        del self.__dict__[name]
+        self._cache.clear()
+
+    def _cached(self, name: str, compute):
+        """
+            Get a derived value, computing it on first use.
+        """
+        cache = self._cache
+        if name not in cache:
+            cache[name] = compute()
+        return cache[name]
+
+    @property
+    def mutable(self) -> bool:
+        """whether a, b, c and d can be changed."""
+        return self._mutable
+
+    @property
+    def coefficients(self) -> tuple:
+        """a, b, c and d of the general equation."""
+        return (self.a, self.b, self.c, self.d)
+
+    def _norm(self):
+        """
+            Magnitude of the normal vector.
+        """
+        return self._cached('norm', lambda: backend.current.sqrt(
+            self.a * self.a + self.b * self.b + self.c * self.c))
+
+    @property
+    def unit_normal(self) -> Vector:
+        """normal vector of magnitude 1, raises ValueError if the normal is null."""
+        def compute():
+            norm = self._norm()
+            if norm == 0:
+                raise ValueError('Cannot normalize a null normal vector')
+            divide = backend.current.divide
+            return divide(self.a, norm), divide(self.b, norm), divide(self.c, norm)
+        return Vector.from_xyz(*self._cached('unit_normal', compute))
+
+    @property
+    def normalized_d(self):
+        """d of the plane with unit normal, the signed distance from the origin
+        to the plane along the normal, negated. Raises ValueError if the normal is null."""
+        def compute():
+            norm = self._norm()
+            if norm == 0:
+                raise ValueError('Cannot normalize a null normal vector')
+            return backend.current.divide(self.d, norm)
+        return self._cached('normalized_d', compute)
+
+    @property
+    def intercepts(self) -> tuple:
+        """values where the plane crosses the x, y and z axes, None for the axes
+        parallel to the plane."""
+        def compute():
+            divide = backend.current.divide
+            return tuple(None if value == 0 else divide(-self.d, value)
+                         for value in (self.a, self.b, self.c))
+        return self._cached('intercepts', compute)
+
+    def key(self) -> tuple:
+        """
+            Get the coefficients of the plane with unit normal, rounded to multiples
+            of Plane.tolerance, used to compare and hash planes. The sign is chosen so
+            that planes with opposite normals have the same key.
+
+            Params:
+                None
+
+            Returns:
+                A tuple with the a, b, c and d values.
+
+            Raises:
+                None
+        """
+        def compute():
+            norm = self._norm()
+            if norm == 0:
+                return quantize(self.coefficients, self.tolerance)
+            key = quantize((value / norm for value in self.coefficients), self.tolerance)
+            sign = next((value for value in key[0: 3] if value), 0)
+            return tuple(-value for value in key) if sign < 0 else key
+        return self._cached('key', compute)
+
+    def __eq__(self, other: 'Plane') -> bool:
+        """
+            Check if the planes are the same, up to Plane.tolerance.
+
+            Params:
+                other: other plane to check.
+
+            Returns:
+                True if the planes are the same, False otherwise.
+
+            Raises:
+                None
+        """
+        if not isinstance(other, Plane):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self) -> int:
+        if self._mutable:
+            raise TypeError('Mutable planes are not hashable')
+        return hash(self.key())
+
+    @classmethod
+    def fit(cls, points) -> 'Plane':
+        """
+            Fit a plane to points by least squares.
+            The plane goes through the centroid and its normal is the direction
+            of least spread, the last singular vector of the centred coordinates.
+            It is taken from the 3×3 scatter matrix, which has the same singular
+            vectors, so millions of points are reduced with a single product.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+
+            Returns:
+                A plane class instance with a unit normal.
+
+            Raises:
+                ValueError if there are less than 3 points or they are collinear.
+        """
+        coordinates = array.as_coordinates(points)
+        if coordinates.shape[0] < 3:
+            raise ValueError('At least 3 points are needed to fit a plane')
+        centroid = coordinates.mean(axis=0)
+        centered = coordinates - centroid
+        _, spread, directions = np.linalg.svd(centered.T @ centered)
+        if spread[1] <= PARALLEL_TOLERANCE * spread[0]:
+            raise ValueError('Cannot fit a plane to collinear points')
+        normal = directions[2]
+        # the sign of a singular vector is arbitrary, keep the largest component positive
+        if normal[np.argmax(np.abs(normal))] < 0:
+            normal = -normal
+        return cls(normal=Vector.from_xyz(*normal.tolist()),
+                   point=Point.from_xyz(*centroid.tolist()))
+
+    @classmethod
+    def ransac(cls, points, threshold: float, iterations: int = 1000, **kwargs) -> 'Plane':
+        """
+            Fit a plane to points with outliers by RANSAC.
+            Every iteration proposes the plane through 3 random points, the one with
+            most points within threshold wins and is refitted to its inliers by least
+            squares. Inliers of a batch of proposals are counted with one matrix
+            product, and batches run across a pool of threads.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+                threshold (float): maximum distance of an inlier to the plane.
+                iterations (int): number of proposed planes. Default is 1000
+                workers (int): number of threads, 1 counts in this thread.
+                    Default is the number of CPUs
+                seed (int): seed of the random sampling. Default is None
+                refit (bool): refit the best plane to its inliers. Default is True
+
+            Returns:
+                A plane class instance with a unit normal, use signed_distance
+                to find its inliers.
+
+            Raises:
+                ValueError if there are less than 3 points, threshold is negative,
+                iterations is not positive or every proposal was degenerate.
+        """
+        coordinates = array.as_coordinates(points)
+        if coordinates.shape[0] < 3:
+            raise ValueError('At least 3 points are needed to fit a plane')
+        if threshold < 0:
+            raise ValueError('threshold must not be negative')
+        if iterations <= 0:
+            raise ValueError('iterations must be positive')
+        planes = propose_planes(coordinates, iterations, np.random.default_rng(kwargs.get('seed')))
+        if planes.shape[0] == 0:
+            raise ValueError('Cannot fit a plane to collinear points')
+        workers = kwargs.get('workers') or os.cpu_count() or 1
+        if workers == 1:
+            counts = count_inliers(coordinates, planes, threshold)
+        else:
+            batches = np.array_split(planes, min(workers, planes.shape[0]))
+            with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                counts = np.concatenate(list(executor.map(
+                    lambda batch: count_inliers(coordinates, batch, threshold), batches)))
+        best = planes[np.argmax(counts)]
+        if kwargs.get('refit', True):
+            inliers = np.abs(coordinates @ best[:3] + best[3]) <= threshold
+            try:
+                return cls.fit(coordinates[inliers])
+            except ValueError:
+                pass
+        normal = best[:3]
+        return cls(normal=Vector.from_xyz(*normal.tolist()),
+                   point=Point.from_xyz(*(-best[3] * normal).tolist()))
 
     def find_d(self, point: Point) -> float:
         """
@@ -63,16 +434,210 @@ class Plane:
         """
         if not axis in ['x', 'y', 'z']:
             raise ValueError('axis must be x, y, or z')
-        d = self.find_d(self.point)
-        v = -d / self.normal.get(axis)
-        x_ = y_ = z_ = 0
-        if axis == 'x':
-            x_ = v
-        if axis == 'y':
-            y_ = v
-        if axis == 'z':
-            z_ = v
-        return Point(x=x_, y=y_, z=z_)
+        index = Vector.axes.index(axis)
+        value = self.intercepts[index]
+        if value is None:
+            raise ZeroDivisionError(f'Plane is parallel to the {axis} axis')
+        coordinates = [0, 0, 0]
+        coordinates[index] = value
+        return Point.from_xyz(*coordinates)
+
+    def signed_distance(self, points) -> 'np.ndarray':
+        """
+            Calculate the signed distance from many points to the plane.
+            Positive distances are on the side the normal points to.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+
+            Returns:
+                An array with the distance of every point.
+
+            Raises:
+                ValueError if the normal vector is null.
+        """
+        normal = np.array([self.a, self.b, self.c], dtype=float)
+        magnitude = np.sqrt(normal @ normal)
+        if magnitude == 0:
+            raise ValueError('Cannot calculate distance with null normal vector')
+        return (array.as_coordinates(points) @ (normal / magnitude)) + self.d / magnitude
+
+    def classify(self, points, tolerance: float = 1e-9) -> 'np.ndarray':
+        """
+            Classify many points by the side of the plane they are on.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+                tolerance (float): distance under which a point lies on the plane.
+
+            Returns:
+                An array with 1 for points on the side of the normal,
+                -1 for points on the other side and 0 for points on the plane.
+
+            Raises:
+                ValueError if the normal vector is null.
+        """
+        distance = self.signed_distance(points)
+        side = np.sign(distance).astype(np.int8)
+        side[np.abs(distance) <= tolerance] = 0
+        return side
+
+    def intersect_line(self, line: Line) -> Point:
+        """
+            Find the intersection of the plane with a line.
+
+            Params:
+                line (Line): line to intersect.
+
+            Returns:
+                The intersection point, None if the line is parallel to the plane.
+
+            Raises:
+                TypeError if line is not a Line
+        """
+        if not isinstance(line, Line):
+            raise TypeError('line must be a Line')
+        p, v = line.point, line.vector
+        denominator = self.a * v.x + self.b * v.y + self.c * v.z
+        normal = Vector.from_xyz(self.a, self.b, self.c)
+        if abs(denominator) <= PARALLEL_TOLERANCE * normal.magnitude() * v.magnitude():
+            return None
+        lambda_ = backend.current.divide(
+            -(self.a * p.x + self.b * p.y + self.c * p.z + self.d), denominator)
+        return Point.from_xyz(p.x + lambda_ * v.x, p.y + lambda_ * v.y, p.z + lambda_ * v.z)
+
+    def intersect_lines(self, **kwargs) -> 'np.ndarray':
+        """
+            Find the intersections of the plane with many lines at once.
+
+            Params:
+                lines (list): list of Line instances.
+                points: N×3 points on the lines, used when no lines are given.
+                vectors: N×3 direction vectors of the lines, used when no lines are given.
+
+            Returns:
+                A N×3 array with the intersection points, rows of lines
+                parallel to the plane are NaN.
+
+            Raises:
+                ValueError if no lines given or the sizes are not equal.
+        """
+        points, vectors = array.as_lines(**kwargs)
+        normal = np.array([self.a, self.b, self.c], dtype=float)
+        denominator = vectors @ normal
+        parallel = np.abs(denominator) <= (
+            PARALLEL_TOLERANCE * np.linalg.norm(normal) * np.linalg.norm(vectors, axis=1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lambdas = -(points @ normal + self.d) / denominator
+        lambdas[parallel] = np.nan
+        return points + lambdas[:, None] * vectors
+
+    def intersect_plane(self, other: 'Plane') -> Line:
+        """
+            Find the intersection line of the plane with another plane.
+
+            Params:
+                other (Plane): another plane.
+
+            Returns:
+                The intersection line, its point is the closest one to the origin.
+
+            Raises:
+                TypeError if other is not a Plane
+                ValueError if the planes are parallel
+        """
+        if not isinstance(other, Plane):
+            raise TypeError('other must be a Plane')
+        n1 = Vector.from_xyz(self.a, self.b, self.c)
+        n2 = Vector.from_xyz(other.a, other.b, other.c)
+        direction = n1.cross(n2)
+        determinant = direction.squared_magnitude()
+        if determinant <= PARALLEL_TOLERANCE * n1.squared_magnitude() * n2.squared_magnitude():
+            raise ValueError('Planes are parallel')
+        # the point of the line closest to the origin is also on the plane
+        # through the origin perpendicular to the line
+        system = Matrix.from_rows(((self.a, self.b, self.c), (other.a, other.b, other.c),
+                                   (direction.x, direction.y, direction.z)))
+        x, y, z = system.solve([-self.d, -other.d, 0])
+        return Line(point=Point.from_xyz(x, y, z), vector=direction)
+
+    def intersect_planes(self, planes) -> tuple:
+        """
+            Find the intersection lines of the plane with many planes at once.
+
+            Params:
+                planes: list of Plane instances or N×4 array with their a, b, c and d.
+
+            Returns:
+                A tuple with two N×3 arrays: a point on each line, the closest one
+                to the origin, and its direction vector. Rows of parallel planes are NaN.
+
+            Raises:
+                ValueError if the coefficients are not a N×4 array.
+        """
+        coefficients = array.as_coefficients(planes)
+        n1 = np.array([self.a, self.b, self.c], dtype=float)
+        n2 = coefficients[:, :3]
+        directions = np.cross(n1, n2)
+        determinant = np.einsum('ij,ij->i', directions, directions)
+        parallel = determinant <= PARALLEL_TOLERANCE * (n1 @ n1) * np.einsum('ij,ij->i', n2, n2)
+        systems = np.stack([np.broadcast_to(n1, n2.shape), n2, directions], axis=1)
+        values = np.column_stack([np.full(n2.shape[0], -float(self.d)), -coefficients[:, 3],
+                                  np.zeros(n2.shape[0])])
+        points = solve_batch(systems, values)
+        points[parallel] = np.nan
+        directions[parallel] = np.nan
+        return points, directions
+
+    def intersection_point(self, second: 'Plane', third: 'Plane') -> Point:
+        """
+            Find the point where the plane meets two other planes.
+
+            Params:
+                second (Plane): second plane.
+                third (Plane): third plane.
+
+            Returns:
+                The intersection point of the three planes.
+
+            Raises:
+                TypeError if second or third are not a Plane
+                ValueError if the planes do not meet in a single point
+        """
+        if not isinstance(second, Plane) or not isinstance(third, Plane):
+            raise TypeError('second and third must be a Plane')
+        system = Matrix.from_rows(((self.a, self.b, self.c), (second.a, second.b, second.c),
+                                   (third.a, third.b, third.c)))
+        if not all(any(row) for row in system.rows):
+            raise ValueError('Cannot calculate intersection with null normal vector')
+        try:
+            x, y, z = system.solve([-self.d, -second.d, -third.d])
+        except ValueError as error:
+            raise ValueError('Planes do not meet in a single point') from error
+        return Point.from_xyz(x, y, z)
+
+    def intersection_points(self, seconds, thirds) -> 'np.ndarray':
+        """
+            Find the points where the plane meets many pairs of planes at once.
+
+            Params:
+                seconds: list of Plane instances or N×4 array with their a, b, c and d.
+                thirds: list of Plane instances or N×4 array with their a, b, c and d.
+
+            Returns:
+                A N×3 array with the intersection points, rows of planes that
+                do not meet in a single point are NaN.
+
+            Raises:
+                ValueError if the coefficients are not N×4 arrays of the same size.
+        """
+        seconds, thirds = array.as_coefficients(seconds), array.as_coefficients(thirds)
+        if seconds.shape != thirds.shape:
+            raise ValueError('Sizes must be equal')
+        first = np.broadcast_to(np.array([self.a, self.b, self.c, self.d], dtype=float),
+                                seconds.shape)
+        systems = np.stack([first, seconds, thirds], axis=1)
+        return solve_batch(systems[:, :, :3], -systems[:, :, 3])
 
     def symmetric_equation(self, **kwargs) -> str:
         """
@@ -1,13 +1,183 @@
-from matplotlib import pyplot as plt
-from numpy import array, meshgrid
+from itertools import product
+
+from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+import numpy as np
 
 from .vector import Vector
 from .point import Point
 from .plane import Plane
 from .line import Line
+from .array import as_coordinates
+from .index import cell_keys
+from .lazy import LazyModule
+
+# pyplot is only needed by plots that are not headless
+plt = LazyModule('matplotlib.pyplot')
+
+LOD_METHODS = ('random', 'voxel')
+# pairs of corners, as indexes of itertools.product([0, 1], repeat=3), joined by the box edges
+BOX_EDGES = [(0, 1), (2, 3), (4, 5), (6, 7), (0, 2), (1, 3),
+             (4, 6), (5, 7), (0, 4), (1, 5), (2, 6), (3, 7)]
+
+
+def clip_plane(coefficients, lower: float, upper: float) -> np.ndarray:
+    """
+        Clip a plane to a cubic box.
+
+        Params:
+            coefficients: a, b, c and d of the plane.
+            lower (float): lower bound of the box on every axis.
+            upper (float): upper bound of the box on every axis.
+
+        Returns:
+            A M×3 array with the vertices of the polygon where the plane crosses
+            the box, in order around it. Empty when the plane misses the box.
+
+        Raises:
+            ValueError if the normal vector is null.
+    """
+    normal, d = np.asarray(coefficients[:3], dtype=float), float(coefficients[3])
+    if not normal.any():
+        raise ValueError('Cannot clip a plane with null normal vector')
+    corners = np.array(list(product([lower, upper], repeat=3)), dtype=float)
+    values = corners @ normal + d
+    start, end = np.array(BOX_EDGES).T
+    crossing = (values[start] * values[end] <= 0) & (values[start] != values[end])
+    start, end = start[crossing], end[crossing]
+    t = values[start] / (values[start] - values[end])
+    vertices = corners[start] + t[:, None] * (corners[end] - corners[start])
+    vertices = np.unique(vertices.round(12), axis=0)
+    if vertices.shape[0] < 3:
+        return np.empty((0, 3))
+    return around(vertices, normal)
+
+
+def around(vertices: np.ndarray, normal: np.ndarray) -> np.ndarray:
+    """
+        Sort the vertices of a convex polygon in order around its center.
+
+        Params:
+            vertices (ndarray): M×3 vertices of the polygon.
+            normal (ndarray): normal vector of the plane of the polygon.
+
+        Returns:
+            A M×3 array with the sorted vertices.
+
+        Raises:
+            None
+    """
+    u = np.cross(normal, np.eye(3)[np.argmin(np.abs(normal))])
+    v = np.cross(normal, u)
+    offsets = vertices - vertices.mean(axis=0)
+    return vertices[np.argsort(np.arctan2(offsets @ v, offsets @ u))]
+
 
+def clip_line(point, vector, lower: float, upper: float) -> tuple:
+    """
+        Clip a line to a cubic box, intersecting the slabs between the
+        bounds of every axis.
+
+        Params:
+            point: x, y and z of a point on the line.
+            vector: x, y and z of the direction vector of the line.
+            lower (float): lower bound of the box on every axis.
+            upper (float): upper bound of the box on every axis.
+
+        Returns:
+            A tuple with the values of λ where the line enters and leaves
+            the box, None when the line misses the box.
+
+        Raises:
+            ValueError if the direction vector is null.
+    """
+    point, vector = np.asarray(point, dtype=float), np.asarray(vector, dtype=float)
+    if not vector.any():
+        raise ValueError('Cannot clip a line with null vector')
+    moving = vector != 0
+    if ((point[~moving] < lower) | (point[~moving] > upper)).any():
+        return None
+    bounds = (np.array([lower, upper])[:, None] - point[moving]) / vector[moving]
+    enter, leave = bounds.min(axis=0).max(), bounds.max(axis=0).min()
+    return (enter, leave) if enter <= leave else None
+
+
+def subdivide(polygon: np.ndarray, resolution: int) -> tuple:
+    """
+        Split a convex polygon into a triangle mesh.
+
+        Params:
+            polygon (ndarray): M×3 vertices of the polygon, in order.
+            resolution (int): number of subdivisions of each side of the triangles.
+
+        Returns:
+            A tuple with the V×3 mesh vertices and the T×3 vertex indexes of its triangles.
 
-class Plot:
+        Raises:
+            ValueError if resolution is not positive.
+    """
+    if resolution <= 0:
+        raise ValueError('resolution must be positive')
+    steps = [(i, j) for i in range(resolution + 1) for j in range(resolution + 1 - i)]
+    position = {step: k for k, step in enumerate(steps)}
+    template = []
+    for i, j in steps:
+        if i + j < resolution:
+            template.append((position[i, j], position[i + 1, j], position[i, j + 1]))
+        if i + j < resolution - 1:
+            template.append((position[i + 1, j], position[i + 1, j + 1], position[i, j + 1]))
+    weights = np.array(steps, dtype=float) / resolution
+    center = polygon.mean(axis=0)
+    first, second = polygon, np.roll(polygon, -1, axis=0)
+    # every fan triangle (center, first, second) maps the barycentric template
+    vertices = (center + weights[None, :, :1] * (first - center)[:, None]
+                + weights[None, :, 1:] * (second - center)[:, None])
+    triangles = np.array(template)[None] + len(steps) * np.arange(len(polygon))[:, None, None]
+    return vertices.reshape(-1, 3), triangles.reshape(-1, 3)
+
+
+def decimate(coordinates: np.ndarray, budget: int, method: str = 'random',
+             seed: int = 0) -> np.ndarray:
+    """
+        Choose at most budget points of a batch to draw.
+
+        Params:
+            coordinates (ndarray): N×3 coordinates of the points.
+            budget (int): maximum number of points to keep.
+            method (str): random keeps a uniform sample, voxel keeps one point
+                per cell of a grid sized to the budget. Default is random
+            seed (int): seed of the random sample. Default is 0
+
+        Returns:
+            A sorted array with the indexes of the kept points.
+
+        Raises:
+            ValueError if the method is unknown or budget is not positive.
+    """
+    if method not in LOD_METHODS:
+        raise ValueError(f'method must be one of {LOD_METHODS}')
+    if budget <= 0:
+        raise ValueError('budget must be positive')
+    count = coordinates.shape[0]
+    if count <= budget:
+        return np.arange(count)
+    if method == 'voxel':
+        lower = coordinates.min(axis=0)
+        extent = coordinates.max(axis=0) - lower
+        spread = extent[extent > 0]
+        size = float((np.prod(spread) / budget) ** (1 / spread.size)) if spread.size else 1.0
+        for _ in range(8):
+            shape = np.floor(extent / size).astype(np.int64) + 1
+            cells = np.floor((coordinates - lower) / size).astype(np.int64)
+            kept = np.unique(cell_keys(np.minimum(cells, shape - 1), shape), return_index=True)[1]
+            if kept.shape[0] <= budget:
+                return np.sort(kept)
+            size *= (kept.shape[0] / budget) ** (1 / max(spread.size, 1))
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(count, budget, replace=False))
+
+
+class Plot:  # pylint: disable=too-many-instance-attributes
     """
         Plot definition, uses matplotlib.
         Only supports 3d projection for now.
@@ -21,6 +191,11 @@ class Plot:
                 name (str): name of the plot
                 projection (str): projection of the plot. Default is 3d
                 range list(float): range of the plot. Default is [0, 5]
+                budget (int): maximum number of points or vectors drawn per batch,
+                    larger batches are decimated. Default is None, draw everything
+                lod (str): decimation method, random or voxel. Default is random
+                headless (bool): draw on a figure detached from pyplot, which can
+                    only be saved, not shown. Default is False
 
             Returns:
                 A plot class instance.
@@ -33,6 +208,12 @@ class Plot:
         self.name = kwargs.get('name', 'Plot')
         self.projection = kwargs.get('projection', '3d')
         self.range = kwargs.get('range', [0, 5])
+        self.budget = kwargs.get('budget', None)
+        self.lod = kwargs.get('lod', 'random')
+        if self.lod not in LOD_METHODS:
+            raise ValueError(f'lod must be one of {LOD_METHODS}')
+        self.headless = kwargs.get('headless', False)
+        self.figure = Figure() if self.headless else plt.figure()
         self.prepare()
 
     def prepare(self):
@@ -48,7 +229,7 @@ class Plot:
             Raises:
                 None
         """
-        self.ax = plt.axes(projection=self.projection)
+        self.ax = self.figure.add_subplot(projection=self.projection)
         self.ax.set_title(self.name)
         self.ax.set_xlabel('x')
         self.ax.set_ylabel('y')
@@ -107,13 +288,70 @@ class Plot:
             raise ValueError('not point given')
         self.ax.scatter(point.x, point.y, point.z, color=color)
 
-    def add_plane(self, plane: Plane, color: str = 'black') -> None:
+    def add_points(self, points, color: str = 'black', budget: int = None) -> None:
         """
-            Add a plane to the plot.
+            Add many points to the plot as a single artist.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+                color (str): color of the points. Default is black
+                budget (int): maximum number of points drawn. Default is the plot budget
+
+            Returns:
+                None
+
+            Raises:
+                ValueError if the points are not a N×3 array
+        """
+        coordinates = as_coordinates(points)
+        budget = budget or self.budget
+        if budget:
+            coordinates = coordinates[decimate(coordinates, budget, self.lod)]
+        self.ax.scatter(coordinates[:, 0], coordinates[:, 1], coordinates[:, 2], color=color)
+
+    def add_vectors(self, vectors, origins=None, color: str = 'black', budget: int = None) -> None:
+        """
+            Add many vectors to the plot as a single artist.
+
+            Params:
+                vectors: N×3 array, VectorArray or list of vectors.
+                origins: N×3 array or list of points, or a single Point shared
+                    by every vector. Default is the origin of coordinates
+                color (str): color of the vectors. Default is black
+                budget (int): maximum number of vectors drawn. Default is the plot budget
+
+            Returns:
+                None
+
+            Raises:
+                ValueError if the sizes are not equal
+        """
+        directions = as_coordinates(vectors)
+        if origins is None:
+            origins = Point(x=0, y=0, z=0)
+        if isinstance(origins, Point):
+            starts = np.broadcast_to([origins.x, origins.y, origins.z], directions.shape)
+        else:
+            starts = as_coordinates(origins)
+        if starts.shape != directions.shape:
+            raise ValueError('Sizes must be equal')
+        budget = budget or self.budget
+        if budget:
+            # decimate on the midpoints, vectors sharing an origin share its voxel
+            kept = decimate(starts + directions / 2, budget, self.lod)
+            starts, directions = starts[kept], directions[kept]
+        self.ax.quiver(starts[:, 0], starts[:, 1], starts[:, 2],
+                       directions[:, 0], directions[:, 1], directions[:, 2], color=color)
+
+    def add_plane(self, plane: Plane, color: str = 'black', resolution: int = None) -> None:
+        """
+            Add a plane to the plot, clipped to the range of the plot.
 
             Params:
                 plane (Plane): plane to add
                 color (str): color of the plane. Default is black
+                resolution (int): draw the plane as a shaded triangle mesh with this
+                    many subdivisions per side. Default is None, a single flat polygon
 
             Returns:
                 None
@@ -126,17 +364,19 @@ class Plot:
             raise TypeError('plane must be a Plane')
         if not plane:
             raise ValueError('not plane given')
-        # point = np.array([plane.point.x, plane.point.y, plane.point.z])
-        normal = array(
-            [plane.normal.get('x'), plane.normal.get('y'), plane.normal.get('z')])
-        d = plane.d
-        xx, yy = meshgrid(range(self.range[1]), range(self.range[1]))
-        z = (-normal[0] * xx - normal[1] * yy - d) * 1. / normal[2]
-        self.ax.plot_surface(xx, yy, z, color=color)
+        polygon = clip_plane(plane.coefficients, *self.range)
+        if polygon.shape[0] == 0:
+            return
+        if resolution is None:
+            self.ax.add_collection3d(Poly3DCollection([polygon], color=color))
+            return
+        vertices, triangles = subdivide(polygon, resolution)
+        self.ax.plot_trisurf(vertices[:, 0], vertices[:, 1], vertices[:, 2],
+                             triangles=triangles, color=color, shade=True)
 
     def add_line(self, **kwargs) -> None:
         """
-            Add a line to the plot.
+            Add a line to the plot, clipped to the range of the plot.
 
             Params:
                 line (Line): line to add
@@ -146,24 +386,22 @@ class Plot:
                 None
 
             Raises:
-                ValueError if no line given
+                ValueError if no line given or its vector is null
                 TypeError if line must be a Line
-                TypeError if origin must be a Point
         """
         line = kwargs.get('line', None)
-        origin = kwargs.get('origin', Point(x=0, y=0, z=0))
         color = kwargs.get('color', 'black')
         if not line:
             raise ValueError('No line given')
         if not isinstance(line, Line):
             raise TypeError('line must be a Line')
-        if origin and not isinstance(origin, Point):
-            raise TypeError('origin must be a Point')
-        x = [origin.x, line.vector.get('x')]
-        y = [origin.y, line.vector.get('y')]
-        z = [origin.z, line.vector.get('z')]
-        #self.ax.plot(line.points, color=color)
-        self.ax.plot(x, y, z, color=color)
+        point = (line.point.x, line.point.y, line.point.z)
+        vector = (line.vector.x, line.vector.y, line.vector.z)
+        segment = clip_line(point, vector, *self.range)
+        if segment is None:
+            return
+        ends = line.at(segment)
+        self.ax.plot(ends[:, 0], ends[:, 1], ends[:, 2], color=color)
 
     def clear(self) -> None:
         """
@@ -191,8 +429,10 @@ class Plot:
                 None
 
             Raises:
-                None
+                RuntimeError if the plot is headless
         """
+        if self.headless:
+            raise RuntimeError('Cannot show a headless plot, save it instead')
         plt.show()
 
     def save(self, path: str) -> None:
@@ -208,4 +448,20 @@ class Plot:
             Raises:
                 None
         """
-        plt.savefig(path)
+        self.figure.savefig(path)
+
+    def close(self) -> None:
+        """
+            Release the figure of the plot.
+
+            Params:
+                None
+
+            Returns:
+                None
+
+            Raises:
+                None
+        """
+        if not self.headless:
+            plt.close(self.figure)
@@ -1,4 +1,5 @@
-from .vector import Vector
+from . import backend
+from .vector import Vector, quantize
 
 
 class Point:
@@ -6,9 +7,16 @@ class Point:
         Point definition
         Supported operators:
             +: add two points
-            ==: check if two points are equal
+            ==: check if two points are equal, up to the class tolerance
+        Points are hashable: two points are equal, and hash the same, when
+        their coordinates round to the same multiples of Point.tolerance.
+        Set Point.tolerance to 0 for exact comparisons.
     """
 
+    __slots__ = ('x', 'y', 'z', 'dimension')
+    axes = ('x', 'y', 'z')
+    tolerance = 1e-9
+
     def __init__(self, **kwargs):
         """
             Initialize a Point object.
@@ -25,13 +33,42 @@ class Point:
             Raises:
                 None
         """
-        if kwargs is None:
-            raise ValueError('No arguments given.')
-        self.x = kwargs.get('x', 0)
-        self.y = kwargs.get('y', 0)
-        self.z = kwargs.get('z', 0)
+        x, y, z = kwargs.get('x', 0), kwargs.get('y', 0), kwargs.get('z', 0)
+        convert = backend.current.convert
+        if convert is not None:
+            x, y, z = convert(x), convert(y), convert(z)
+        self.x = x
+        self.y = y
+        self.z = z
         self.dimension = kwargs.get('dimension', 3)
 
+    @classmethod
+    def from_xyz(cls, x: float = 0, y: float = 0, z: float = 0, dimension: int = 3) -> 'Point':
+        """
+            Create a point from positional coordinates, skipping kwargs parsing.
+
+            Params:
+                x: x coordinate
+                y: y coordinate
+                z: z coordinate
+                dimension: dimension of the point. Default is 3
+
+            Returns:
+                A point class instance.
+
+            Raises:
+                None
+        """
+        convert = backend.current.convert
+        if convert is not None:
+            x, y, z = convert(x), convert(y), convert(z)
+        point = cls.__new__(cls)
+        point.x = x
+        point.y = y
+        point.z = z
+        point.dimension = dimension
+        return point
+
     def midpoint(self, other: 'Point') -> 'Vector':
         """
             Calculate the midpoint between two points.
@@ -50,10 +87,11 @@ class Point:
             raise TypeError('other must be a Point')
         if self.dimension != other.dimension:
             raise ValueError('Dimensions must be equal')
-        x = (self.x + other.x) / 2
-        y = (self.y + other.y) / 2
-        z = (self.z + other.z) / 2
-        return Vector(x=x, y=y, z=z)
+        divide = backend.current.divide
+        x = divide(self.x + other.x, 2)
+        y = divide(self.y + other.y, 2)
+        z = divide(self.z + other.z, 2)
+        return Vector.from_xyz(x, y, z)
 
     def find_vector(self, other: 'Point') -> Vector:
         """
@@ -73,7 +111,7 @@ class Point:
             raise TypeError('other must be a Point')
         if self.dimension != other.dimension:
             raise ValueError('Dimensions must be equal')
-        return Vector(x=other.x - self.x, y=other.y - self.y, z=other.z - self.z)
+        return Vector.from_xyz(other.x - self.x, other.y - self.y, other.z - self.z)
 
     def __str__(self) -> str:
         """
@@ -87,25 +125,65 @@ class Point:
         """
         return f'Point({self.x}, {self.y}, {self.z})'
 
+    def key(self) -> tuple:
+        """
+            Get the coordinates rounded to multiples of Point.tolerance,
+            used to compare and hash points.
+
+            Params:
+                None
+
+            Returns:
+                A tuple with the rounded x, y and z.
+
+            Raises:
+                None
+        """
+        return quantize((self.x, self.y, self.z), self.tolerance)
+
+    def isclose(self, other: 'Point', tolerance: float = None) -> bool:
+        """
+            Check if the distance to another point is at most a tolerance.
+
+            Params:
+                other (Point): another point
+                tolerance (float): maximum distance. Default is Point.tolerance
+
+            Returns:
+                True if the points are close, False otherwise.
+
+            Raises:
+                TypeError if other is not a Point
+                ValueError if dimensions are not equal
+        """
+        tolerance = self.tolerance if tolerance is None else tolerance
+        return self.find_vector(other).squared_magnitude() <= tolerance ** 2
+
     def __eq__(self, other: 'Point') -> bool:
         """
-            Check if two points are equal.
+            Check if two points are equal, up to Point.tolerance.
 
             Params:
                 other (Point): another point
 
             Returns:
                 True if points are equal, False otherwise.
+                NotImplemented if other is not a Point.
 
             Raises:
-                TypeError if other is not a Point
                 ValueError if dimensions are not equal
         """
         if not isinstance(other, Point):
-            raise TypeError('other must be a Point')
+            return NotImplemented
         if self.dimension != other.dimension:
             raise ValueError('Dimensions must be equal')
-        return self.x == other.x and self.y == other.y and self.z == other.z
+        return self.key() == other.key()
+
+    def __hash__(self) -> int:
+        """
+            Hash the point from its dimension and rounded coordinates.
+        """
+        return hash((self.dimension, self.key()))
 
     def __add__(self, other: 'Point') -> Vector:
         """
@@ -125,4 +203,4 @@ class Point:
             raise TypeError('other must be a Point')
         if self.dimension != other.dimension:
             raise ValueError('Dimensions must be equal')
-        return Vector(x=self.x + other.x, y=self.y + other.y, z=self.z + other.z)
+        return Vector.from_xyz(self.x + other.x, self.y + other.y, self.z + other.z)
@@ -0,0 +1,227 @@
+import sys
+from functools import wraps
+from importlib import import_module
+from time import perf_counter
+
+# methods instrumented by default: class name, module and method names
+OPERATIONS = {
+    'Vector': ('.vector', (
+        '__add__', '__sub__', '__mul__', '__truediv__',
+        '__iadd__', '__isub__', '__imul__', '__itruediv__',
+        'add', 'sub', 'scale', 'div', 'dot',
+        'magnitude', 'cross', 'triple', 'angle', 'projection',
+    )),
+    'Point': ('.point', ('find_vector', 'midpoint')),
+    'Plane': ('.plane', ('find_d', 'find_intersection')),
+    'Plot': ('.plot', (
+        'add_vector', 'add_point', 'add_points', 'add_vectors',
+        'add_plane', 'add_line', 'save',
+    )),
+}
+
+
+class Profile:
+    """
+        Call counters and cumulative timings of algepy operations.
+        Methods are only instrumented between start and stop, by replacing
+        them on their classes with timed wrappers and putting the originals
+        back afterwards, so nothing is measured or slowed down outside.
+        Timings are inclusive: an operation calling another one, like angle
+        calling magnitude, counts the time of both.
+    """
+
+    def __init__(self, operations: dict = None):
+        """
+            Initialize a profile.
+
+            Params:
+                operations (dict): class names, Vector, Point, Plane or Plot, and
+                    the names of the methods to instrument of each one.
+                    Default is every operation in OPERATIONS of the classes
+                    already imported when the profile starts.
+
+            Returns:
+                A profile class instance.
+
+            Raises:
+                ValueError if a class is unknown.
+        """
+        self._imported_only = operations is None
+        if operations is None:
+            operations = {name: methods for name, (_, methods) in OPERATIONS.items()}
+        unknown = set(operations) - set(OPERATIONS)
+        if unknown:
+            raise ValueError(f'Unknown classes: {sorted(unknown)}')
+        self.operations = operations
+        self.calls = {}
+        self.seconds = {}
+        self._originals = []
+
+    def _instrument(self, function, name: str):
+        """
+            Wrap a function to count its calls and add up its time under name.
+        """
+        calls, seconds = self.calls, self.seconds
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                seconds[name] = seconds.get(name, 0.0) + perf_counter() - start
+                calls[name] = calls.get(name, 0) + 1
+        return wrapper
+
+    def start(self) -> 'Profile':
+        """
+            Swap the instrumented methods onto their classes.
+
+            Params:
+                None
+
+            Returns:
+                The profile itself.
+
+            Raises:
+                RuntimeError if the profile is already started.
+                AttributeError if a method does not exist.
+        """
+        if self._originals:
+            raise RuntimeError('Profile is already started')
+        try:
+            for class_name, methods in self.operations.items():
+                module = OPERATIONS[class_name][0]
+                # importing plot, and matplotlib with it, only to profile it would
+                # cost more than most jobs, the default skips classes not imported
+                if self._imported_only and __package__ + module not in sys.modules:
+                    continue
+                cls = getattr(import_module(module, __package__), class_name)
+                for method in methods:
+                    function = getattr(cls, method)
+                    # None marks methods inherited from a base class, deleted on stop
+                    self._originals.append((cls, method, cls.__dict__.get(method)))
+                    setattr(cls, method, self._instrument(function, f'{class_name}.{method}'))
+        except AttributeError:
+            self.stop()
+            raise
+        return self
+
+    def stop(self) -> 'Profile':
+        """
+            Put the original methods back on their classes.
+
+            Params:
+                None
+
+            Returns:
+                The profile itself.
+
+            Raises:
+                None
+        """
+        while self._originals:
+            cls, method, original = self._originals.pop()
+            if original is None:
+                delattr(cls, method)
+            else:
+                setattr(cls, method, original)
+        return self
+
+    @property
+    def active(self) -> bool:
+        """whether the instrumented methods are in place."""
+        return bool(self._originals)
+
+    def reset(self) -> None:
+        """
+            Clear the counters and timings.
+
+            Params:
+                None
+
+            Returns:
+                None
+
+            Raises:
+                None
+        """
+        self.calls.clear()
+        self.seconds.clear()
+
+    def stats(self) -> dict:
+        """
+            Get the counters and timings of the operations that were called.
+
+            Params:
+                None
+
+            Returns:
+                A dict from operation name to a dict with calls, seconds
+                and microseconds per call.
+
+            Raises:
+                None
+        """
+        return {
+            name: {
+                'calls': calls,
+                'seconds': self.seconds[name],
+                'us_per_call': self.seconds[name] / calls * 1e6,
+            }
+            for name, calls in self.calls.items()
+        }
+
+    def report(self, sort: str = 'seconds', limit: int = None) -> str:
+        """
+            Format the counters and timings as a table.
+
+            Params:
+                sort (str): calls, seconds or us_per_call. Default is seconds
+                limit (int): number of rows to show. Default is every operation
+
+            Returns:
+                The table as a string, the costliest operations first.
+
+            Raises:
+                ValueError if sort is not valid.
+        """
+        if sort not in ('calls', 'seconds', 'us_per_call'):
+            raise ValueError('sort must be calls, seconds or us_per_call')
+        stats = sorted(self.stats().items(), key=lambda item: item[1][sort], reverse=True)
+        rows = [['operation', 'calls', 'total ms', 'µs per call']]
+        rows += [[name, str(item['calls']), f"{item['seconds'] * 1e3:.3f}",
+                  f"{item['us_per_call']:.3f}"] for name, item in stats[:limit]]
+        widths = [max(len(row[i]) for row in rows) for i in range(4)]
+        lines = [row[0].ljust(widths[0]) + ''.join(
+            '  ' + cell.rjust(width) for cell, width in zip(row[1:], widths[1:])) for row in rows]
+        lines.insert(1, '-' * len(lines[0]))
+        return '\n'.join(lines)
+
+    def __enter__(self) -> 'Profile':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f'Profile(calls={sum(self.calls.values())})'
+
+
+def profile(operations: dict = None) -> Profile:
+    """
+        Profile algepy operations inside a with block.
+
+        Params:
+            operations (dict): class names and the names of the methods to
+                instrument of each one. Default is every operation in OPERATIONS
+                of the classes already imported when the block starts.
+
+        Returns:
+            A Profile to use as a context manager, its counters and timings
+            stay available after the block.
+
+        Raises:
+            ValueError if a class is unknown.
+    """
+    return Profile(operations)
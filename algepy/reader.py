@@ -0,0 +1,131 @@
+import os
+from itertools import islice
+
+import numpy as np
+
+BINARY_FORMATS = ('npy', 'raw')
+TEXT_FORMATS = ('csv', 'xyz')
+EXTENSIONS = {
+    '.npy': 'npy',
+    '.raw': 'raw',
+    '.bin': 'raw',
+    '.csv': 'csv',
+    '.xyz': 'xyz',
+    '.txt': 'xyz',
+    '.pts': 'xyz',
+}
+
+
+def guess_format(path: str) -> str:
+    """
+        Guess the format of a point file from its extension.
+
+        Params:
+            path (str): path of the file.
+
+        Returns:
+            The format name: npy, raw, csv or xyz.
+
+        Raises:
+            ValueError if the extension is unknown.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXTENSIONS:
+        raise ValueError(f'Unknown point file extension: {extension}')
+    return EXTENSIONS[extension]
+
+
+def memmap_points(path: str, fmt: str = None, dtype: str = 'float64') -> np.ndarray:
+    """
+        Memory-map a binary point file as a N×3 array without reading it.
+
+        Params:
+            path (str): path of the file.
+            fmt (str): npy or raw. Default is guessed from the extension.
+            dtype (str): type of the coordinates of raw files. Default is float64
+
+        Returns:
+            A read only N×3 array backed by the file.
+
+        Raises:
+            ValueError if the format is not binary or the file is not N×3.
+    """
+    fmt = fmt or guess_format(path)
+    if fmt not in BINARY_FORMATS:
+        raise ValueError(f'Format must be one of {BINARY_FORMATS}')
+    if fmt == 'npy':
+        data = np.load(path, mmap_mode='r')
+    else:
+        data = np.memmap(path, dtype=dtype, mode='r')
+        if data.shape[0] % 3:
+            raise ValueError('Raw file size is not a multiple of 3 coordinates')
+        data = data.reshape(-1, 3)
+    if data.ndim != 2 or data.shape[1] != 3:
+        raise ValueError('Points must be a N×3 array')
+    return data
+
+
+def iter_chunks(data: np.ndarray, chunk_size: int = 1000000):
+    """
+        Split a N×3 array into chunks of at most chunk_size points.
+
+        Params:
+            data (ndarray): N×3 array, memory-mapped arrays are only read chunk by chunk.
+            chunk_size (int): number of points per chunk.
+
+        Returns:
+            A generator of N×3 float arrays.
+
+        Raises:
+            ValueError if chunk_size is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be positive')
+    for start in range(0, data.shape[0], chunk_size):
+        yield np.asarray(data[start: start + chunk_size], dtype=float)
+
+
+def read_points(path: str, **kwargs):
+    """
+        Stream the points of a file as fixed-size chunks of coordinates.
+        Binary files are memory-mapped and text files are parsed chunk by chunk,
+        so only one chunk is held in memory at a time.
+
+        Params:
+            path (str): path of the file.
+            fmt (str): npy, raw, csv or xyz. Default is guessed from the extension.
+            chunk_size (int): number of points per chunk. Default is 1000000
+            dtype (str): type of the coordinates of raw files. Default is float64
+            delimiter (str): column separator of text files. Default is ',' for csv
+                and whitespace for xyz.
+            skiprows (int): number of header lines of text files. Default is 0
+            columns (tuple): columns holding x, y and z in text files. Default is (0, 1, 2)
+
+        Returns:
+            A generator of N×3 float arrays.
+
+        Raises:
+            ValueError if the format is unknown.
+    """
+    fmt = kwargs.get('fmt') or guess_format(path)
+    chunk_size = kwargs.get('chunk_size', 1000000)
+    if fmt in BINARY_FORMATS:
+        data = memmap_points(path, fmt, kwargs.get('dtype', 'float64'))
+        yield from iter_chunks(data, chunk_size)
+        return
+    if fmt not in TEXT_FORMATS:
+        raise ValueError(f'Format must be one of {BINARY_FORMATS + TEXT_FORMATS}')
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be positive')
+    delimiter = kwargs.get('delimiter', ',' if fmt == 'csv' else None)
+    columns = kwargs.get('columns', (0, 1, 2))
+    with open(path, 'r', encoding='utf-8') as file:
+        for _ in range(kwargs.get('skiprows', 0)):
+            next(file, None)
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                return
+            chunk = np.loadtxt(lines, delimiter=delimiter, usecols=columns, ndmin=2)
+            if chunk.shape[0]:
+                yield chunk
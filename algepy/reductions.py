@@ -0,0 +1,269 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from .array import VectorArray, as_coordinates
+from .reader import iter_chunks
+
+POOLS = {
+    'thread': ThreadPoolExecutor,
+    'process': ProcessPoolExecutor,
+}
+
+
+class Statistics:
+    """
+        Running statistics of a set of coordinates: count, mean, bounds,
+        comoment, total magnitude and sum of unit vectors.
+        Statistics of separate chunks are merged without keeping the
+        coordinates, so any amount of data can be reduced one chunk at a time.
+    """
+
+    def __init__(self):
+        """
+            Initialize the statistics of an empty set.
+
+            Params:
+                None
+
+            Returns:
+                A statistics class instance.
+
+            Raises:
+                None
+        """
+        self.count = 0
+        self.mean = np.zeros(3)
+        self.minimum = np.full(3, np.inf)
+        self.maximum = np.full(3, -np.inf)
+        self.comoment = np.zeros((3, 3))
+        self.magnitude = 0.0
+        self.directions = np.zeros(3)
+
+    @classmethod
+    def from_chunk(cls, chunk) -> 'Statistics':
+        """
+            Compute the statistics of a chunk of coordinates.
+
+            Params:
+                chunk: N×3 array, VectorArray or list of points or vectors.
+
+            Returns:
+                A statistics class instance.
+
+            Raises:
+                ValueError if the chunk is not a N×3 array.
+        """
+        coordinates = as_coordinates(chunk)
+        statistics = cls()
+        if coordinates.shape[0] == 0:
+            return statistics
+        statistics.count = coordinates.shape[0]
+        # reductions along the rows of the transposed copy, or as matrix
+        # products, are several times faster than along axis 0 of a N×3 array.
+        # It is always a copy, it is centred in place below
+        columns = np.array(coordinates.T, order='C')
+        statistics.minimum = columns.min(axis=1)
+        statistics.maximum = columns.max(axis=1)
+        statistics.mean = columns.sum(axis=1) / statistics.count
+        columns -= statistics.mean[:, None]
+        statistics.comoment = columns @ columns.T
+        norms = np.sqrt(np.einsum('ij,ij->i', coordinates, coordinates))
+        statistics.magnitude = float(norms.sum())
+        # null vectors have no direction and add nothing
+        inverse = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+        statistics.directions = inverse @ coordinates
+        return statistics
+
+    def merge(self, other: 'Statistics') -> 'Statistics':
+        """
+            Combine the statistics with the ones of another set, using the
+            pairwise update of Chan et al. for the mean and comoment.
+
+            Params:
+                other (Statistics): statistics of the other set.
+
+            Returns:
+                A statistics class instance of both sets together.
+
+            Raises:
+                TypeError if other is not a Statistics.
+        """
+        if not isinstance(other, Statistics):
+            raise TypeError('other must be a Statistics')
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        merged = Statistics()
+        merged.count = self.count + other.count
+        delta = other.mean - self.mean
+        merged.mean = self.mean + delta * (other.count / merged.count)
+        merged.comoment = (self.comoment + other.comoment
+                           + np.outer(delta, delta) * (self.count * other.count / merged.count))
+        merged.minimum = np.minimum(self.minimum, other.minimum)
+        merged.maximum = np.maximum(self.maximum, other.maximum)
+        merged.magnitude = self.magnitude + other.magnitude
+        merged.directions = self.directions + other.directions
+        return merged
+
+    @property
+    def total(self) -> np.ndarray:
+        """sum of the coordinates."""
+        return self.mean * self.count
+
+    @property
+    def bounds(self) -> tuple:
+        """lower and upper corners of the bounding box."""
+        return self.minimum, self.maximum
+
+    @property
+    def mean_direction(self) -> np.ndarray:
+        """unit vector of the mean direction, null vectors are left out."""
+        length = np.linalg.norm(self.directions)
+        return self.directions / length if length > 0 else np.zeros(3)
+
+    def covariance(self, ddof: int = 1) -> np.ndarray:
+        """
+            Calculate the covariance matrix of the coordinates.
+
+            Params:
+                ddof (int): delta degrees of freedom, 1 gives the sample
+                    covariance and 0 the population one. Default is 1
+
+            Returns:
+                A 3×3 array.
+
+            Raises:
+                ValueError if there are not more than ddof coordinates.
+        """
+        if self.count <= ddof:
+            raise ValueError('Not enough coordinates to calculate the covariance')
+        return self.comoment / (self.count - ddof)
+
+    def __repr__(self) -> str:
+        return f'Statistics(count={self.count})'
+
+
+def chunks(data, chunk_size: int = 1000000):
+    """
+        Split data into chunks of coordinates.
+
+        Params:
+            data: N×3 array, VectorArray, list of points or vectors, or an
+                iterable of N×3 chunks such as the one returned by read_points.
+            chunk_size (int): number of points per chunk of arrays.
+
+        Returns:
+            A generator of N×3 arrays.
+
+        Raises:
+            ValueError if chunk_size is not positive.
+    """
+    if isinstance(data, (list, tuple)) and data and hasattr(data[0], 'axes'):
+        data = as_coordinates(data)
+    if isinstance(data, (np.ndarray, VectorArray)):
+        yield from iter_chunks(as_coordinates(data), chunk_size)
+    else:
+        yield from data
+
+
+def summarize(data, **kwargs) -> Statistics:
+    """
+        Reduce data to its statistics, chunk by chunk across a pool of workers.
+        Only a few chunks per worker are read ahead, so iterables of chunks
+        bigger than the memory can be reduced.
+
+        Params:
+            data: N×3 array, VectorArray, list of points or vectors, or an
+                iterable of N×3 chunks such as the one returned by read_points.
+            chunk_size (int): number of points per chunk of arrays. Default is 1000000
+            workers (int): number of workers, 1 reduces in this thread.
+                Default is the number of CPUs
+            pool (str): thread or process. Default is thread, numpy releases
+                the GIL while it reduces a chunk.
+
+        Returns:
+            A Statistics instance.
+
+        Raises:
+            ValueError if the pool is unknown or chunk_size is not positive.
+    """
+    pool = kwargs.get('pool', 'thread')
+    if pool not in POOLS:
+        raise ValueError(f'Pool must be one of {tuple(POOLS)}')
+    workers = kwargs.get('workers') or os.cpu_count() or 1
+    statistics = Statistics()
+    parts = chunks(data, kwargs.get('chunk_size', 1000000))
+    if workers == 1:
+        for chunk in parts:
+            statistics = statistics.merge(Statistics.from_chunk(chunk))
+        return statistics
+    pending = deque()
+    with POOLS[pool](max_workers=workers) as executor:
+        for chunk in parts:
+            pending.append(executor.submit(Statistics.from_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                statistics = statistics.merge(pending.popleft().result())
+        while pending:
+            statistics = statistics.merge(pending.popleft().result())
+    return statistics
+
+
+def total(data, **kwargs) -> np.ndarray:
+    """
+        Sum of the coordinates, see summarize for the arguments.
+    """
+    return summarize(data, **kwargs).total
+
+
+def mean(data, **kwargs) -> np.ndarray:
+    """
+        Mean of the coordinates, the centroid of points, see summarize for the arguments.
+    """
+    return summarize(data, **kwargs).mean
+
+
+def minimum(data, **kwargs) -> np.ndarray:
+    """
+        Minimum of each axis, see summarize for the arguments.
+    """
+    return summarize(data, **kwargs).minimum
+
+
+def maximum(data, **kwargs) -> np.ndarray:
+    """
+        Maximum of each axis, see summarize for the arguments.
+    """
+    return summarize(data, **kwargs).maximum
+
+
+def bounds(data, **kwargs) -> tuple:
+    """
+        Lower and upper corners of the bounding box, see summarize for the arguments.
+    """
+    return summarize(data, **kwargs).bounds
+
+
+def covariance(data, ddof: int = 1, **kwargs) -> np.ndarray:
+    """
+        Covariance matrix of the coordinates, see summarize and
+        Statistics.covariance for the arguments.
+    """
+    return summarize(data, **kwargs).covariance(ddof)
+
+
+def total_magnitude(data, **kwargs) -> float:
+    """
+        Sum of the magnitudes of the vectors, see summarize for the arguments.
+    """
+    return summarize(data, **kwargs).magnitude
+
+
+def mean_direction(data, **kwargs) -> np.ndarray:
+    """
+        Unit vector of the mean direction of the vectors, see summarize for the arguments.
+    """
+    return summarize(data, **kwargs).mean_direction
@@ -0,0 +1,68 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from .plot import Plot
+
+# scene keys and the Plot method drawing each of their items
+SCENE_ITEMS = {
+    'vectors': 'add_vector',
+    'points': 'add_point',
+    'planes': 'add_plane',
+    'lines': 'add_line',
+    'point_batches': 'add_points',
+    'vector_batches': 'add_vectors',
+}
+PLOT_OPTIONS = ('name', 'projection', 'range', 'budget', 'lod')
+
+
+def render(scene: dict) -> str:
+    """
+        Render a scene description to a file on a headless plot.
+
+        Params:
+            scene (dict): description of the scene:
+                path (str): file to save the plot to.
+                name, projection, range, budget, lod: options of the Plot.
+                vectors, points, planes, lines, point_batches, vector_batches (list):
+                    keyword arguments of each add_vector, add_point, add_plane,
+                    add_line, add_points and add_vectors call.
+
+        Returns:
+            The path of the saved file.
+
+        Raises:
+            ValueError if the scene has no path or unknown keys
+    """
+    if 'path' not in scene:
+        raise ValueError('Scene must have a path')
+    unknown = set(scene) - set(SCENE_ITEMS) - set(PLOT_OPTIONS) - {'path'}
+    if unknown:
+        raise ValueError(f'Unknown scene keys: {sorted(unknown)}')
+    options = {key: scene[key] for key in PLOT_OPTIONS if key in scene}
+    plot = Plot(headless=True, **options)
+    for key, method in SCENE_ITEMS.items():
+        for item in scene.get(key, []):
+            getattr(plot, method)(**item)
+    plot.save(scene['path'])
+    return scene['path']
+
+
+def render_batch(scenes: list, processes: int = None, chunksize: int = 1) -> list:
+    """
+        Render many scene descriptions to files across a process pool.
+
+        Params:
+            scenes (list): scene descriptions, see render.
+            processes (int): number of worker processes, 1 renders in this process.
+                Default is the number of CPUs
+            chunksize (int): scenes sent to a worker at a time. Default is 1
+
+        Returns:
+            A list with the paths of the saved files, in the order of the scenes.
+
+        Raises:
+            ValueError if a scene has no path or unknown keys
+    """
+    if processes == 1:
+        return [render(scene) for scene in scenes]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(render, scenes, chunksize=chunksize))
@@ -0,0 +1,500 @@
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from .array import VectorArray, as_coefficients, as_coordinates, as_lines
+from .line import Line
+from .plane import Plane
+from .point import Point
+from .vector import Vector
+
+MAGIC = b'ALGEPYC\x00'
+VERSION = 1
+# magic, version, kind, dtype and number of columns, followed by 8 bytes per column name
+HEADER = struct.Struct('<8sH8s4sH')
+# marker, reserved and number of rows, followed by every column of the block in turn
+BLOCK = struct.Struct('<4sIQ')
+BLOCK_MARKER = b'BLCK'
+# headers and blocks start at multiples of this, so columns are aligned
+ALIGNMENT = 16
+KINDS = {
+    'vector': ('x', 'y', 'z'),
+    'point': ('x', 'y', 'z'),
+    'plane': ('a', 'b', 'c', 'd'),
+    'line': ('x', 'y', 'z', 'dx', 'dy', 'dz'),
+}
+DTYPES = ('float32', 'float64')
+
+
+def padded(size: int) -> int:
+    """
+        Round a number of bytes up to the alignment.
+    """
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def kind_of(items) -> str:
+    """
+        Guess the kind of geometry of a collection.
+
+        Params:
+            items: VectorArray or list of Vector, Point, Plane or Line instances.
+
+        Returns:
+            The kind: vector, point, plane or line.
+
+        Raises:
+            ValueError if the kind cannot be guessed.
+    """
+    if isinstance(items, VectorArray):
+        return 'vector'
+    if isinstance(items, (list, tuple)) and items:
+        for cls, kind in ((Point, 'point'), (Vector, 'vector'), (Plane, 'plane'), (Line, 'line')):
+            if isinstance(items[0], cls):
+                return kind
+    raise ValueError('Cannot guess the kind of geometry, pass kind')
+
+
+def as_rows(items, kind: str) -> np.ndarray:
+    """
+        Get the values of a collection of geometry as one row per item.
+
+        Params:
+            items: list of geometry objects, VectorArray, or N×K array-like
+                with K the number of columns of the kind.
+            kind (str): vector, point, plane or line.
+
+        Returns:
+            A N×K float array.
+
+        Raises:
+            ValueError if the kind is unknown or the values are not N×K.
+    """
+    if kind not in KINDS:
+        raise ValueError(f'Kind must be one of {tuple(KINDS)}')
+    if kind == 'plane':
+        return as_coefficients(items)
+    if kind == 'line':
+        if isinstance(items, (list, tuple)) and items and isinstance(items[0], Line):
+            return np.hstack(as_lines(lines=items))
+        data = np.asarray(items, dtype=float)
+        if data.ndim != 2 or data.shape[1] != 6:
+            raise ValueError('Lines must be a N×6 array')
+        return data
+    return as_coordinates(items)
+
+
+class ColumnWriter:
+    """
+        Writer of geometry collections to a columnar binary file.
+        The file starts with a header giving the kind of geometry, the type and
+        the names of the columns, followed by blocks of rows; every block stores
+        each column contiguously. Blocks are only added at the end, so a file can
+        be written in pieces by a streaming writer and reopened to append more.
+    """
+
+    def __init__(self, target, kind: str = None, dtype: str = 'float64', mode: str = 'w'):
+        """
+            Open a file for writing.
+
+            Params:
+                target: path of the file, or a writable binary file object.
+                kind (str): vector, point, plane or line. Default is the one of
+                    the existing file when appending.
+                dtype (str): float32 or float64. Default is float64, ignored
+                    when appending to an existing file.
+                mode (str): w to create or replace the file, a to add blocks to
+                    the end of an existing one. Default is w. File objects in
+                    a mode only get a header when they are at position 0, or
+                    always for w; pipes are taken as already started, and kind
+                    and dtype must match the ones of the stream.
+
+            Returns:
+                A column writer class instance.
+
+            Raises:
+                ValueError if the mode, kind or dtype is unknown, or the kind does
+                not match the file appended to.
+        """
+        if mode not in ('w', 'a'):
+            raise ValueError('mode must be w or a')
+        existing = None
+        if mode == 'a' and isinstance(target, (str, os.PathLike)) and os.path.exists(target) \
+                and os.path.getsize(target) > 0:
+            with ColumnReader(target) as reader:
+                existing = reader.kind, reader.dtype.name
+            if kind not in (None, existing[0]):
+                raise ValueError(f'File holds {existing[0]} values, not {kind}')
+            kind, dtype = existing
+        elif mode == 'a' and not isinstance(target, (str, os.PathLike)):
+            try:
+                started = target.tell() > 0
+            except (AttributeError, OSError):
+                started = True
+            if started:
+                existing = kind, dtype
+        if kind not in KINDS:
+            raise ValueError(f'Kind must be one of {tuple(KINDS)}')
+        if dtype not in DTYPES:
+            raise ValueError(f'dtype must be one of {DTYPES}')
+        self.kind = kind
+        self.columns = KINDS[kind]
+        self.dtype = np.dtype(dtype).newbyteorder('<')
+        self.rows = 0
+        if isinstance(target, (str, os.PathLike)):
+            self.file = open(target, mode + 'b')  # pylint: disable=consider-using-with
+            self._owned = True
+        else:
+            self.file = target
+            self._owned = False
+        if existing is None:
+            self._write_header()
+
+    def _write_header(self) -> None:
+        """
+            Write the header, padded to the alignment.
+        """
+        header = HEADER.pack(MAGIC, VERSION, self.kind.encode(),
+                             self.dtype.str[1:].encode(), len(self.columns))
+        header += b''.join(name.encode().ljust(8, b'\x00') for name in self.columns)
+        self.file.write(header.ljust(padded(len(header)), b'\x00'))
+
+    def write(self, items, block_size: int = 1000000) -> int:
+        """
+            Write a collection as one or more blocks at the end of the file.
+
+            Params:
+                items: list of geometry objects of the kind of the file,
+                    VectorArray, or N×K array-like with K the number of columns.
+                block_size (int): maximum number of rows per block. Default is 1000000
+
+            Returns:
+                The number of rows written.
+
+            Raises:
+                ValueError if the values do not match the kind or block_size
+                is not positive.
+        """
+        if block_size <= 0:
+            raise ValueError('block_size must be positive')
+        rows = as_rows(items, self.kind)
+        for start in range(0, rows.shape[0], block_size):
+            block = rows[start:start + block_size]
+            columns = np.ascontiguousarray(block.T, dtype=self.dtype)
+            self.file.write(BLOCK.pack(BLOCK_MARKER, 0, block.shape[0]))
+            self.file.write(memoryview(columns).cast('B'))
+            self.file.write(b'\x00' * (padded(columns.nbytes) - columns.nbytes))
+        self.rows += rows.shape[0]
+        self.file.flush()
+        return rows.shape[0]
+
+    def close(self) -> None:
+        """
+            Flush the file and close it if it was opened from a path.
+
+            Params:
+                None
+
+            Returns:
+                None
+
+            Raises:
+                None
+        """
+        self.file.flush()
+        if self._owned:
+            self.file.close()
+
+    def __enter__(self) -> 'ColumnWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'ColumnWriter(kind={self.kind!r}, rows={self.rows})'
+
+
+class ColumnReader:
+    """
+        Reader of a columnar binary file of geometry.
+        Files are memory-mapped and the columns are numpy arrays over the
+        mapped bytes, so opening a file only reads its block headers and
+        values are paged in when they are used.
+    """
+
+    def __init__(self, source):
+        """
+            Open a file for reading.
+
+            Params:
+                source: path of the file, or a bytes-like object holding its
+                    contents, e.g. bytes received from another process.
+
+            Returns:
+                A column reader class instance.
+
+            Raises:
+                ValueError if the source is not a column file, its version is
+                not supported or a block is truncated.
+        """
+        self._file = self._map = None
+        if isinstance(source, (str, os.PathLike)):
+            self._file = open(source, 'rb')  # pylint: disable=consider-using-with
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            source = self._map
+        self.buffer = memoryview(source).cast('B')
+        if self.buffer.nbytes < HEADER.size:
+            raise ValueError('Not an algepy column file')
+        magic, version, kind, dtype, count = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC:
+            raise ValueError('Not an algepy column file')
+        if version > VERSION:
+            raise ValueError(f'Unsupported column file version {version}')
+        self.kind = kind.rstrip(b'\x00').decode()
+        self.dtype = np.dtype('<' + dtype.rstrip(b'\x00').decode())
+        names = self.buffer[HEADER.size:HEADER.size + 8 * count].tobytes()
+        self.columns = tuple(names[i:i + 8].rstrip(b'\x00').decode()
+                             for i in range(0, 8 * count, 8))
+        self.blocks = self._scan(padded(HEADER.size + 8 * count))
+
+    def _scan(self, offset: int) -> list:
+        """
+            Find the offset of the values and the number of rows of every block.
+        """
+        blocks = []
+        while offset < self.buffer.nbytes:
+            if offset + BLOCK.size > self.buffer.nbytes:
+                raise ValueError(f'Truncated block at byte {offset}')
+            marker, _, rows = BLOCK.unpack_from(self.buffer, offset)
+            if marker != BLOCK_MARKER:
+                raise ValueError(f'Corrupted block at byte {offset}')
+            size = rows * len(self.columns) * self.dtype.itemsize
+            if offset + BLOCK.size + size > self.buffer.nbytes:
+                raise ValueError(f'Truncated block at byte {offset}')
+            blocks.append((offset + BLOCK.size, rows))
+            offset += BLOCK.size + padded(size)
+        return blocks
+
+    def __len__(self) -> int:
+        return sum(rows for _, rows in self.blocks)
+
+    def block(self, index: int) -> np.ndarray:
+        """
+            Get the values of a block without copying them.
+
+            Params:
+                index (int): index of the block.
+
+            Returns:
+                A read only K×N array, one row per column of the file.
+
+            Raises:
+                IndexError if the block does not exist.
+        """
+        offset, rows = self.blocks[index]
+        values = np.frombuffer(self.buffer, dtype=self.dtype,
+                               count=rows * len(self.columns), offset=offset)
+        return values.reshape(len(self.columns), rows)
+
+    def iter_blocks(self):
+        """
+            Iterate over the blocks without copying them.
+
+            Params:
+                None
+
+            Returns:
+                A generator of read only N×K arrays, one row per item, views
+                of the columns of each block.
+
+            Raises:
+                None
+        """
+        for index in range(len(self.blocks)):
+            yield self.block(index).T
+
+    def column(self, name: str) -> np.ndarray:
+        """
+            Get the values of a column of every block.
+
+            Params:
+                name (str): name of the column, e.g. x or d.
+
+            Returns:
+                A one dimensional array, a read only view of the file when it
+                has a single block.
+
+            Raises:
+                ValueError if the column does not exist.
+        """
+        if name not in self.columns:
+            raise ValueError(f'Column must be one of {self.columns}')
+        position = self.columns.index(name)
+        parts = [self.block(index)[position] for index in range(len(self.blocks))]
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=self.dtype)
+
+    def read(self) -> np.ndarray:
+        """
+            Get the values of every block as one row per item.
+
+            Params:
+                None
+
+            Returns:
+                A N×K array, a read only view of the file when it has a single
+                block, its rows are strided across the columns.
+
+            Raises:
+                None
+        """
+        parts = list(self.iter_blocks())
+        if len(parts) == 1:
+            return parts[0]
+        if not parts:
+            return np.empty((0, len(self.columns)), dtype=self.dtype)
+        return np.concatenate(parts)
+
+    def objects(self) -> list:
+        """
+            Create a geometry object for every row.
+
+            Params:
+                None
+
+            Returns:
+                A list of Vector, Point, Plane or Line instances.
+
+            Raises:
+                None
+        """
+        rows = self.read().tolist()
+        if self.kind == 'vector':
+            return [Vector.from_xyz(*row) for row in rows]
+        if self.kind == 'point':
+            return [Point.from_xyz(*row) for row in rows]
+        if self.kind == 'plane':
+            return [Plane.from_coefficients(*row) for row in rows]
+        return [Line(point=Point.from_xyz(*row[:3]), vector=Vector.from_xyz(*row[3:]))
+                for row in rows]
+
+    def close(self) -> None:
+        """
+            Release the file. Arrays read from it keep it mapped until they are deleted.
+
+            Params:
+                None
+
+            Returns:
+                None
+
+            Raises:
+                None
+        """
+        try:
+            self.buffer.release()
+            if self._map is not None:
+                self._map.close()
+        except BufferError:
+            pass
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> 'ColumnReader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'ColumnReader(kind={self.kind!r}, rows={len(self)}, blocks={len(self.blocks)})'
+
+
+def write(path: str, items, **kwargs) -> int:
+    """
+        Write a collection of geometry to a new columnar binary file.
+
+        Params:
+            path (str): path of the file, replaced if it exists.
+            items: list of Vector, Point, Plane or Line instances, VectorArray,
+                or N×K array-like with K the number of columns of the kind.
+            kind (str): vector, point, plane or line. Default is guessed from the items
+            dtype (str): float32 or float64. Default is float64
+            block_size (int): maximum number of rows per block. Default is 1000000
+
+        Returns:
+            The number of rows written.
+
+        Raises:
+            ValueError if the kind cannot be guessed or the values do not match it.
+    """
+    kind = kwargs.get('kind') or kind_of(items)
+    with ColumnWriter(path, kind, kwargs.get('dtype', 'float64')) as writer:
+        return writer.write(items, kwargs.get('block_size', 1000000))
+
+
+def append(path: str, items, **kwargs) -> int:
+    """
+        Add a collection of geometry to the end of a columnar binary file,
+        creating it if it does not exist.
+
+        Params:
+            path (str): path of the file.
+            items: list of geometry objects, VectorArray, or N×K array-like.
+            kind (str): vector, point, plane or line. Default is the one of the
+                file, or guessed from the items for a new file.
+            dtype (str): float32 or float64 of a new file. Default is float64
+            block_size (int): maximum number of rows per block. Default is 1000000
+
+        Returns:
+            The number of rows written.
+
+        Raises:
+            ValueError if the kind does not match the file or the values do not match it.
+    """
+    kind = kwargs.get('kind')
+    objects = isinstance(items, (list, tuple)) and items \
+        and isinstance(items[0], (Vector, Point, Plane, Line))
+    # arrays take the kind of the file, objects must match it
+    if kind is None and (objects or not (os.path.exists(path) and os.path.getsize(path) > 0)):
+        kind = kind_of(items)
+    with ColumnWriter(path, kind, kwargs.get('dtype', 'float64'), mode='a') as writer:
+        return writer.write(items, kwargs.get('block_size', 1000000))
+
+
+def read(source) -> np.ndarray:
+    """
+        Read the values of a columnar binary file as one row per item.
+
+        Params:
+            source: path of the file or a bytes-like object with its contents.
+
+        Returns:
+            A N×K array, a read only view of the mapped file when it has a single block.
+
+        Raises:
+            ValueError if the source is not a column file.
+    """
+    with ColumnReader(source) as reader:
+        return reader.read()
+
+
+def read_objects(source) -> list:
+    """
+        Read a columnar binary file as geometry objects.
+
+        Params:
+            source: path of the file or a bytes-like object with its contents.
+
+        Returns:
+            A list of Vector, Point, Plane or Line instances.
+
+        Raises:
+            ValueError if the source is not a column file.
+    """
+    with ColumnReader(source) as reader:
+        return reader.objects()
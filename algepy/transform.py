@@ -0,0 +1,264 @@
+import math
+
+import numpy as np
+
+from .vector import Vector
+from .point import Point
+from .line import Line
+from .plane import Plane
+from .array import VectorArray, as_coordinates, as_coefficients
+
+
+class Transform:
+    """
+        Affine transform stored as a 4×4 matrix.
+        Supported operators:
+            @: compose two transforms, the right one is applied first
+    """
+
+    def __init__(self, matrix=None):
+        """
+            Initialize a transform.
+
+            Params:
+                matrix: 4×4 array-like with the affine matrix. Default is the identity.
+
+            Returns:
+                A transform class instance.
+
+            Raises:
+                ValueError if matrix is not 4×4.
+        """
+        matrix = np.eye(4) if matrix is None else np.array(matrix, dtype=float)
+        if matrix.shape != (4, 4):
+            raise ValueError('Matrix must be 4×4')
+        self.matrix = matrix
+
+    @classmethod
+    def translation(cls, offset: Vector) -> 'Transform':
+        """
+            Create a translation.
+
+            Params:
+                offset (Vector): vector to move by.
+
+            Returns:
+                A transform class instance.
+
+            Raises:
+                None
+        """
+        matrix = np.eye(4)
+        matrix[:3, 3] = offset.x, offset.y, offset.z
+        return cls(matrix)
+
+    @classmethod
+    def scaling(cls, x: float, y: float = None, z: float = None) -> 'Transform':
+        """
+            Create a scaling about the origin.
+
+            Params:
+                x (float): factor of the x axis, or of every axis when y and z are not given.
+                y (float): factor of the y axis.
+                z (float): factor of the z axis.
+
+            Returns:
+                A transform class instance.
+
+            Raises:
+                None
+        """
+        y = x if y is None else y
+        z = x if z is None else z
+        return cls(np.diag([x, y, z, 1.0]))
+
+    @classmethod
+    def rotation(cls, axis: Vector, angle: float, degrees: bool = False) -> 'Transform':
+        """
+            Create a rotation about an axis through the origin, counterclockwise
+            when looking from the tip of the axis.
+
+            Params:
+                axis (Vector): direction of the axis of rotation.
+                angle (float): angle of rotation.
+                degrees (bool): if True, the angle is in degrees.
+
+            Returns:
+                A transform class instance.
+
+            Raises:
+                ValueError if the axis is null.
+        """
+        if axis.isnull():
+            raise ValueError('Cannot rotate about a null vector')
+        angle = math.radians(angle) if degrees else angle
+        x, y, z = (float(value) / axis.magnitude() for value in (axis.x, axis.y, axis.z))
+        cross = np.array([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+        matrix = np.eye(4)
+        # Rodrigues' rotation formula
+        matrix[:3, :3] += math.sin(angle) * cross + (1 - math.cos(angle)) * (cross @ cross)
+        return cls(matrix)
+
+    @classmethod
+    def align(cls, source: Vector, target: Vector) -> 'Transform':
+        """
+            Create the shortest rotation taking the direction of a vector to another one.
+
+            Params:
+                source (Vector): vector to rotate.
+                target (Vector): vector whose direction source should take.
+
+            Returns:
+                A transform class instance.
+
+            Raises:
+                ValueError if a vector is null.
+        """
+        angle = source.angle(target)
+        axis = source.cross(target)
+        if not axis.isnull():
+            return cls.rotation(axis, angle)
+        if angle < math.pi / 2:
+            return cls()
+        # opposite vectors: turn half a circle about any perpendicular axis
+        if abs(source.x) < abs(source.y):
+            helper = Vector.from_xyz(1, 0, 0)
+        else:
+            helper = Vector.from_xyz(0, 1, 0)
+        return cls.rotation(source.cross(helper), math.pi)
+
+    def compose(self, other: 'Transform') -> 'Transform':
+        """
+            Compose the transform with another one.
+
+            Params:
+                other (Transform): transform applied before this one.
+
+            Returns:
+                A transform applying other and then this transform.
+
+            Raises:
+                TypeError if other is not a Transform.
+        """
+        if not isinstance(other, Transform):
+            raise TypeError('other must be a Transform')
+        return Transform(self.matrix @ other.matrix)
+
+    def inverse(self) -> 'Transform':
+        """
+            Get the inverse transform.
+
+            Params:
+                None
+
+            Returns:
+                A transform undoing this one.
+
+            Raises:
+                ValueError if the transform is not invertible.
+        """
+        try:
+            return Transform(np.linalg.inv(self.matrix))
+        except np.linalg.LinAlgError as error:
+            raise ValueError('Transform is not invertible') from error
+
+    def apply_points(self, points, out: np.ndarray = None) -> np.ndarray:
+        """
+            Transform a buffer of point coordinates with one matrix product.
+
+            Params:
+                points: N×3 array, VectorArray or list of points.
+                out (ndarray): N×3 float array to store the result, it may be
+                    the input buffer itself. Default is a new array.
+
+            Returns:
+                A N×3 array with the transformed points.
+
+            Raises:
+                ValueError if the points are not a N×3 array.
+        """
+        coordinates = as_coordinates(points)
+        out = np.matmul(coordinates, self.matrix[:3, :3].T, out=out)
+        out += self.matrix[:3, 3]
+        return out
+
+    def apply_vectors(self, vectors, out: np.ndarray = None) -> np.ndarray:
+        """
+            Transform a buffer of vector coordinates, which are not translated.
+
+            Params:
+                vectors: N×3 array, VectorArray or list of vectors.
+                out (ndarray): N×3 float array to store the result. Default is a new array.
+
+            Returns:
+                A N×3 array with the transformed vectors.
+
+            Raises:
+                ValueError if the vectors are not a N×3 array.
+        """
+        return np.matmul(as_coordinates(vectors), self.matrix[:3, :3].T, out=out)
+
+    def apply_planes(self, planes) -> np.ndarray:
+        """
+            Transform a buffer of plane coefficients.
+            A point p is on the plane (a, b, c, d) when (a, b, c, d)·(p, 1) = 0, so
+            the coefficients are multiplied by the inverse matrix to keep that true.
+
+            Params:
+                planes: list of Plane instances or N×4 array of a, b, c, d coefficients.
+
+            Returns:
+                A N×4 array with the transformed coefficients.
+
+            Raises:
+                ValueError if the transform is not invertible.
+        """
+        return as_coefficients(planes) @ self.inverse().matrix
+
+    def apply(self, geometry):
+        """
+            Transform a geometry object.
+            Vectors are directions, so translations do not move them.
+
+            Params:
+                geometry: Vector, Point, Line, Plane, VectorArray or N×3 array of points.
+
+            Returns:
+                A new transformed object of the same type.
+
+            Raises:
+                TypeError if the geometry type is not supported.
+                ValueError if a plane is transformed by a non invertible transform.
+        """
+        if isinstance(geometry, Vector):
+            x, y, z = self.apply_vectors([(geometry.x, geometry.y, geometry.z)])[0].tolist()
+            return Vector.from_xyz(x, y, z, geometry.dimension)
+        if isinstance(geometry, Point):
+            x, y, z = self.apply_points([(geometry.x, geometry.y, geometry.z)])[0].tolist()
+            return Point.from_xyz(x, y, z, geometry.dimension)
+        if isinstance(geometry, Line):
+            return Line(point=self.apply(geometry.point), vector=self.apply(geometry.vector))
+        if isinstance(geometry, Plane):
+            a, b, c, d = self.apply_planes([geometry])[0].tolist()
+            normal = Vector.from_xyz(a, b, c)
+            # the point of the plane closest to the origin
+            scale = -d / normal.squared_magnitude()
+            return Plane(normal=normal, point=Point.from_xyz(a * scale, b * scale, c * scale))
+        if isinstance(geometry, VectorArray):
+            return VectorArray(self.apply_vectors(geometry))
+        if isinstance(geometry, np.ndarray):
+            return self.apply_points(geometry)
+        raise TypeError('geometry must be a Vector, Point, Line, Plane, VectorArray or array')
+
+    def __matmul__(self, other: 'Transform') -> 'Transform':
+        return self.compose(other)
+
+    def __eq__(self, other: 'Transform') -> bool:
+        if not isinstance(other, Transform):
+            return NotImplemented
+        return bool(np.allclose(self.matrix, other.matrix))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'Transform({self.matrix.tolist()})'
@@ -1,7 +1,47 @@
 import math
+from operator import attrgetter
 
+from . import backend
 
-class Vector:
+
+def _coordinate(slot: str, doc: str, numeric: bool = True) -> property:
+    """
+        Build a property over a slot that drops the cached norm when written.
+
+        Params:
+            slot (str): name of the slot holding the value.
+            doc (str): docstring of the property.
+            numeric (bool): convert written values with the numeric backend.
+
+        Returns:
+            A property instance.
+    """
+    def setter(self, value):
+        convert = backend.current.convert
+        if numeric and convert is not None:
+            value = convert(value)
+        setattr(self, slot, value)
+        self._norm = None  # pylint: disable=protected-access
+    return property(attrgetter(slot), setter, doc=doc)
+
+
+def quantize(values, tolerance: float) -> tuple:
+    """
+        Round values to the nearest multiple of a tolerance.
+
+        Params:
+            values: iterable of numbers.
+            tolerance (float): size of the rounding step, 0 keeps the exact values.
+
+        Returns:
+            A tuple with the multiples of tolerance, or the values when tolerance is 0.
+    """
+    if not tolerance:
+        return tuple(values)
+    return tuple(round(value / tolerance) for value in values)
+
+
+class Vector:  # pylint: disable=too-many-public-methods
     """
         Vector definition
         Supported operators:
@@ -9,9 +49,23 @@ class Vector:
             -: subtract two vectors
             *: scalar multiplication
             /: scalar division
-            ==: check if two vectors are equal
+            +=, -=, *=, /=: same operations in place, without allocating
+            ==: check if two vectors are equal, up to the class tolerance
+        Vectors are hashable: two vectors are equal, and hash the same, when
+        their coordinates round to the same multiples of Vector.tolerance.
+        Set Vector.tolerance to 0 for exact comparisons. Mutating a vector
+        used as a dict key or set member changes its hash.
     """
 
+    __slots__ = ('_x', '_y', '_z', '_dimension', '_norm')
+    axes = ('x', 'y', 'z')
+    tolerance = 1e-9
+
+    x = _coordinate('_x', 'x coordinate')
+    y = _coordinate('_y', 'y coordinate')
+    z = _coordinate('_z', 'z coordinate')
+    dimension = _coordinate('_dimension', 'dimension of the vector', numeric=False)
+
     def __init__(self, **kwargs):
         """Initialize a vector with x, y and z coordinates.
 
@@ -25,12 +79,43 @@ class Vector:
             Raises:
                 None
         """
-        if kwargs is None:
-            self.null()
-        else:
-            self.axes = ['x', 'y', 'z']
-            self.dimension = kwargs.get('dimension', 3)
-            self.check_axes(kwargs)
+        x, y, z = kwargs.get('x', 0), kwargs.get('y', 0), kwargs.get('z', 0)
+        convert = backend.current.convert
+        if convert is not None:
+            x, y, z = convert(x), convert(y), convert(z)
+        self._x = x
+        self._y = y
+        self._z = z
+        self._dimension = kwargs.get('dimension', 3)
+        self._norm = None
+
+    @classmethod
+    def from_xyz(cls, x: float = 0, y: float = 0, z: float = 0, dimension: int = 3) -> 'Vector':
+        """
+            Create a vector from positional coordinates, skipping kwargs parsing.
+
+            Params:
+                x: x coordinate
+                y: y coordinate
+                z: z coordinate
+                dimension: dimension of the vector. Default is 3
+
+            Returns:
+                A vector class instance.
+
+            Raises:
+                None
+        """
+        convert = backend.current.convert
+        if convert is not None:
+            x, y, z = convert(x), convert(y), convert(z)
+        vec = cls.__new__(cls)
+        vec._x = x
+        vec._y = y
+        vec._z = z
+        vec._dimension = dimension
+        vec._norm = None
+        return vec
 
     def check_axes(self, kwargs: dict) -> None:
         """
@@ -84,6 +169,7 @@ class Vector:
     def magnitude(self) -> float:
         """
             Calculate the magnitude of the vector.
+            The result is cached until a coordinate changes.
 
             Params:
                 None
@@ -94,10 +180,31 @@ class Vector:
             Raises:
                 None
         """
+        norm = self._norm
+        if norm is None:
+            _sum = self.squared_magnitude()
+            norm = self._norm = backend.current.sqrt(_sum) if _sum > 0 else 0
+        return norm
+
+    def squared_magnitude(self) -> float:
+        """
+            Calculate the squared magnitude of the vector, without a square root.
+
+            Params:
+                None
+
+            Returns:
+                Squared magnitude of the vector as a float.
+
+            Raises:
+                None
+        """
+        if self._dimension == 3:
+            return self._x ** 2 + self._y ** 2 + self._z ** 2
         _sum = 0
-        for axis in self.axes[0: self.dimension]:
+        for axis in self.axes[0: self._dimension]:
             _sum += getattr(self, axis) ** 2
-        return math.sqrt(_sum) if _sum > 0 else 0
+        return _sum
 
     def midpoint(self) -> 'Vector':
         """
@@ -132,7 +239,7 @@ class Vector:
         if self.isnull():
             raise ValueError('Cannot calculate opposite with null vector')
         x, y, z = -self.get('x'), -self.get('y'), -self.get('z')
-        return Vector(x=x, y=y, z=z, dimension=self.dimension)
+        return Vector.from_xyz(x, y, z, self.dimension)
 
     def isnull(self) -> bool:
         """
@@ -147,7 +254,10 @@ class Vector:
             Raises:
                 None
         """
-        return self.magnitude() >= 0 and self.magnitude() == 0
+        norm = self._norm
+        if norm is not None:
+            return norm == 0
+        return self.squared_magnitude() == 0
 
     def direction_cosine(self, axis: str, degrees: bool = False, decimals: int = 2) -> float:
         """
@@ -187,7 +297,7 @@ class Vector:
             raise ValueError('Dimensions must be equal')
         if other.isnull() or self.isnull():
             raise ValueError('Cannot calculate perpendicular with null vector')
-        return self * other == 0
+        return self.dot(other) == 0
 
     def angle(self, other: 'Vector', degrees: bool = False, decimals: int = 2) -> float:
         """
@@ -206,10 +316,10 @@ class Vector:
         """
         if self.dimension != other.dimension:
             raise ValueError('Dimensions must be equal')
-        if other.isnull() or self.isnull():
+        magnitudes = self.magnitude() * other.magnitude()
+        if magnitudes == 0:
             raise ValueError('Cannot calculate angle with null vector')
-        radians = math.acos(
-            self * other / (self.magnitude() * other.magnitude()))
+        radians = math.acos(self.dot(other) / magnitudes)
         return math.degrees(radians).__round__(decimals) if degrees else radians
 
     def projection(self, other: 'Vector') -> ['self->other', 'other->self']:
@@ -229,11 +339,11 @@ class Vector:
         """
         if self.dimension != other.dimension:
             raise ValueError('Dimensions must be equal')
-        if other.isnull() or self.isnull():
+        other_magnitude = other.squared_magnitude()
+        if other_magnitude == 0 or self.isnull():
             raise ValueError('Cannot calculate proyection with null vector')
-        product_scalar = self * other
-        other_magnitude = other.magnitude() ** 2
-        projection_magnitude = product_scalar / other_magnitude
+        product_scalar = self.dot(other)
+        projection_magnitude = backend.current.divide(product_scalar, other_magnitude)
         projection = other * projection_magnitude
         return projection, self - projection
 
@@ -254,10 +364,16 @@ class Vector:
             raise ValueError('Dimensions must be equal')
         if other.isnull() or self.isnull():
             raise ValueError('Cannot calculate cross product with null vector')
-        x = self.get('y') * other.get('z') - self.get('z') * other.get('y')
-        y = self.get('x') * other.get('z') - self.get('z') * other.get('x')
-        z = self.get('x') * other.get('y') - self.get('y') * other.get('x')
-        return Vector(x=x, y=-y, z=z, dimension=self.dimension)
+        return self._cross(other)
+
+    def _cross(self, other: 'Vector') -> 'Vector':
+        """
+            Cross product without validating the operands.
+        """
+        x = self._y * other._z - self._z * other._y
+        y = self._x * other._z - self._z * other._x
+        z = self._x * other._y - self._y * other._x
+        return Vector.from_xyz(x, -y, z, self._dimension)
 
     def triple(self, other: 'Vector', third: 'Vector') -> float:
         """
@@ -278,28 +394,199 @@ class Vector:
         if other.isnull() or self.isnull() or third.isnull():
             raise ValueError(
                 'Cannot calculate triple product with null vector')
-        cross = other.cross(third)
-        return self * cross
+        return self.dot(other._cross(third))  # pylint: disable=protected-access
+
+    def dot(self, other: 'Vector') -> float:
+        """
+            Calculate the dot product with the other vector.
+
+            Params:
+                other (Vector): other vector to calculate the dot product.
+
+            Returns:
+                Dot product of the vectors as a float.
+
+            Raises:
+                ValueError if the dimensions are not equal.
+        """
+        # the coordinate slots of the other vector skip the property lookups
+        # pylint: disable=protected-access
+        if self._dimension != other._dimension:
+            raise ValueError('Dimensions must be equal')
+        return self._x * other._x + self._y * other._y + self._z * other._z
+
+    def add(self, other: 'Vector', out: 'Vector' = None) -> 'Vector':
+        """
+            Add two vectors, optionally writing the result into an existing vector.
+
+            Params:
+                other (Vector): other vector to add.
+                out (Vector): vector to store the result. Default is a new vector.
+
+            Returns:
+                The vector with the sum of the two vectors.
+
+            Raises:
+                ValueError if the dimensions are not equal.
+        """
+        # pylint: disable=protected-access
+        if self._dimension != other._dimension:
+            raise ValueError('Dimensions must be equal')
+        x, y, z = self._x + other._x, self._y + other._y, self._z + other._z
+        if out is None:
+            return Vector.from_xyz(x, y, z, self._dimension)
+        return out.set_xyz(x, y, z, self._dimension)
+
+    def sub(self, other: 'Vector', out: 'Vector' = None) -> 'Vector':
+        """
+            Subtract two vectors, optionally writing the result into an existing vector.
+
+            Params:
+                other (Vector): other vector to subtract.
+                out (Vector): vector to store the result. Default is a new vector.
+
+            Returns:
+                The vector with the difference of the two vectors.
+
+            Raises:
+                ValueError if the dimensions are not equal.
+        """
+        # pylint: disable=protected-access
+        if self._dimension != other._dimension:
+            raise ValueError('Dimensions must be equal')
+        x, y, z = self._x - other._x, self._y - other._y, self._z - other._z
+        if out is None:
+            return Vector.from_xyz(x, y, z, self._dimension)
+        return out.set_xyz(x, y, z, self._dimension)
+
+    def scale(self, scalar: float, out: 'Vector' = None) -> 'Vector':
+        """
+            Multiply the vector by a scalar, optionally writing the result into an existing vector.
+
+            Params:
+                scalar (float): scalar to multiply.
+                out (Vector): vector to store the result. Default is a new vector.
+
+            Returns:
+                The vector multiplied by the scalar.
+
+            Raises:
+                None
+        """
+        x, y, z = self._x * scalar, self._y * scalar, self._z * scalar
+        if out is None:
+            return Vector.from_xyz(x, y, z, self._dimension)
+        return out.set_xyz(x, y, z, self._dimension)
+
+    def div(self, scalar: float, out: 'Vector' = None) -> 'Vector':
+        """
+            Divide the vector by a scalar, optionally writing the result into an existing vector.
+
+            Params:
+                scalar (float): scalar to divide.
+                out (Vector): vector to store the result. Default is a new vector.
+
+            Returns:
+                The vector divided by the scalar.
+
+            Raises:
+                ZeroDivisionError if the scalar is 0.
+        """
+        divide = backend.current.divide
+        x, y, z = divide(self._x, scalar), divide(self._y, scalar), divide(self._z, scalar)
+        if out is None:
+            return Vector.from_xyz(x, y, z, self._dimension)
+        return out.set_xyz(x, y, z, self._dimension)
+
+    def set_xyz(self, x: float, y: float, z: float, dimension: int = 3) -> 'Vector':
+        """
+            Overwrite the coordinates of the vector in place.
+
+            Params:
+                x: x coordinate
+                y: y coordinate
+                z: z coordinate
+                dimension: dimension of the vector. Default is 3
+
+            Returns:
+                The same vector, updated.
+
+            Raises:
+                None
+        """
+        convert = backend.current.convert
+        if convert is not None:
+            x, y, z = convert(x), convert(y), convert(z)
+        self._x = x
+        self._y = y
+        self._z = z
+        self._dimension = dimension
+        self._norm = None
+        return self
+
+    def key(self) -> tuple:
+        """
+            Get the coordinates rounded to multiples of Vector.tolerance,
+            used to compare and hash vectors.
+
+            Params:
+                None
+
+            Returns:
+                A tuple with a value per axis of the vector.
+
+            Raises:
+                None
+        """
+        return quantize((self._x, self._y, self._z)[0: self._dimension], self.tolerance)
+
+    def isclose(self, other: 'Vector', tolerance: float = None) -> bool:
+        """
+            Check if the distance to the other vector is at most a tolerance.
+
+            Params:
+                other (Vector): other vector to check.
+                tolerance (float): maximum distance. Default is Vector.tolerance
+
+            Returns:
+                True if the vectors are close, False otherwise.
+
+            Raises:
+                ValueError if the dimensions are not equal.
+        """
+        if self.dimension != other.dimension:
+            raise ValueError('Dimensions must be equal')
+        tolerance = self.tolerance if tolerance is None else tolerance
+        _sum = 0
+        for axis in self.axes[0: self._dimension]:
+            _sum += (getattr(self, axis) - getattr(other, axis)) ** 2
+        return _sum <= tolerance ** 2
 
     def __eq__(self, other: 'Vector') -> bool:
         """
-            Check if the vectors are equal.
+            Check if the vectors are equal, up to Vector.tolerance.
 
             Params:
                 other: other vector to check.
 
             Returns:
                 True if the vectors are equal, False otherwise.
+                NotImplemented if other is not a Vector.
 
             Raises:
                 ValueError if the dimensions are not equal.
         """
-        if self.dimension != other.dimension:
+        if not isinstance(other, Vector):
+            return NotImplemented
+        if self._dimension != other._dimension:
             raise ValueError('Dimensions must be equal')
-        for axis in self.axes[0: self.dimension]:
-            if getattr(self, axis) != getattr(other, axis):
-                return False
-        return True
+        return self.key() == other.key()
+
+    def __hash__(self) -> int:
+        """
+            Hash the vector from its dimension and rounded coordinates.
+        """
+        return hash((self._dimension, self.key()))
 
     def __str__(self) -> str:
         """
@@ -347,12 +634,22 @@ class Vector:
             Raises:
                 ValueError if the dimensions are not equal.
         """
-        if self.dimension != other.dimension:
-            raise ValueError('Dimensions must be equal')
-        vec = Vector(dimension=self.dimension)
-        for axis in self.axes[0: self.dimension]:
-            setattr(vec, axis, getattr(self, axis) + getattr(other, axis))
-        return vec
+        return self.add(other)
+
+    def __iadd__(self, other: 'Vector') -> 'Vector':
+        """
+            Add other vector in place.
+
+            Params:
+                other: other vector to add.
+
+            Returns:
+                The same vector, updated.
+
+            Raises:
+                ValueError if the dimensions are not equal.
+        """
+        return self.add(other, self)
 
     def __sub__(self, other: 'Vector') -> 'Vector':
         """
@@ -367,12 +664,22 @@ class Vector:
             Raises:
                 ValueError if the dimensions are not equal.
         """
-        if self.dimension != other.dimension:
-            raise ValueError('Dimensions must be equal')
-        vec = Vector(dimension=self.dimension)
-        for axis in self.axes[0: self.dimension]:
-            setattr(vec, axis, getattr(self, axis) - getattr(other, axis))
-        return vec
+        return self.sub(other)
+
+    def __isub__(self, other: 'Vector') -> 'Vector':
+        """
+            Subtract other vector in place.
+
+            Params:
+                other: other vector to subtract.
+
+            Returns:
+                The same vector, updated.
+
+            Raises:
+                ValueError if the dimensions are not equal.
+        """
+        return self.sub(other, self)
 
     def __mul__(self, other: 'Vector' or float) -> 'Vector':
         """
@@ -388,18 +695,26 @@ class Vector:
                 ValueError if the dimensions are not equal.
         """
         if isinstance(other, Vector):
-            if self.dimension != other.dimension:
-                raise ValueError('Dimensions must be equal')
-            if other.isnull() or self.isnull():
-                return x
-            x = self.get('x') * other.get('x')
-            y = self.get('y') * other.get('y')
-            z = self.get('z') * other.get('z')
-            return x + y + z
-        vec = Vector(dimension=self.dimension)
-        for axis in self.axes[0: self.dimension]:
-            setattr(vec, axis, getattr(self, axis) * other)
-        return vec
+            return self.dot(other)
+        return self.scale(other)
+
+    def __imul__(self, scalar: float) -> 'Vector':
+        """
+            Multiply the vector by a scalar in place.
+            The dot product is not an in place operation and falls back to *.
+
+            Params:
+                scalar: scalar to multiply.
+
+            Returns:
+                The same vector, updated.
+
+            Raises:
+                None
+        """
+        if isinstance(scalar, Vector):
+            return NotImplemented
+        return self.scale(scalar, self)
 
     def __truediv__(self, scalar: float) -> 'Vector':
         """
@@ -411,7 +726,16 @@ class Vector:
             Returns:
                 A vector with the division of the vector by the scalar.
         """
-        vec = Vector(dimension=self.dimension)
-        for axis in self.axes[0: self.dimension]:
-            setattr(vec, axis, getattr(self, axis) / scalar)
-        return vec
+        return self.div(scalar)
+
+    def __itruediv__(self, scalar: float) -> 'Vector':
+        """
+            Divide the vector by a scalar in place.
+
+            Params:
+                scalar: scalar to divide.
+
+            Returns:
+                The same vector, updated.
+        """
+        return self.div(scalar, self)
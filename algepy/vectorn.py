@@ -0,0 +1,453 @@
+import math
+
+import numpy as np
+
+from .vector import Vector
+
+# VectorN mirrors the Vector API, its checks and docstrings repeat on purpose
+# pylint: disable=duplicate-code
+
+class VectorN:
+    """
+        Vector of arbitrary dimension stored in a contiguous numpy buffer.
+        It mirrors the Vector API, every operation runs over the whole
+        buffer instead of one axis at a time.
+        Supported operators:
+            +: add two vectors
+            -: subtract two vectors
+            *: scalar multiplication or dot product
+            /: scalar division
+            +=, -=, *=, /=: same operations in place, without allocating
+            ==: check if two vectors are equal
+    """
+
+    __slots__ = ('data',)
+    axes = Vector.axes
+
+    def __init__(self, values=None, **kwargs):
+        """
+            Initialize a vector with its coordinates.
+
+            Params:
+                values: iterable with the coordinates.
+                dimension: dimension of a null vector, used when no values are given.
+
+            Returns:
+                A vector class instance.
+
+            Raises:
+                ValueError if values is not one dimensional.
+        """
+        if values is None:
+            values = np.zeros(kwargs.get('dimension', 3))
+        data = np.array(values, dtype=float)
+        if data.ndim != 1:
+            raise ValueError('Values must be one dimensional')
+        self.data = data
+
+    @classmethod
+    def from_vector(cls, vector: Vector) -> 'VectorN':
+        """
+            Create a vector from a Vector.
+
+            Params:
+                vector (Vector): vector to convert.
+
+            Returns:
+                A vector class instance with the dimension of the given vector.
+
+            Raises:
+                TypeError if vector is not a Vector.
+        """
+        if not isinstance(vector, Vector):
+            raise TypeError('vector must be a Vector')
+        return cls([vector.x, vector.y, vector.z][0: vector.dimension])
+
+    def to_vector(self) -> Vector:
+        """
+            Convert the vector to a Vector.
+
+            Params:
+                None
+
+            Returns:
+                A Vector instance.
+
+            Raises:
+                ValueError if the dimension is greater than 3.
+        """
+        if self.dimension > 3:
+            raise ValueError('Dimension must be 3 or less')
+        x, y, z = self.data.tolist() + [0] * (3 - self.dimension)
+        return Vector.from_xyz(x, y, z, self.dimension)
+
+    @property
+    def dimension(self) -> int:
+        """dimension of the vector."""
+        return self.data.shape[0]
+
+    def get(self, axis) -> float:
+        """
+            Get the value of the axis.
+
+            Params:
+                axis: axis name (x, y or z) or index of the coordinate.
+
+            Returns:
+                Value of the axis as a float.
+
+            Raises:
+                ValueError if the axis is not valid.
+        """
+        if axis in self.axes:
+            axis = self.axes.index(axis)
+        if not isinstance(axis, int) or not 0 <= axis < self.dimension:
+            raise ValueError(f'Axis must be x, y, z or an index lower than {self.dimension}')
+        return float(self.data[axis])
+
+    def magnitude(self) -> float:
+        """
+            Calculate the magnitude of the vector.
+
+            Params:
+                None
+
+            Returns:
+                Magnitude of the vector as a float.
+
+            Raises:
+                None
+        """
+        return math.sqrt(self.squared_magnitude())
+
+    def squared_magnitude(self) -> float:
+        """
+            Calculate the squared magnitude of the vector, without a square root.
+
+            Params:
+                None
+
+            Returns:
+                Squared magnitude of the vector as a float.
+
+            Raises:
+                None
+        """
+        return float(np.dot(self.data, self.data))
+
+    def isnull(self) -> bool:
+        """
+            Check if the vector is null.
+
+            Params:
+                None
+
+            Returns:
+                True if the vector is null, False otherwise.
+
+            Raises:
+                None
+        """
+        return not self.data.any()
+
+    def midpoint(self) -> 'VectorN':
+        """
+            Calculate the midpoint of the vector.
+
+            Params:
+                None
+
+            Returns:
+                Midpoint of the vector as a vector.
+
+            Raises:
+                ValueError if the vector is null.
+        """
+        if self.isnull():
+            raise ValueError('Cannot calculate midpoint with null vector')
+        return self / 2
+
+    def opposite(self) -> 'VectorN':
+        """
+            Return the opposite vector.
+
+            Params:
+                None
+
+            Returns:
+                A vector with the opposite coordinates of the original vector.
+
+            Raises:
+                ValueError if the vector is null.
+        """
+        if self.isnull():
+            raise ValueError('Cannot calculate opposite with null vector')
+        return VectorN(-self.data)
+
+    def direction_cosine(self, axis, degrees: bool = False, decimals: int = 2) -> float:
+        """
+            Calculate the direction cosine of the vector.
+
+            Params:
+                axis: axis name (x, y or z) or index of the coordinate.
+                degrees (bool): if True, return the result in degrees.
+                decimals (int): number of decimals to round the result.
+
+            Returns:
+                Direction cosine of the vector as a radian or degree.
+
+            Raises:
+                ValueError if the axis is not valid.
+        """
+        radians = math.acos(self.get(axis) / self.magnitude())
+        return round(math.degrees(radians), decimals) if degrees else radians
+
+    def dot(self, other: 'VectorN') -> float:
+        """
+            Calculate the dot product with the other vector.
+
+            Params:
+                other (VectorN): other vector to calculate the dot product.
+
+            Returns:
+                Dot product of the vectors as a float.
+
+            Raises:
+                ValueError if the dimensions are not equal.
+        """
+        if self.dimension != other.dimension:
+            raise ValueError('Dimensions must be equal')
+        return float(np.dot(self.data, other.data))
+
+    def perpendicular(self, other: 'VectorN') -> bool:
+        """
+            Check if the vector is perpendicular to the other vector.
+
+            Params:
+                other (VectorN): other vector to check.
+
+            Returns:
+                True if the vector is perpendicular to the other vector, False otherwise.
+
+            Raises:
+                ValueError if the vector is null or the dimensions are not equal.
+        """
+        if self.dimension != other.dimension:
+            raise ValueError('Dimensions must be equal')
+        if other.isnull() or self.isnull():
+            raise ValueError('Cannot calculate perpendicular with null vector')
+        return self.dot(other) == 0
+
+    def angle(self, other: 'VectorN', degrees: bool = False, decimals: int = 2) -> float:
+        """
+            Calculate the angle between the vectors.
+
+            Params:
+                other (VectorN): other vector to calculate the angle.
+                degrees (bool): if True, return the result in degrees.
+                decimals (int): number of decimals to round the result.
+
+            Returns:
+                Angle between the vectors as a radian or degree.
+
+            Raises:
+                ValueError if the vector is null or the dimensions are not equal.
+        """
+        dot = self.dot(other)
+        magnitudes = self.magnitude() * other.magnitude()
+        if magnitudes == 0:
+            raise ValueError('Cannot calculate angle with null vector')
+        radians = math.acos(max(-1.0, min(1.0, dot / magnitudes)))
+        return round(math.degrees(radians), decimals) if degrees else radians
+
+    def projection(self, other: 'VectorN') -> ['self->other', 'other->self']:
+        """
+            Calculate the projection of the vector on the other vector.
+
+            Params:
+                other (VectorN): other vector to calculate the projection.
+
+            Returns:
+                A tuple with the projection:
+                    - self->other: projection of the vector on the other vector.
+                    - other->self: projection of the other vector on the vector.
+
+            Raises:
+                ValueError if the vector is null or the dimensions are not equal.
+        """
+        dot = self.dot(other)
+        other_magnitude = other.squared_magnitude()
+        if other_magnitude == 0 or self.isnull():
+            raise ValueError('Cannot calculate proyection with null vector')
+        projection = other * (dot / other_magnitude)
+        return projection, self - projection
+
+    def cross(self, other: 'VectorN') -> 'VectorN':
+        """
+            Calculate the cross product with the other vector.
+
+            Params:
+                other (VectorN): other vector to calculate the cross product.
+
+            Returns:
+                A vector with the cross product.
+
+            Raises:
+                ValueError if the vectors are null or not 3 dimensional.
+        """
+        if self.dimension != 3 or other.dimension != 3:
+            raise ValueError('Cross product is only defined for 3 dimensions')
+        if other.isnull() or self.isnull():
+            raise ValueError('Cannot calculate cross product with null vector')
+        return VectorN(np.cross(self.data, other.data))
+
+    def triple(self, other: 'VectorN', third: 'VectorN') -> float:
+        """
+            Calculate the triple product of the vectors.
+
+            Params:
+                other (VectorN): other vector to calculate the triple product.
+                third (VectorN): third vector to calculate the triple product.
+
+            Returns:
+                Triple product of the vectors as a float.
+
+            Raises:
+                ValueError if the vectors are null or not 3 dimensional.
+        """
+        if self.isnull():
+            raise ValueError('Cannot calculate triple product with null vector')
+        return self.dot(other.cross(third))
+
+    def add(self, other: 'VectorN', out: 'VectorN' = None) -> 'VectorN':
+        """
+            Add two vectors, optionally writing the result into an existing vector.
+
+            Params:
+                other (VectorN): other vector to add.
+                out (VectorN): vector to store the result. Default is a new vector.
+
+            Returns:
+                The vector with the sum of the two vectors.
+
+            Raises:
+                ValueError if the dimensions are not equal.
+        """
+        return self._apply(np.add, other.data, out, other)
+
+    def sub(self, other: 'VectorN', out: 'VectorN' = None) -> 'VectorN':
+        """
+            Subtract two vectors, optionally writing the result into an existing vector.
+
+            Params:
+                other (VectorN): other vector to subtract.
+                out (VectorN): vector to store the result. Default is a new vector.
+
+            Returns:
+                The vector with the difference of the two vectors.
+
+            Raises:
+                ValueError if the dimensions are not equal.
+        """
+        return self._apply(np.subtract, other.data, out, other)
+
+    def scale(self, scalar: float, out: 'VectorN' = None) -> 'VectorN':
+        """
+            Multiply the vector by a scalar, optionally writing the result into an existing vector.
+
+            Params:
+                scalar (float): scalar to multiply.
+                out (VectorN): vector to store the result. Default is a new vector.
+
+            Returns:
+                The vector multiplied by the scalar.
+
+            Raises:
+                None
+        """
+        return self._apply(np.multiply, scalar, out)
+
+    def div(self, scalar: float, out: 'VectorN' = None) -> 'VectorN':
+        """
+            Divide the vector by a scalar, optionally writing the result into an existing vector.
+
+            Params:
+                scalar (float): scalar to divide.
+                out (VectorN): vector to store the result. Default is a new vector.
+
+            Returns:
+                The vector divided by the scalar.
+
+            Raises:
+                ZeroDivisionError if the scalar is 0.
+        """
+        if scalar == 0:
+            raise ZeroDivisionError('division by zero')
+        return self._apply(np.divide, scalar, out)
+
+    def _apply(self, ufunc, operand, out: 'VectorN', other: 'VectorN' = None) -> 'VectorN':
+        """
+            Apply a numpy ufunc to the buffer, writing into out when given.
+        """
+        if other is not None and self.dimension != other.dimension:
+            raise ValueError('Dimensions must be equal')
+        if out is None:
+            return VectorN(ufunc(self.data, operand))
+        if out.dimension != self.dimension:
+            raise ValueError('Dimensions must be equal')
+        ufunc(self.data, operand, out=out.data)
+        return out
+
+    def __eq__(self, other: 'VectorN') -> bool:
+        """
+            Check if the vectors are equal.
+
+            Params:
+                other: other vector to check.
+
+            Returns:
+                True if the vectors are equal, False otherwise.
+
+            Raises:
+                ValueError if the dimensions are not equal.
+        """
+        if self.dimension != other.dimension:
+            raise ValueError('Dimensions must be equal')
+        return bool(np.array_equal(self.data, other.data))
+
+    def __len__(self) -> int:
+        return self.dimension
+
+    def __str__(self) -> str:
+        return '(' + ','.join(str(value) for value in self.data.tolist()) + ')'
+
+    def __repr__(self) -> str:
+        return f'VectorN(dimension={self.dimension})'
+
+    def __add__(self, other: 'VectorN') -> 'VectorN':
+        return self.add(other)
+
+    def __iadd__(self, other: 'VectorN') -> 'VectorN':
+        return self.add(other, self)
+
+    def __sub__(self, other: 'VectorN') -> 'VectorN':
+        return self.sub(other)
+
+    def __isub__(self, other: 'VectorN') -> 'VectorN':
+        return self.sub(other, self)
+
+    def __mul__(self, other):
+        if isinstance(other, VectorN):
+            return self.dot(other)
+        return self.scale(other)
+
+    def __imul__(self, scalar: float) -> 'VectorN':
+        if isinstance(scalar, VectorN):
+            return NotImplemented
+        return self.scale(scalar, self)
+
+    def __truediv__(self, scalar: float) -> 'VectorN':
+        return self.div(scalar)
+
+    def __itruediv__(self, scalar: float) -> 'VectorN':
+        return self.div(scalar, self)
@@ -0,0 +1,48 @@
+"""
+    Throughput of Vector, Point and Plane operations for each numeric backend,
+    plus a perpendicularity check that float arithmetic gets wrong.
+"""
+from algepy import Vector, Point, Plane
+from algepy.backend import BACKENDS, use_backend
+
+from .common import per_call, table
+
+# integer coordinates, so every backend accepts them
+COORDINATES = [(3, -5, 8), (2, 7, 1), (-4, 1, 6)]
+
+
+def main():
+    rows = []
+    for name in BACKENDS:
+        with use_backend(name):
+            u, v, w = (Vector.from_xyz(*xyz) for xyz in COORDINATES)
+            point = Point.from_xyz(*COORDINATES[2])
+            u.magnitude()
+            cases = [
+                lambda: Vector.from_xyz(3, -5, 8),
+                lambda: u + v,
+                lambda: u * v,
+                lambda: u.cross(v),
+                lambda: Vector.from_xyz(3, -5, 8).magnitude(),
+                lambda: u.projection(v),
+                lambda: u.triple(v, w),
+                lambda: Plane(normal=u, point=point),
+            ]
+            row = [name] + [f'{per_call(case, 20000):.2f}' for case in cases]
+            # 0.1 * -3 is not exactly -0.3 in binary floating point
+            if name == 'integer':
+                first, second = Vector(x=10, y=1), Vector(x=3, y=-30)
+            elif name == 'native':
+                first, second = Vector(x=1, y=0.1), Vector(x=0.3, y=-3)
+            else:
+                first, second = Vector(x='1', y='0.1'), Vector(x='0.3', y='-3')
+            row.append(first.perpendicular(second))
+            rows.append(row)
+    print('µs per call, the last column checks (1, 0.1, 0) ⟂ (0.3, -3, 0), '
+          'scaled by 10 for integer')
+    print(table(['backend', 'from_xyz', '+', 'dot', 'cross', 'magnitude',
+                 'projection', 'triple', 'Plane()', 'perpendicular'], rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+    Helpers shared by the benchmark scripts.
+    Run any benchmark from the repository root, e.g.
+        python -m benchmarks.vector_memory
+"""
+import timeit
+import tracemalloc
+
+
+def rate(func, number: int = 100000, repeat: int = 5) -> float:
+    """
+        Measure how many calls per second func sustains.
+
+        Params:
+            func: callable without arguments.
+            number (int): calls per timing run.
+            repeat (int): timing runs, the best one is kept.
+
+        Returns:
+            Calls per second as a float.
+    """
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return number / best
+
+
+def per_call(func, number: int = 100000, repeat: int = 5) -> float:
+    """
+        Measure the best time per call of func in microseconds.
+
+        Params:
+            func: callable without arguments.
+            number (int): calls per timing run.
+            repeat (int): timing runs, the best one is kept.
+
+        Returns:
+            Microseconds per call as a float.
+    """
+    return 1e6 / rate(func, number, repeat)
+
+
+def allocated(factory, count: int = 100000) -> float:
+    """
+        Measure the bytes retained per object built by factory.
+
+        Params:
+            factory: callable without arguments returning a new object.
+            count (int): number of objects to keep alive while measuring.
+
+        Returns:
+            Bytes per object as a float.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list holding the objects is not part of the object cost
+    size = (after - before - objects.__sizeof__()) / count
+    del objects
+    return size
+
+
+def table(headers: list, rows: list) -> str:
+    """
+        Format rows as a plain text table.
+
+        Params:
+            headers (list): column titles.
+            rows (list): list of rows, each one a list of values.
+
+        Returns:
+            The table as a string.
+    """
+    cells = [[str(value) for value in row] for row in [headers] + rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    lines = ['  '.join(cell.ljust(width) for cell, width in zip(row, widths)) for row in cells]
+    lines.insert(1, '  '.join('-' * width for width in widths))
+    return '\n'.join(lines)
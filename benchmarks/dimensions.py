@@ -0,0 +1,34 @@
+"""
+    Cost of VectorN operations as the dimension grows.
+"""
+import numpy as np
+
+from algepy import VectorN
+
+from .common import per_call, table
+
+DIMENSIONS = [3, 64, 256, 1024, 4096]
+
+
+def main():
+    rng = np.random.default_rng(0)
+    rows = []
+    for dimension in DIMENSIONS:
+        u = VectorN(rng.normal(size=dimension))
+        v = VectorN(rng.normal(size=dimension))
+        out = VectorN(dimension=dimension)
+        rows.append([
+            dimension,
+            f'{per_call(lambda: u * v, 20000):.2f}',
+            f'{per_call(u.magnitude, 20000):.2f}',
+            f'{per_call(lambda: u.angle(v), 20000):.2f}',
+            f'{per_call(lambda: u.projection(v), 20000):.2f}',
+            f'{per_call(lambda: u + v, 20000):.2f}',
+            f'{per_call(lambda: u.add(v, out=out), 20000):.2f}',
+        ])
+    print('µs per call')
+    print(table(['dimension', 'dot', 'magnitude', 'angle', 'projection', '+', 'add(out=)'], rows))
+
+
+if __name__ == '__main__':
+    main()
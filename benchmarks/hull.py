@@ -0,0 +1,64 @@
+"""
+    Convex hulls of up to 10^6 points and mesh normals, areas and volume
+    computed over the whole face buffer against a loop of Vector.cross calls.
+    Pass the largest number of points as the first argument to go further, e.g.
+        python -m benchmarks.hull 10000000
+"""
+import sys
+import time
+
+import numpy as np
+
+from algepy.mesh import ConvexHull
+
+from .common import table
+
+
+def seconds(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def ball(size: int, rng) -> np.ndarray:
+    directions = rng.normal(size=(size, 3))
+    directions /= np.linalg.norm(directions, axis=1)[:, None]
+    return directions * rng.random(size)[:, None] ** (1 / 3)
+
+
+def python_area(mesh) -> float:
+    return sum(mesh.normal(index).magnitude() for index in range(len(mesh))) / 2
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    rng = np.random.default_rng(0)
+    rows = []
+    size = 10 ** 4
+    while size <= largest:
+        for name, points in (('cube', rng.random((size, 3))), ('ball', ball(size, rng))):
+            start = time.perf_counter()
+            hull = ConvexHull(points)
+            build = time.perf_counter() - start
+            rows.append([name, size, len(hull.vertices), len(hull), f'{build * 1e3:.0f}',
+                         f'{seconds(hull.contains, points) * 1e3:.0f}'])
+        size *= 10
+    print('convex hull of uniform points')
+    print(table(['cloud', 'points', 'vertices', 'faces', 'build ms', 'contains ms'], rows))
+
+    # every point of a sphere is on its hull, a mesh with many faces
+    directions = rng.normal(size=(50000, 3))
+    mesh = ConvexHull(directions / np.linalg.norm(directions, axis=1)[:, None])
+    rows = [
+        ['python loop Vector.cross', f'{seconds(python_area, mesh) * 1e3:.1f}'],
+        ['face_normals', f'{seconds(mesh.face_normals) * 1e3:.1f}'],
+        ['areas', f'{seconds(mesh.areas) * 1e3:.1f}'],
+        ['volume', f'{seconds(mesh.volume) * 1e3:.1f}'],
+        ['vertex_normals', f'{seconds(mesh.vertex_normals) * 1e3:.1f}'],
+    ]
+    print(f'\nmesh of {len(mesh)} faces, ms')
+    print(table(['operation', 'ms'], rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+    Import time of algepy in a fresh interpreter.
+    Exits with an error when importing the core classes pulls in numpy or
+    matplotlib, so it can guard against eager imports creeping back.
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+from .common import table
+
+RUNS = 7
+HEAVY = ('numpy', 'matplotlib')
+STATEMENTS = [
+    'import algepy',
+    'from algepy import Vector, Point, Plane, Line',
+    'from algepy import VectorArray',
+    'from algepy import Plot',
+]
+PROBE = '''
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, ','.join(name for name in {heavy!r} if name in sys.modules))
+'''
+
+
+def measure(statement: str) -> tuple:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times, loaded = [], ''
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(statement=statement, heavy=HEAVY)],
+            cwd=root, check=True, capture_output=True, text=True).stdout.split()
+        times.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else ''
+    return statistics.median(times), loaded
+
+
+def main():
+    rows, core_loaded = [], ''
+    for statement in STATEMENTS:
+        elapsed, loaded = measure(statement)
+        if statement in STATEMENTS[:2]:
+            core_loaded += loaded
+        rows.append([statement, f'{elapsed * 1e3:.1f}', loaded or '-'])
+    print(f'median of {RUNS} fresh interpreters')
+    print(table(['statement', 'ms', 'heavy modules loaded'], rows))
+    if core_loaded:
+        sys.exit('importing the core classes loaded ' + core_loaded)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+    Accumulation loop with allocating and in-place vector operators.
+    Sums a force vector over many steps and reports time per step
+    and how many Vector objects each step allocates.
+"""
+import time
+
+from algepy import Vector
+
+from .common import table
+
+STEPS = 200000
+
+
+def allocating(force: Vector) -> Vector:
+    total = Vector.from_xyz(0.0, 0.0, 0.0)
+    for _ in range(STEPS):
+        total = total + force * 0.5
+    return total
+
+
+def inplace(force: Vector) -> Vector:
+    total = Vector.from_xyz(0.0, 0.0, 0.0)
+    scaled = Vector.from_xyz()
+    for _ in range(STEPS):
+        force.scale(0.5, out=scaled)
+        total += scaled
+    return total
+
+
+def measure(func, force: Vector) -> tuple:
+    start = time.perf_counter()
+    func(force)
+    elapsed = time.perf_counter() - start
+    allocations = 0
+    original = Vector.from_xyz
+
+    def counting(*args):
+        nonlocal allocations
+        allocations += 1
+        return original(*args)
+
+    Vector.from_xyz = counting
+    try:
+        func(force)
+    finally:
+        Vector.from_xyz = original
+    return elapsed, allocations
+
+
+def main():
+    force = Vector.from_xyz(0.1, -0.2, 9.8)
+    assert allocating(force) == inplace(force)
+    rows = []
+    for name, func in [('total = total + f * 0.5', allocating),
+                       ('f.scale(0.5, out=s); total += s', inplace)]:
+        elapsed, allocations = measure(func, force)
+        rows.append([name, f'{elapsed / STEPS * 1e9:.0f}', f'{allocations / STEPS:.2f}'])
+    print(f'{STEPS} accumulation steps')
+    print(table(['loop', 'ns/step', 'vectors allocated/step'], rows))
+
+
+if __name__ == '__main__':
+    main()
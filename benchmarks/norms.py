@@ -0,0 +1,106 @@
+"""
+    Work per call of angle, projection and triple.
+    Counts the square roots each call computes and its time, for the
+    current Vector and for the previous implementation, where isnull
+    computed the magnitude twice and every check recomputed it.
+"""
+import math
+from types import SimpleNamespace
+
+import algepy.vector
+from algepy import Vector, backend
+
+from .common import per_call, table
+
+
+def legacy_magnitude(vector: Vector) -> float:
+    _sum = 0
+    for axis in vector.axes[0: vector.dimension]:
+        _sum += getattr(vector, axis) ** 2
+    return math.sqrt(_sum) if _sum > 0 else 0
+
+
+def legacy_isnull(vector: Vector) -> bool:
+    return legacy_magnitude(vector) >= 0 and legacy_magnitude(vector) == 0
+
+
+def legacy_dot(u: Vector, v: Vector) -> float:
+    if legacy_isnull(u) or legacy_isnull(v):
+        return 0
+    return u.x * v.x + u.y * v.y + u.z * v.z
+
+
+def legacy_cross(u: Vector, v: Vector) -> Vector:
+    if legacy_isnull(v) or legacy_isnull(u):
+        raise ValueError('Cannot calculate cross product with null vector')
+    return u._cross(v)  # pylint: disable=protected-access
+
+
+def legacy_angle(u: Vector, v: Vector) -> float:
+    if legacy_isnull(v) or legacy_isnull(u):
+        raise ValueError('Cannot calculate angle with null vector')
+    return math.acos(legacy_dot(u, v) / (legacy_magnitude(u) * legacy_magnitude(v)))
+
+
+def legacy_projection(u: Vector, v: Vector) -> tuple:
+    if legacy_isnull(v) or legacy_isnull(u):
+        raise ValueError('Cannot calculate proyection with null vector')
+    projection = v * (legacy_dot(u, v) / legacy_magnitude(v) ** 2)
+    return projection, u - projection
+
+
+def legacy_triple(u: Vector, v: Vector, w: Vector) -> float:
+    if legacy_isnull(v) or legacy_isnull(u) or legacy_isnull(w):
+        raise ValueError('Cannot calculate triple product with null vector')
+    return legacy_dot(u, legacy_cross(v, w))
+
+
+def sqrt_calls(func) -> int:
+    """
+        Count the square roots taken by func: math.sqrt calls in algepy and in
+        this module, and calls to the sqrt of the current backend.
+    """
+    calls = 0
+    sqrt = math.sqrt
+
+    def counting(value):
+        nonlocal calls
+        calls += 1
+        return sqrt(value)
+
+    shim = SimpleNamespace(sqrt=counting, acos=math.acos, degrees=math.degrees)
+    current = backend.current
+    originals = algepy.vector.math, globals()['math'], current.sqrt
+    algepy.vector.math = globals()['math'] = shim
+    current.sqrt = counting
+    try:
+        func()
+    finally:
+        algepy.vector.math, globals()['math'], current.sqrt = originals
+    return calls
+
+
+def main():
+    def fresh():
+        return (Vector.from_xyz(1.0, 1.0, 3.0), Vector.from_xyz(-1.0, 0.0, 4.0),
+                Vector.from_xyz(0.0, 2.0, 5.0))
+
+    u, v, _ = fresh()
+    u.angle(v)
+    cases = [
+        ('angle', lambda: legacy_angle(*fresh()[:2]), lambda: Vector.angle(*fresh()[:2])),
+        ('projection', lambda: legacy_projection(*fresh()[:2]),
+         lambda: Vector.projection(*fresh()[:2])),
+        ('triple', lambda: legacy_triple(*fresh()), lambda: Vector.triple(*fresh())),
+        ('angle, reused vectors', lambda: legacy_angle(u, v), lambda: u.angle(v)),
+    ]
+    rows = []
+    for name, legacy, current in cases:
+        rows.append([name, sqrt_calls(legacy), sqrt_calls(current),
+                     f'{per_call(legacy):.2f}', f'{per_call(current):.2f}'])
+    print('times include building the operands, reused vectors have their norms cached')
+    print(table(['operation', 'sqrt before', 'sqrt now', 'µs before', 'µs now'], rows))
+
+
+if __name__ == '__main__':
+    main()
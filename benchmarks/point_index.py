@@ -0,0 +1,84 @@
+"""
+    PointIndex against brute force nearest neighbour and radius queries.
+    Sizes go up to 10^6 points by default, pass the largest size as the
+    first argument to go further, e.g. python -m benchmarks.point_index 10000000
+"""
+import sys
+import time
+
+import numpy as np
+
+from algepy import Point
+from algepy.index import PointIndex
+
+from .common import table
+
+QUERIES = 200
+BULK_QUERIES = 10 ** 5
+
+
+def brute_nearest(points: np.ndarray, position: np.ndarray, k: int) -> np.ndarray:
+    distances = np.linalg.norm(points - position, axis=1)
+    return np.argpartition(distances, k - 1)[:k]
+
+
+def brute_within(points: np.ndarray, position: np.ndarray, radius: float) -> np.ndarray:
+    return np.flatnonzero(np.linalg.norm(points - position, axis=1) <= radius)
+
+
+def python_nearest(points: list, query: Point) -> Point:
+    return min(points, key=lambda point: query.find_vector(point).magnitude())
+
+
+def per_query(func, queries: np.ndarray) -> float:
+    start = time.perf_counter()
+    for position in queries:
+        func(position)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def per_bulk_query(func, queries: np.ndarray) -> float:
+    start = time.perf_counter()
+    func(queries)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    rng = np.random.default_rng(0)
+    queries = rng.random((QUERIES, 3))
+    bulk = rng.random((BULK_QUERIES, 3))
+    radius = 0.02
+    rows = []
+    size = 10 ** 4
+    while size <= largest:
+        points = rng.random((size, 3))
+        start = time.perf_counter()
+        index = PointIndex(points)
+        build = time.perf_counter() - start
+        python = '-'
+        if size <= 10 ** 4:
+            objects = [Point.from_xyz(*row) for row in points.tolist()]
+            python = per_query(lambda q: python_nearest(objects, Point.from_xyz(*q)), queries[:10])
+            python = f'{python:.0f}'
+        rows.append([
+            size,
+            f'{build * 1e3:.0f}',
+            python,
+            f'{per_query(lambda q: brute_nearest(points, q, 8), queries):.0f}',
+            f'{per_query(lambda q: index.nearest(q, 8), queries):.0f}',
+            f'{per_bulk_query(lambda q: index.nearest_many(q, 8), bulk):.0f}',
+            f'{per_query(lambda q: brute_within(points, q, radius), queries):.0f}',
+            f'{per_query(lambda q: index.within(q, radius), queries):.0f}',
+            f'{per_bulk_query(lambda q: index.within_many(q, radius), bulk):.0f}',
+        ])
+        size *= 10
+    print(f'uniform points in the unit cube, µs per query, radius {radius}, '
+          f'bulk columns answer {BULK_QUERIES} queries at once')
+    print(table(['points', 'build ms', 'python loop k=1', 'numpy brute k=8', 'index k=8',
+                 'index bulk k=8', 'numpy brute within', 'index within', 'index bulk within'],
+                rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+    Scaling of the chunked reductions with the number of workers.
+    Reduces 10^7 points by default, pass the number of points as the first
+    argument and the largest worker count as the second one, e.g.
+        python -m benchmarks.reductions 50000000 16
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+from algepy import Point
+from algepy.reductions import summarize
+
+from .common import table
+
+CHUNK_SIZE = 250000
+
+
+def seconds(func, *args, repeat: int = 3, **kwargs) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def python_centroid(points: list) -> Point:
+    x = y = z = 0.0
+    for point in points:
+        x, y, z = x + point.x, y + point.y, z + point.z
+    return Point.from_xyz(x / len(points), y / len(points), z / len(points))
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+    largest = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    data = np.random.default_rng(0).random((size, 3))
+    objects = [Point.from_xyz(*row) for row in data[:10 ** 5].tolist()]
+    loop = seconds(python_centroid, objects, repeat=1) * size / len(objects)
+    print(f'{size} points, {os.cpu_count()} CPUs, chunks of {CHUNK_SIZE} points')
+    print(f'python loop over Point objects, centroid only: {loop:.2f} s (extrapolated)')
+    rows = []
+    serial = {}
+    workers = 1
+    while workers <= largest:
+        row = [workers]
+        for pool in ('thread', 'process'):
+            elapsed = seconds(summarize, data, workers=workers, pool=pool, chunk_size=CHUNK_SIZE)
+            serial.setdefault(pool, elapsed)
+            row += [f'{elapsed:.3f}', f'{serial[pool] / elapsed:.2f}x']
+        rows.append(row)
+        workers *= 2
+    print('summarize: count, mean, bounds, covariance, magnitude and direction')
+    print(table(['workers', 'thread s', 'thread speedup', 'process s', 'process speedup'], rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+    Columnar binary files against text for moving points between processes.
+    Writes and reads 10^7 points by default, text formats are timed on 10^5
+    points and extrapolated. Pass the number of points as the first argument, e.g.
+        python -m benchmarks.storage 100000000
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from algepy import Point
+from algepy import storage
+
+from .common import table
+
+TEXT_SIZE = 10 ** 5
+
+
+def seconds(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def write_repr(path: str, points: list) -> None:
+    with open(path, 'w', encoding='utf-8') as file:
+        file.writelines(f'{point!r}\n' for point in points)
+
+
+def read_repr(path: str) -> list:
+    with open(path, 'r', encoding='utf-8') as file:
+        return [Point.from_xyz(*map(float, line[6:-2].split(', '))) for line in file]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+    data = np.random.default_rng(0).random((size, 3))
+    objects = [Point.from_xyz(*row) for row in data[:TEXT_SIZE].tolist()]
+    scale = size / TEXT_SIZE
+    folder = tempfile.mkdtemp()
+    paths = {name: os.path.join(folder, name) for name in ('repr', 'csv', 'agc', 'objects')}
+    rows = [
+        ['repr per Point, text', f"{seconds(write_repr, paths['repr'], objects) * scale:.2f}",
+         f"{seconds(read_repr, paths['repr']) * scale:.2f}", 'extrapolated'],
+        ['numpy csv',
+         f"{seconds(np.savetxt, paths['csv'], data[:TEXT_SIZE], delimiter=',') * scale:.2f}",
+         f"{seconds(np.loadtxt, paths['csv'], delimiter=',') * scale:.2f}", 'extrapolated'],
+        ['column file, Point objects',
+         f"{seconds(storage.write, paths['objects'], objects) * scale:.2f}",
+         f"{seconds(storage.read_objects, paths['objects']) * scale:.2f}", 'extrapolated'],
+        ['column file, array', f"{seconds(storage.write, paths['agc'], data, kind='point'):.2f}",
+         f"{seconds(storage.read, paths['agc']):.2f}", ''],
+    ]
+    with storage.ColumnReader(paths['agc']) as reader:
+        opened = seconds(storage.ColumnReader, paths['agc'])
+        column = seconds(reader.column, 'x')
+    megabytes = os.path.getsize(paths['agc']) / 2 ** 20
+    print(f'{size} points, seconds, column file of {megabytes:.0f} MiB')
+    print(table(['format', 'write s', 'read s', ''], rows))
+    print(f'opening the column file maps it without reading: {opened * 1e3:.2f} ms, '
+          f'one column: {column * 1e3:.1f} ms')
+    for path in paths.values():
+        os.remove(path)
+    os.rmdir(folder)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,347 @@
+"""
+    Benchmark suite of the core geometry operations.
+    Times every operation through its scalar path, a loop over objects, and
+    its batch path when there is one, at several sizes, and writes the results
+    as JSON so runs of different releases can be compared.
+        python -m benchmarks.suite --output results.json
+        python -m benchmarks.suite --compare baseline.json
+    Sizes are 100, 1000 and 10000 by default, see --help for the options.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import timeit
+
+import numpy as np
+
+from algepy import Vector, Point, Plane, Plot, VectorArray
+
+from .common import table
+
+CASES = []
+
+
+def case(name: str, path: str, max_size: int = None):
+    """
+        Register a benchmark case.
+
+        Params:
+            name (str): operation measured, e.g. vector.magnitude
+            path (str): scalar or batch.
+            max_size (int): largest size the case runs at. Default is None, every size
+
+        Returns:
+            A decorator for a function taking the size and a numpy random
+            generator and returning the callable to time.
+    """
+    def register(setup):
+        CASES.append({'name': name, 'path': path, 'max_size': max_size, 'setup': setup})
+        return setup
+    return register
+
+
+def vectors(size: int, rng) -> list:
+    return [Vector.from_xyz(*row) for row in (rng.random((size, 3)) + 0.1).tolist()]
+
+
+def points(size: int, rng) -> list:
+    return [Point.from_xyz(*row) for row in rng.random((size, 3)).tolist()]
+
+
+def batch(size: int, rng) -> VectorArray:
+    return VectorArray(rng.random((size, 3)) + 0.1)
+
+
+def planes(size: int, rng) -> list:
+    return [Plane(normal=normal, point=point)
+            for normal, point in zip(vectors(size, rng), points(size, rng))]
+
+
+@case('vector.construct', 'scalar')
+def vector_construct(size, rng):
+    rows = rng.random((size, 3)).tolist()
+    return lambda: [Vector(x=x, y=y, z=z) for x, y, z in rows]
+
+
+@case('vector.construct', 'batch')
+def vector_construct_batch(size, rng):
+    data = rng.random((size, 3))
+    return lambda: VectorArray(data)
+
+
+@case('vector.add', 'scalar')
+def vector_add(size, rng):
+    u, v = vectors(size, rng), vectors(size, rng)
+    return lambda: [a + b for a, b in zip(u, v)]
+
+
+@case('vector.add', 'batch')
+def vector_add_batch(size, rng):
+    u, v = batch(size, rng), batch(size, rng)
+    return lambda: u + v
+
+
+@case('vector.scale', 'scalar')
+def vector_scale(size, rng):
+    u = vectors(size, rng)
+    return lambda: [a * 2.5 for a in u]
+
+
+@case('vector.scale', 'batch')
+def vector_scale_batch(size, rng):
+    u = batch(size, rng)
+    return lambda: u * 2.5
+
+
+@case('vector.magnitude', 'scalar')
+def vector_magnitude(size, rng):
+    u = vectors(size, rng)
+    # a new vector per call, so the cached magnitude is not measured
+    return lambda: [(a + a).magnitude() for a in u]
+
+
+@case('vector.magnitude', 'batch')
+def vector_magnitude_batch(size, rng):
+    u = batch(size, rng)
+    return u.magnitude
+
+
+@case('vector.angle', 'scalar')
+def vector_angle(size, rng):
+    u, v = vectors(size, rng), vectors(size, rng)
+    return lambda: [a.angle(b) for a, b in zip(u, v)]
+
+
+@case('vector.angle', 'batch')
+def vector_angle_batch(size, rng):
+    u, v = batch(size, rng), batch(size, rng)
+    return lambda: u.angle(v)
+
+
+@case('vector.projection', 'scalar')
+def vector_projection(size, rng):
+    u, v = vectors(size, rng), vectors(size, rng)
+    return lambda: [a.projection(b) for a, b in zip(u, v)]
+
+
+@case('vector.projection', 'batch')
+def vector_projection_batch(size, rng):
+    u, v = batch(size, rng), batch(size, rng)
+    return lambda: u.projection(v)
+
+
+@case('vector.cross', 'scalar')
+def vector_cross(size, rng):
+    u, v = vectors(size, rng), vectors(size, rng)
+    return lambda: [a.cross(b) for a, b in zip(u, v)]
+
+
+@case('vector.cross', 'batch')
+def vector_cross_batch(size, rng):
+    u, v = batch(size, rng), batch(size, rng)
+    return lambda: u.cross(v)
+
+
+@case('vector.triple', 'scalar')
+def vector_triple(size, rng):
+    u, v, w = vectors(size, rng), vectors(size, rng), vectors(size, rng)
+    return lambda: [a.triple(b, c) for a, b, c in zip(u, v, w)]
+
+
+@case('vector.triple', 'batch')
+def vector_triple_batch(size, rng):
+    u, v, w = batch(size, rng), batch(size, rng), batch(size, rng)
+    return lambda: u.triple(v, w)
+
+
+@case('point.find_vector', 'scalar')
+def point_find_vector(size, rng):
+    p, q = points(size, rng), points(size, rng)
+    return lambda: [a.find_vector(b) for a, b in zip(p, q)]
+
+
+@case('point.find_vector', 'batch')
+def point_find_vector_batch(size, rng):
+    p, q = batch(size, rng), batch(size, rng)
+    return lambda: q - p
+
+
+@case('point.midpoint', 'scalar')
+def point_midpoint(size, rng):
+    p, q = points(size, rng), points(size, rng)
+    return lambda: [a.midpoint(b) for a, b in zip(p, q)]
+
+
+@case('point.midpoint', 'batch')
+def point_midpoint_batch(size, rng):
+    p, q = batch(size, rng), batch(size, rng)
+    return lambda: (p + q) / 2
+
+
+@case('plane.construct', 'scalar')
+def plane_construct(size, rng):
+    normals, origins = vectors(size, rng), points(size, rng)
+    return lambda: [Plane(normal=n, point=p) for n, p in zip(normals, origins)]
+
+
+@case('plane.find_intersection', 'scalar')
+def plane_find_intersection(size, rng):
+    items = planes(size, rng)
+    return lambda: [plane.find_intersection('x') for plane in items]
+
+
+@case('plane.signed_distance', 'batch')
+def plane_signed_distance_batch(size, rng):
+    plane, data = planes(1, rng)[0], rng.random((size, 3))
+    return lambda: plane.signed_distance(data)
+
+
+@case('plot.add_point', 'scalar', max_size=1000)
+def plot_add_point(size, rng):
+    items = points(size, rng)
+
+    def run():
+        plot = Plot(headless=True)
+        for point in items:
+            plot.add_point(point=point)
+        plot.close()
+    return run
+
+
+@case('plot.add_points', 'batch')
+def plot_add_points_batch(size, rng):
+    data = rng.random((size, 3)) * 5
+
+    def run():
+        plot = Plot(headless=True)
+        plot.add_points(data)
+        plot.close()
+    return run
+
+
+@case('plot.save', 'batch', max_size=10000)
+def plot_save_batch(size, rng):
+    data = rng.random((size, 3)) * 5
+    path = os.path.join(tempfile.mkdtemp(), 'plot.png')
+
+    def run():
+        plot = Plot(headless=True)
+        plot.add_points(data)
+        plot.save(path)
+        plot.close()
+    return run
+
+
+def measure(func, repeat: int) -> float:
+    """
+        Measure the best time of one call of func in seconds, calling it
+        enough times per run to last at least 0.2 seconds.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_cases(sizes: list, repeat: int, selected: str = '') -> list:
+    """
+        Run the cases whose name contains selected at every size.
+
+        Params:
+            sizes (list): number of items processed per call.
+            repeat (int): timing runs, the best one is kept.
+            selected (str): part of the names of the cases to run.
+
+        Returns:
+            A list of results, one dict per case and size.
+    """
+    results = []
+    for item in CASES:
+        if selected not in item['name']:
+            continue
+        for size in sizes:
+            if item['max_size'] and size > item['max_size']:
+                continue
+            seconds = measure(item['setup'](size, np.random.default_rng(0)), repeat)
+            results.append({
+                'name': item['name'],
+                'path': item['path'],
+                'size': size,
+                'seconds': seconds,
+                'us_per_item': seconds / size * 1e6,
+            })
+            print(f"{item['name']:<26} {item['path']:<7} {size:>8} {seconds * 1e3:10.3f} ms",
+                  file=sys.stderr)
+    return results
+
+
+def environment(label: str) -> dict:
+    return {
+        'label': label,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def compare(results: list, baseline: dict, threshold: float) -> list:
+    """
+        Compare results with the ones of a previous run.
+
+        Params:
+            results (list): results of this run.
+            baseline (dict): JSON output of a previous run.
+            threshold (float): ratio of times above which a case is a regression.
+
+        Returns:
+            A list of rows: name, path, size, baseline and current time, ratio and status.
+    """
+    previous = {(item['name'], item['path'], item['size']): item['seconds']
+                for item in baseline['results']}
+    rows = []
+    for item in results:
+        key = (item['name'], item['path'], item['size'])
+        if key not in previous:
+            continue
+        ratio = item['seconds'] / previous[key]
+        status = 'slower' if ratio > threshold else 'faster' if ratio < 1 / threshold else ''
+        rows.append([*key, f'{previous[key] * 1e3:.3f}', f"{item['seconds'] * 1e3:.3f}",
+                     f'{ratio:.2f}', status])
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the core geometry operations.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+                        help='items processed per call')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per case')
+    parser.add_argument('--select', default='', help='only run cases containing this text')
+    parser.add_argument('--label', default='', help='name of this run, e.g. a release')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='time ratio that counts as a regression')
+    args = parser.parse_args()
+    report = {'environment': environment(args.label),
+              'results': run_cases(args.sizes, args.repeat, args.select)}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    elif not args.compare:
+        print(json.dumps(report, indent=2))
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            rows = compare(report['results'], json.load(file), args.threshold)
+        print(table(['case', 'path', 'size', 'baseline ms', 'current ms', 'ratio', ''], rows))
+        if any(row[-1] == 'slower' for row in rows):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
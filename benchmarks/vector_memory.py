@@ -0,0 +1,47 @@
+"""
+    Per-instance memory and construction rate of Vector and Point.
+    The legacy classes reproduce the dict based layout used before
+    coordinates moved to __slots__, so both layouts can be compared.
+"""
+from algepy import Vector, Point
+
+from .common import allocated, rate, table
+
+
+class LegacyVector:
+    """Vector layout before __slots__: per-instance axes list and setattr loop."""
+
+    def __init__(self, **kwargs):
+        self.axes = ['x', 'y', 'z']
+        self.dimension = kwargs.get('dimension', 3)
+        for axis in self.axes:
+            setattr(self, axis, kwargs.get(axis, 0))
+
+
+class LegacyPoint:
+    """Point layout before __slots__."""
+
+    def __init__(self, **kwargs):
+        self.x = kwargs.get('x', 0)
+        self.y = kwargs.get('y', 0)
+        self.z = kwargs.get('z', 0)
+        self.dimension = kwargs.get('dimension', 3)
+
+
+def main():
+    cases = [
+        ('LegacyVector(x=, y=, z=)', lambda: LegacyVector(x=1.5, y=2.5, z=3.5)),
+        ('Vector(x=, y=, z=)', lambda: Vector(x=1.5, y=2.5, z=3.5)),
+        ('Vector.from_xyz(x, y, z)', lambda: Vector.from_xyz(1.5, 2.5, 3.5)),
+        ('LegacyPoint(x=, y=, z=)', lambda: LegacyPoint(x=1.5, y=2.5, z=3.5)),
+        ('Point(x=, y=, z=)', lambda: Point(x=1.5, y=2.5, z=3.5)),
+        ('Point.from_xyz(x, y, z)', lambda: Point.from_xyz(1.5, 2.5, 3.5)),
+    ]
+    rows = []
+    for name, factory in cases:
+        rows.append([name, f'{allocated(factory):.0f}', f'{rate(factory) / 1e6:.2f}'])
+    print(table(['constructor', 'bytes/instance', 'M instances/s'], rows))
+
+
+if __name__ == '__main__':
+    main()
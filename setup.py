@@ -21,7 +21,7 @@ setup(
   author_email = EMAIL,
   url = 'https://github.com/manucabral/algepy',
   keywords = ['python', 'algebra', 'math', 'geometry', 'vector', 'algepy'],
-  install_requires = ['matplotlib'],
+  install_requires = ['matplotlib', 'numpy'],
   python_requires = '>= 3.9',
   classifiers=[
     'Intended Audience :: Developers',